@@ -0,0 +1,81 @@
+"""Benchmark event-loop latency while reading many files.
+
+A heartbeat task sleeps 1 ms in a loop and records how late it wakes up
+while the loop reads files either directly (blocking) or through the
+async variants.
+
+Usage:
+    python benchmarks/bench_async_io.py --files 200 --rows 5000
+"""
+import os
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from slow_tests_demo.utils.file_operations import read_json_file, write_json_file
+from slow_tests_demo.utils.async_file_operations import read_many_async
+
+
+async def heartbeat(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def measure(load):
+    lags = []
+    stop = asyncio.Event()
+    beat = asyncio.ensure_future(heartbeat(lags, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await load()
+    seconds = time.perf_counter() - start
+    stop.set()
+    await beat
+    return seconds, lags
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--limit', type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for i in range(args.files):
+            filepath = os.path.join(tmpdir, f"file{i}.json")
+            write_json_file([{'id': j, 'name': f"Item {j}"} for j in range(args.rows)], filepath)
+            paths.append(filepath)
+
+        async def blocking():
+            for filepath in paths:
+                read_json_file(filepath)
+
+        async def concurrent():
+            await read_many_async(paths, limit=args.limit)
+
+        # Parsing holds the GIL, so a process pool keeps the loop freer still
+        processes = ProcessPoolExecutor()
+
+        async def concurrent_processes():
+            await read_many_async(paths, limit=args.limit, executor=processes)
+
+        print(f"{args.files} files x {args.rows} records")
+        print(f"{'mode':<12}{'seconds':>10}{'beats':>8}{'p50 lag ms':>12}{'max lag ms':>12}")
+        modes = [('blocking', blocking), ('async', concurrent), ('processes', concurrent_processes)]
+        for name, load in modes:
+            seconds, lags = asyncio.run(measure(load))
+            lags = lags or [0.0]
+            print(f"{name:<12}{seconds:>10.3f}{len(lags):>8}"
+                  f"{statistics.median(lags) * 1000:>12.2f}{max(lags) * 1000:>12.2f}")
+        processes.shutdown()
+
+
+if __name__ == '__main__':
+    main()
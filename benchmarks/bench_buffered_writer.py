@@ -0,0 +1,57 @@
+"""Benchmark appending small record batches with and without the buffered writer.
+
+Usage:
+    python benchmarks/bench_buffered_writer.py --batches 20000 --batch-size 5
+"""
+import os
+import csv
+import time
+import argparse
+import tempfile
+
+from slow_tests_demo.utils.buffered_writer import BufferedRecordWriter
+
+
+def append_per_batch(filepath, batches, batch_size):
+    """Open, write and close the file for every batch."""
+    for i in range(batches):
+        with open(filepath, 'a', newline='') as f:
+            csv.writer(f).writerows([[i, j, 'event'] for j in range(batch_size)])
+
+
+def buffered(filepath, batches, batch_size, fsync='never'):
+    """Queue every batch on one long-lived writer."""
+    with BufferedRecordWriter(filepath, fsync=fsync) as writer:
+        for i in range(batches):
+            writer.write_many([[i, j, 'event'] for j in range(batch_size)])
+    return writer.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--batches', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print(f"{args.batches} batches of {args.batch_size} records")
+        print(f"{'writer':<28}{'seconds':>10}{'flushes':>9}{'mean ms':>9}{'max depth':>11}")
+
+        filepath = os.path.join(tmpdir, 'per_batch.csv')
+        start = time.perf_counter()
+        append_per_batch(filepath, args.batches, args.batch_size)
+        seconds = time.perf_counter() - start
+        print(f"{'open/write/close per batch':<28}{seconds:>10.3f}{args.batches:>9}{'-':>9}{'-':>11}")
+
+        for fsync in ('never', 'flush'):
+            filepath = os.path.join(tmpdir, f'buffered_{fsync}.csv')
+            start = time.perf_counter()
+            stats = buffered(filepath, args.batches, args.batch_size, fsync=fsync)
+            seconds = time.perf_counter() - start
+            name = f"BufferedRecordWriter ({fsync})"
+            print(f"{name:<28}{seconds:>10.3f}{stats['flushes']:>9}"
+                  f"{stats['flush_seconds_mean'] * 1000:>9.2f}{stats['max_queue_depth']:>11}")
+
+
+if __name__ == '__main__':
+    main()
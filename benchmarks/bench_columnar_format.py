@@ -0,0 +1,72 @@
+"""Benchmark reloading tabular data from CSV and from the binary columnar format.
+
+Usage:
+    python benchmarks/bench_columnar_format.py --rows 1000000
+"""
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.utils.file_operations import (
+    read_csv_file, read_columnar_file, write_columnar_file
+)
+from slow_tests_demo.utils.columnar import read_csv_columns
+
+
+def make_csv(filepath, rows):
+    """Write a CSV file with integer, float and low-cardinality string columns."""
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        'id': np.arange(rows),
+        'price': rng.uniform(0, 1000, rows).round(2),
+        'quantity': rng.integers(0, 100, rows),
+        'category': rng.choice(['books', 'games', 'music', 'tools'], rows)
+    }).to_csv(filepath, index=False)
+
+
+def load_and_sum(dirpath, mmap):
+    """Load the columnar directory and touch every price value."""
+    columns = read_columnar_file(dirpath, mmap=mmap)
+    return float(columns['price'].sum())
+
+
+def timed(func, *args, **kwargs):
+    """Return the wall-clock seconds taken by a call."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = os.path.join(tmpdir, 'bench.csv')
+        cols_path = os.path.join(tmpdir, 'bench.cols')
+        make_csv(csv_path, args.rows)
+        write_columnar_file(read_csv_columns(csv_path, categorical=True), cols_path)
+
+        candidates = [
+            ('read_csv_file', read_csv_file, csv_path, {}),
+            ('read_csv_columns', read_csv_columns, csv_path, {}),
+            ('read_columnar_file', read_columnar_file, cols_path, {}),
+            ('read_columnar_file + sum', load_and_sum, cols_path, {'mmap': True}),
+            ('read_columnar (no mmap)', read_columnar_file, cols_path, {'mmap': False})
+        ]
+
+        print(f"{args.rows} rows")
+        print(f"{'reader':<26}{'seconds':>10}{'speedup':>10}")
+        baseline = None
+        for name, func, filepath, kwargs in candidates:
+            seconds = timed(func, filepath, **kwargs)
+            baseline = baseline or seconds
+            print(f"{name:<26}{seconds:>10.4f}{baseline / seconds:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
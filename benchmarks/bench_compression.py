@@ -0,0 +1,70 @@
+"""Benchmark compressed NDJSON/CSV I/O: throughput versus size.
+
+Usage:
+    python benchmarks/bench_compression.py --rows 200000
+"""
+import os
+import time
+import argparse
+import tempfile
+
+from slow_tests_demo.utils.file_operations import (
+    write_ndjson_file, read_ndjson_file, write_csv_file, read_csv_file
+)
+
+
+CODECS = [
+    ('none', '', None),
+    ('gzip-1', '.gz', 1),
+    ('gzip-6', '.gz', 6),
+    ('gzip-9', '.gz', 9),
+    ('bz2-9', '.bz2', 9),
+    ('xz-1', '.xz', 1),
+    ('xz-6', '.xz', 6)
+]
+
+
+def make_records(rows):
+    categories = ['books', 'games', 'music', 'tools']
+    return [
+        {'id': i, 'name': f"Product {i}", 'price': round(i * 0.37 % 1000, 2),
+         'category': categories[i % len(categories)]}
+        for i in range(rows)
+    ]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    records = make_records(args.rows)
+    rows = [list(records[0])] + [[str(value) for value in record.values()] for record in records]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, write, read, data, extension in [
+            ('ndjson', write_ndjson_file, read_ndjson_file, records, '.ndjson'),
+            ('csv', write_csv_file, read_csv_file, rows, '.csv')
+        ]:
+            print(f"{label}: {args.rows} rows")
+            print(f"{'codec':<10}{'MB':>10}{'ratio':>8}{'write s':>10}{'read s':>10}{'read MB/s':>12}")
+            raw_size = None
+            for name, suffix, level in CODECS:
+                filepath = os.path.join(tmpdir, 'bench' + extension + suffix)
+                write_seconds = timed(write, data, filepath, compresslevel=level)
+                read_seconds = timed(read, filepath)
+                size = os.path.getsize(filepath)
+                raw_size = raw_size or size
+                print(f"{name:<10}{size / 1e6:>10.2f}{raw_size / size:>8.1f}{write_seconds:>10.3f}"
+                      f"{read_seconds:>10.3f}{raw_size / 1e6 / read_seconds:>12.1f}")
+            print()
+
+
+if __name__ == '__main__':
+    main()
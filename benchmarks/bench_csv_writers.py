@@ -0,0 +1,62 @@
+"""Benchmark the vectorized columnar CSV writer against row-based writers.
+
+Usage:
+    python benchmarks/bench_csv_writers.py --rows 1000000
+"""
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.utils.file_operations import write_csv_file
+from slow_tests_demo.utils.columnar import write_csv_columns
+
+
+def make_columns(rows):
+    """Build integer, float and low-cardinality categorical columns."""
+    rng = np.random.default_rng(0)
+    return {
+        'id': np.arange(rows),
+        'price': rng.uniform(0, 1000, rows).round(2),
+        'quantity': rng.integers(0, 100, rows),
+        'category': pd.Categorical(rng.choice(['books', 'games', 'music', 'tools'], rows))
+    }
+
+
+def rows_then_write(columns, filepath):
+    """Build per-row lists the way callers of write_csv_file must today."""
+    headers = list(columns)
+    values = [np.asarray(column).tolist() for column in columns.values()]
+    write_csv_file([headers] + [list(row) for row in zip(*values)], filepath)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    columns = make_columns(args.rows)
+    df = pd.DataFrame(columns)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, 'bench.csv')
+        candidates = [
+            ('rows + write_csv_file', lambda: rows_then_write(columns, filepath)),
+            ('DataFrame.to_csv', lambda: df.to_csv(filepath, index=False)),
+            ('write_csv_columns', lambda: write_csv_columns(columns, filepath))
+        ]
+
+        print(f"{args.rows} rows")
+        print(f"{'writer':<24}{'seconds':>10}{'MB/s':>10}")
+        for name, func in candidates:
+            start = time.perf_counter()
+            func()
+            seconds = time.perf_counter() - start
+            size_mb = os.path.getsize(filepath) / 1e6
+            print(f"{name:<24}{seconds:>10.3f}{size_mb / seconds:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
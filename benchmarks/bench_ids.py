@@ -0,0 +1,41 @@
+"""Benchmark model id generation against uuid.uuid4.
+
+Usage:
+    python benchmarks/bench_ids.py --ids 1000000
+"""
+import time
+import uuid
+import argparse
+
+from slow_tests_demo.models.ids import UUIDv7Generator
+
+
+def uuid4_ids(count):
+    """The models' original id generation."""
+    return [str(uuid.uuid4()) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ids', type=int, default=1000000)
+    args = parser.parse_args()
+
+    generator = UUIDv7Generator()
+    candidates = [
+        ('str(uuid.uuid4())', uuid4_ids),
+        ('UUIDv7Generator.generate', lambda n: [generator.generate() for _ in range(n)]),
+        ('UUIDv7Generator.generate_many', generator.generate_many)
+    ]
+
+    print(f"{args.ids} ids")
+    print(f"{'generator':<32}{'seconds':>10}{'ids/s':>14}")
+    for name, func in candidates:
+        start = time.perf_counter()
+        ids = func(args.ids)
+        seconds = time.perf_counter() - start
+        assert len(set(ids)) == args.ids
+        print(f"{name:<32}{seconds:>10.3f}{args.ids / seconds:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
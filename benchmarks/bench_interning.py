@@ -0,0 +1,68 @@
+"""Benchmark interning of product category and description when loading a catalog.
+
+Usage:
+    python benchmarks/bench_interning.py --products 1000000 --categories 300
+"""
+import gc
+import time
+import argparse
+import tracemalloc
+
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.interning import get_interner, interning_report
+from slow_tests_demo.utils import serialization
+
+
+def load(text, interning):
+    """Decode a stored catalog and build products, optionally without interning."""
+    interners = [get_interner(Product, field) for field in Product._interned_fields]
+    for interner in interners:
+        interner.clear()
+        interner.max_size = 100000 if interning else 0
+    records = serialization.loads(text)
+    products = Product.from_dicts(records)
+    del records
+    for interner in interners:
+        interner.max_size = 100000
+    return products
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=1000000)
+    parser.add_argument('--categories', type=int, default=300)
+    args = parser.parse_args()
+
+    text = serialization.dumps([{
+        'name': f"Product {i}",
+        'price': (i % 1000) / 10,
+        'description': f"Standard description for catalog group {i % args.categories}",
+        'category': f"Category {i % args.categories}"
+    } for i in range(args.products)])
+
+    print(f"{args.products} products, {args.categories} categories")
+    print(f"{'loader':<22}{'seconds':>10}{'resident MB':>14}")
+    for name, interning in (('without interning', False), ('with interning', True)):
+        gc.collect()
+        start = time.perf_counter()
+        products = load(text, interning)
+        seconds = time.perf_counter() - start
+
+        # Memory is measured in a second load: tracemalloc slows allocation down
+        del products
+        gc.collect()
+        tracemalloc.start()
+        products = load(text, interning)
+        resident = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{name:<22}{seconds:>10.3f}{resident / 1e6:>14.1f}")
+
+    print()
+    for field, stats in interning_report(products).items():
+        print(f"{field}: {stats['values']:,} values in {stats['distinct_objects']:,} objects, "
+              f"{stats['bytes_saved'] / 1e6:.1f} MB saved "
+              f"of {stats['bytes_without_interning'] / 1e6:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
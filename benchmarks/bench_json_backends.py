@@ -0,0 +1,48 @@
+"""Benchmark JSON serialization backends on model-shaped payloads.
+
+Usage:
+    python benchmarks/bench_json_backends.py --records 100000
+"""
+import time
+import argparse
+
+from slow_tests_demo.models.user import User
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.utils import serialization
+
+
+def make_payload(records):
+    """Build a list of alternating user and product dictionaries."""
+    payload = []
+    for i in range(records // 2):
+        payload.append(User(f"user{i}", f"user{i}@example.com", "First", "Last").to_dict())
+        payload.append(Product(f"Product {i}", i * 1.25, "A product", "books").to_dict())
+    return payload
+
+
+def timed(func, *args, **kwargs):
+    """Return (seconds, result) for a call."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+
+    payload = make_payload(args.records)
+
+    print(f"{args.records} records")
+    print(f"{'backend':<10}{'mode':<10}{'dumps s':>10}{'loads s':>10}{'MB':>8}")
+    for name in serialization.available_backends():
+        for mode, indent in (('indent=2', 2), ('compact', None)):
+            dump_seconds, text = timed(serialization.dumps, payload, indent=indent, backend=name)
+            load_seconds, _ = timed(serialization.loads, text, backend=name)
+            size_mb = len(text.encode()) / 1e6
+            print(f"{name:<10}{mode:<10}{dump_seconds:>10.3f}{load_seconds:>10.3f}{size_mb:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
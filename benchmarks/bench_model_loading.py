@@ -0,0 +1,85 @@
+"""Benchmark building Product objects from stored records.
+
+Compares the original ``from_dict`` (construct, then overwrite the
+generated id and timestamp) with the current ``from_dict`` and the bulk
+constructors.
+
+With ``--gc-threshold`` the collector's first-generation threshold is
+raised around each load, as a single-threaded caller may do.
+
+Usage:
+    python benchmarks/bench_model_loading.py --records 1000000 --gc-threshold 100000
+"""
+import gc
+import time
+import argparse
+import pandas as pd
+
+from slow_tests_demo.models.ids import generate_ids
+from slow_tests_demo.models.product import Product
+
+
+def make_records(count):
+    """Records shaped like ``Product.to_dict`` output."""
+    ids = generate_ids(count)
+    now = time.time()
+    return [{
+        'id': ids[i],
+        'name': f"Product {i}",
+        'price': (i % 1000) / 10,
+        'description': None,
+        'category': f"Category {i % 20}",
+        'created_at': now
+    } for i in range(count)]
+
+
+def original_from_dict(data):
+    """``Product.from_dict`` before bulk loading was added."""
+    product = Product(
+        name=data['name'],
+        price=data['price'],
+        description=data.get('description'),
+        category=data.get('category')
+    )
+    product.id = data.get('id', product.id)
+    product.created_at = data.get('created_at', product.created_at)
+    return product
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=1000000)
+    parser.add_argument('--gc-threshold', type=int, default=None,
+                        help="first-generation GC threshold used while loading")
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    columns = {field: [record[field] for record in records] for field in Product.__slots__}
+    df = pd.DataFrame(columns)
+
+    candidates = [
+        ('original from_dict', lambda: [original_from_dict(record) for record in records]),
+        ('from_dict', lambda: [Product.from_dict(record) for record in records]),
+        ('from_dicts', lambda: Product.from_dicts(records)),
+        ('from_columns', lambda: Product.from_columns(columns)),
+        ('from_dataframe', lambda: Product.from_dataframe(df))
+    ]
+
+    print(f"{args.records} records")
+    print(f"{'constructor':<24}{'seconds':>10}{'records/s':>14}")
+    thresholds = gc.get_threshold()
+    for name, func in candidates:
+        if args.gc_threshold:
+            gc.set_threshold(args.gc_threshold, *thresholds[1:])
+        start = time.perf_counter()
+        try:
+            products = func()
+        finally:
+            gc.set_threshold(*thresholds)
+        seconds = time.perf_counter() - start
+        assert products[-1].id == records[-1]['id']
+        print(f"{name:<24}{seconds:>10.3f}{args.records / seconds:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark per-object memory, construction and attribute access of the models.
+
+The "dict" variants are the same classes rebuilt without ``__slots__``,
+i.e. the layout the models had before they were slotted.
+
+Usage:
+    python benchmarks/bench_model_memory.py --objects 200000
+"""
+import gc
+import sys
+import time
+import argparse
+import tracemalloc
+
+from slow_tests_demo.models.user import User
+from slow_tests_demo.models.product import Product
+
+
+def without_slots(cls):
+    """Rebuild a slotted class with an ordinary per-instance __dict__."""
+    namespace = {key: value for key, value in vars(cls).items()
+                 if key not in cls.__slots__ and key != '__slots__'}
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+
+def make_user(cls, i):
+    """Build a user with distinct string values."""
+    return cls(f"user{i}", f"user{i}@example.com", "First", "Last")
+
+
+def make_product(cls, i):
+    """Build a product with distinct string values."""
+    return cls(f"Product {i}", i * 1.25, "A product", "books")
+
+
+def bytes_per_object(factory, cls, count):
+    """Traced allocation per object, including its id string."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(cls, i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / count
+
+
+def shell_bytes(obj):
+    """Size of the instance itself plus its __dict__, excluding attribute values."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def construction_rate(factory, cls, count):
+    """Objects constructed per second, and the objects."""
+    start = time.perf_counter()
+    objects = [factory(cls, i) for i in range(count)]
+    return count / (time.perf_counter() - start), objects
+
+
+def attribute_rate(objects, name):
+    """Attribute reads per second."""
+    start = time.perf_counter()
+    for obj in objects:
+        getattr(obj, name)
+        getattr(obj, 'created_at')
+        getattr(obj, 'id')
+    return 3 * len(objects) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--objects', type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{args.objects} objects per variant")
+    print(f"{'class':<14}{'shell B':>9}{'bytes/obj':>11}{'objs/s':>12}{'attrs/s':>14}")
+    for cls, factory, attribute in ((User, make_user, 'email'), (Product, make_product, 'price')):
+        for variant in (without_slots(cls), cls):
+            size = bytes_per_object(factory, variant, args.objects)
+            rate, objects = construction_rate(factory, variant, args.objects)
+            access = attribute_rate(objects, attribute)
+            shell = shell_bytes(objects[0])
+            print(f"{variant.__name__:<14}{shell:>9}{size:>11.0f}{rate:>12,.0f}{access:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
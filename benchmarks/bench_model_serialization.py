@@ -0,0 +1,77 @@
+"""Benchmark serializing a product listing with and without the model caches.
+
+Usage:
+    python benchmarks/bench_model_serialization.py --products 100000 --requests 5 --backend json
+"""
+import time
+import argparse
+
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.caching import cached_json
+from slow_tests_demo.utils import serialization
+
+
+def product_dict(product):
+    """``Product.to_dict`` before caching: a new dict on every call."""
+    return {
+        'id': product.id,
+        'name': product.name,
+        'price': product.price,
+        'description': product.description,
+        'category': product.category,
+        'created_at': product.created_at
+    }
+
+
+def uncached(products):
+    """What the list endpoint did before: build every dict and encode the list."""
+    return serialization.dumps([product_dict(product) for product in products]).encode()
+
+
+def per_model(products):
+    """Join the per-product cached encodings, filling each with ``to_json``."""
+    return b'[' + b','.join([product.to_json() for product in products]) + b']'
+
+
+def cached(products):
+    """What the list endpoint does: join cached encodings, filling stale ones together."""
+    return b'[' + b','.join(cached_json(products)) + b']'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=100000)
+    parser.add_argument('--requests', type=int, default=5)
+    parser.add_argument('--backend', choices=serialization.available_backends())
+    args = parser.parse_args()
+    serialization.set_default_backend(args.backend)
+
+    products = Product.from_columns({
+        'name': [f"Product {i}" for i in range(args.products)],
+        'price': [(i % 1000) / 10 for i in range(args.products)],
+        'category': [f"Category {i % 20}" for i in range(args.products)]
+    })
+
+    print(f"{args.products} products, {args.requests} list requests, "
+          f"{serialization.get_backend().name} backend")
+    print(f"{'listing':<28}{'first (s)':>12}{'repeat (s)':>12}")
+    for name, func in (('to_dict + dumps', uncached), ('cached, to_json per model', per_model),
+                       ('cached, filled together', cached)):
+        for product in products:
+            product._serialized = None
+        timings = []
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            func(products)
+            timings.append(time.perf_counter() - start)
+        repeat = sum(timings[1:]) / max(len(timings) - 1, 1)
+        print(f"{name:<28}{timings[0]:>12.3f}{repeat:>12.3f}")
+
+    products[0].price = 1.0
+    start = time.perf_counter()
+    cached(products)
+    print(f"{'cached, one product changed':<28}{'':>12}{time.perf_counter() - start:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark parallel CSV parsing scaling with the number of workers.
+
+Usage:
+    python benchmarks/bench_parallel_csv.py --rows 2000000
+"""
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.utils.file_operations import read_csv_file
+from slow_tests_demo.utils.parallel_csv import read_csv_parallel
+
+
+def make_csv(filepath, rows):
+    """Write a CSV file with numeric and quoted text columns."""
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        'id': np.arange(rows),
+        'price': rng.uniform(0, 1000, rows).round(2),
+        'note': rng.choice(['plain', 'has, comma', 'two\nlines'], rows)
+    }).to_csv(filepath, index=False)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000000)
+    parser.add_argument('--columnar', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, 'bench.csv')
+        make_csv(filepath, args.rows)
+        size_mb = os.path.getsize(filepath) / 1e6
+
+        baseline = timed(read_csv_file, filepath)
+        print(f"{args.rows} rows, {size_mb:.1f} MB, {os.cpu_count()} CPUs")
+        print(f"{'reader':<28}{'seconds':>10}{'MB/s':>10}{'speedup':>10}")
+        print(f"{'read_csv_file':<28}{baseline:>10.3f}{size_mb / baseline:>10.1f}{1.0:>10.2f}")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            seconds = timed(read_csv_parallel, filepath, workers=workers, columnar=args.columnar)
+            name = f"read_csv_parallel x{workers}"
+            print(f"{name:<28}{seconds:>10.3f}{size_mb / seconds:>10.1f}{baseline / seconds:>10.2f}")
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
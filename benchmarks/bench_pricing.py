@@ -0,0 +1,93 @@
+"""Benchmark the pricing rule engine against a per-product loop.
+
+Usage:
+    python benchmarks/bench_pricing.py --products 1000000 --categories 200
+"""
+import time
+import argparse
+import numpy as np
+
+from slow_tests_demo.models.tables import ProductTable
+from slow_tests_demo.models.pricing import PricingRule, PricingEngine
+
+
+def make_rules(categories):
+    """Tiered, per-category and time-windowed rules, most specific first."""
+    rules = [PricingRule("flash", "percentage", 30, categories=categories[:5],
+                         starts_at=0, ends_at=time.time() + 3600)]
+    for i in range(5, 45, 4):
+        rules.append(PricingRule(f"category-{i}", "fixed", 2.0, categories=categories[i:i + 4],
+                                 max_price=50))
+    rules += [
+        PricingRule("luxury", "percentage", 15, min_price=500),
+        PricingRule("mid", "percentage", 5, min_price=100, max_price=500),
+        PricingRule("cap", "cap", 20.0, categories=categories[-10:])
+    ]
+    return rules
+
+
+def loop_price(rules, prices, categories, now):
+    """First matching rule per product, one product at a time."""
+    new_prices = []
+    fired = []
+    for price, category in zip(prices, categories):
+        for rule in rules:
+            if (rule.is_active(now)
+                    and (rule.categories is None or category in rule.categories)
+                    and (rule.min_price is None or price >= rule.min_price)
+                    and (rule.max_price is None or price < rule.max_price)):
+                if rule.kind == 'percentage':
+                    price = price * (1 - rule.amount / 100)
+                elif rule.kind == 'fixed':
+                    price = max(price - rule.amount, 0)
+                else:
+                    price = min(price, rule.amount)
+                fired.append(rule.name)
+                break
+        else:
+            fired.append(None)
+        new_prices.append(price)
+    return new_prices, fired
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=1000000)
+    parser.add_argument('--categories', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    categories = [f"Category {i}" for i in range(args.categories)]
+    table = ProductTable(
+        names=[f"Product {i}" for i in range(args.products)],
+        prices=np.round(rng.lognormal(4, 1.2, args.products), 2),
+        categories=rng.choice(categories, args.products)
+    )
+    rules = make_rules(categories)
+    engine = PricingEngine(rules)
+    now = time.time()
+
+    start = time.perf_counter()
+    result = engine.price(table, now=now)
+    engine_seconds = time.perf_counter() - start
+
+    prices = table['price'].tolist()
+    product_categories = table['category'].tolist()
+    start = time.perf_counter()
+    loop_prices, loop_fired = loop_price(rules, prices, product_categories, now)
+    loop_seconds = time.perf_counter() - start
+
+    assert np.allclose(result.prices, loop_prices)
+    assert list(result.fired()) == loop_fired
+
+    print(f"{args.products} products, {len(rules)} rules")
+    print(f"{'pricer':<20}{'seconds':>10}{'products/s':>14}")
+    for name, seconds in (('per-product loop', loop_seconds), ('PricingEngine', engine_seconds)):
+        print(f"{name:<20}{seconds:>10.3f}{args.products / seconds:>14,.0f}")
+    print()
+    for name, count in result.counts().items():
+        print(f"{str(name):<20}{count:>10,}")
+
+
+if __name__ == '__main__':
+    main()
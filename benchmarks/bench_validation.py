@@ -0,0 +1,79 @@
+"""Benchmark batch validation against per-object validate() calls.
+
+Usage:
+    python benchmarks/bench_validation.py --records 1000000
+"""
+import time
+import argparse
+import numpy as np
+
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.validation import validate_products
+
+
+def make_records(count):
+    """Build product dicts where about one in ten is invalid."""
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(-10, 100, count).round(2).tolist()
+    return [{'name': f"Product {i}" if i % 50 else "X", 'price': price}
+            for i, price in enumerate(prices)]
+
+
+def per_object(records):
+    """Build each Product and call validate(), catching the error."""
+    invalid = []
+    for record in records:
+        try:
+            Product.from_dict(record).validate()
+            invalid.append(False)
+        except ValueError:
+            invalid.append(True)
+    return invalid
+
+
+def per_object_prebuilt(products):
+    """Call validate() on existing Product objects."""
+    invalid = []
+    for product in products:
+        try:
+            product.validate()
+            invalid.append(False)
+        except ValueError:
+            invalid.append(True)
+    return invalid
+
+
+def timed(func, *args):
+    """Return (seconds, result) for a call."""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=1000000)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    products = [Product.from_dict(record) for record in records]
+    columns = {'name': [r['name'] for r in records],
+               'price': np.array([r['price'] for r in records])}
+
+    candidates = [
+        ('from_dict + validate()', per_object, records),
+        ('validate() on objects', per_object_prebuilt, products),
+        ('validate_products(dicts)', lambda r: validate_products(r).invalid, records),
+        ('validate_products(objects)', lambda p: validate_products(p).invalid, products),
+        ('validate_products(columns)', lambda c: validate_products(c).invalid, columns)
+    ]
+
+    print(f"{args.records} records")
+    print(f"{'method':<30}{'seconds':>10}{'records/s':>14}{'invalid':>10}")
+    for name, func, data in candidates:
+        seconds, invalid = timed(func, data)
+        print(f"{name:<30}{seconds:>10.3f}{args.records / seconds:>14,.0f}{int(sum(invalid)):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,22 +3,51 @@ import time
 import random
 import json
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 
 from slow_tests_demo.models.user import User
 from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.interning import intern_object
+from slow_tests_demo.models.caching import cached_json
+from slow_tests_demo.utils import serialization
+
+
+class SerializationJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with the serialization backend."""
+    
+    def dumps(self, obj, **kwargs):
+        return serialization.dumps(obj, indent=kwargs.get('indent'),
+                                   sort_keys=kwargs.get('sort_keys', self.sort_keys),
+                                   default=kwargs.get('default', self.default))
+    
+    def loads(self, s, **kwargs):
+        return serialization.loads(s)
+
 
 app = Flask(__name__)
+app.json = SerializationJSONProvider(app)
 
 # In-memory storage
 users = {}
 products = {}
 
 
+def model_response(model, status=200):
+    """Respond with a model's cached JSON encoding."""
+    return app.response_class(model.to_json(), status=status, mimetype=app.json.mimetype)
+
+
+def models_response(models):
+    """Respond with a JSON array joined from the models' cached encodings."""
+    body = b'[' + b','.join(cached_json(models)) + b']'
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
 @app.route('/api/users', methods=['GET'])
 def get_users():
     """Get all users."""
     time.sleep(random.uniform(0.2, 0.5))  # Artificial delay
-    return jsonify([user.to_dict() for user in users.values()])
+    return models_response(users.values())
 
 
 @app.route('/api/users/<user_id>', methods=['GET'])
@@ -29,7 +58,7 @@ def get_user(user_id):
     if user_id not in users:
         return jsonify({'error': 'User not found'}), 404
     
-    return jsonify(users[user_id].to_dict())
+    return model_response(users[user_id])
 
 
 @app.route('/api/users', methods=['POST'])
@@ -47,8 +76,8 @@ def create_user():
             last_name=data.get('last_name')
         )
         user.validate()
-        users[user.id] = user
-        return jsonify(user.to_dict()), 201
+        users[user.id] = intern_object(user)
+        return model_response(user, 201)
     except (KeyError, ValueError) as e:
         return jsonify({'error': str(e)}), 400
 
@@ -57,7 +86,7 @@ def create_user():
 def get_products():
     """Get all products."""
     time.sleep(random.uniform(0.2, 0.5))  # Artificial delay
-    return jsonify([product.to_dict() for product in products.values()])
+    return models_response(products.values())
 
 
 @app.route('/api/products/<product_id>', methods=['GET'])
@@ -68,7 +97,7 @@ def get_product(product_id):
     if product_id not in products:
         return jsonify({'error': 'Product not found'}), 404
     
-    return jsonify(products[product_id].to_dict())
+    return model_response(products[product_id])
 
 
 @app.route('/api/products', methods=['POST'])
@@ -86,8 +115,8 @@ def create_product():
             category=data.get('category')
         )
         product.validate()
-        products[product.id] = product
-        return jsonify(product.to_dict()), 201
+        products[product.id] = intern_object(product)
+        return model_response(product, 201)
     except (KeyError, ValueError) as e:
         return jsonify({'error': str(e)}), 400
 
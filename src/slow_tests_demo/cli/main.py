@@ -1,16 +1,32 @@
 """Command-line interface for the slow tests demo package."""
+import os
 import time
 import random
-import json
 import click
 import pandas as pd
+from itertools import chain
 
 from slow_tests_demo.utils.data_processing import process_data, clean_data
-from slow_tests_demo.utils.file_operations import read_json_file, write_json_file, read_csv_file, write_csv_file
+from slow_tests_demo.utils.file_operations import (
+    read_json_file, write_json_file, read_csv_file, write_csv_file, iter_csv_rows,
+    iter_json_array, write_json_array, read_ndjson_file, iter_ndjson, write_ndjson_file,
+    detect_format, open_file, read_columnar_file, write_columnar_file, JSON_ENCODING
+)
+from slow_tests_demo.utils.columnar import read_csv_columns
+from slow_tests_demo.utils import serialization
 from slow_tests_demo.models.user import User
 from slow_tests_demo.models.product import Product
 
 
+def _is_json_array(filepath):
+    """Check whether a JSON file holds a top-level array."""
+    with open_file(filepath, 'r', encoding=JSON_ENCODING) as f:
+        while True:
+            char = f.read(1)
+            if not char or not char.isspace():
+                return char == '['
+
+
 @click.group()
 def cli():
     """Slow Tests Demo CLI."""
@@ -36,56 +52,108 @@ def calculate(numbers, operation):
 @cli.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.argument('output_file', type=click.Path())
-@click.option('--format', '-f', type=click.Choice(['json', 'csv']), default='json',
-              help='File format (json or csv).')
-def convert(input_file, output_file, format):
-    """Convert between JSON and CSV files."""
+@click.option('--format', '-f', type=click.Choice(['json', 'csv', 'ndjson', 'columnar']),
+              default='json', help='File format (json, csv, ndjson or columnar).')
+@click.option('--workers', '-w', type=int, default=None,
+              help='Worker processes for parsing NDJSON input.')
+@click.option('--compresslevel', type=click.IntRange(0, 9), default=None,
+              help='Compression level for .gz, .bz2 or .xz output.')
+@click.option('--compact', is_flag=True, help='Write JSON output without indentation.')
+def convert(input_file, output_file, format, workers, compresslevel, compact):
+    """Convert between JSON, NDJSON, CSV and binary columnar files."""
     time.sleep(random.uniform(0.3, 0.7))  # Artificial delay
     
     # Determine input format from file extension
-    input_format = 'json' if input_file.lower().endswith('.json') else 'csv'
+    input_format = detect_format(input_file)
     
-    # Read input file
-    if input_format == 'json':
+    # Stream records unless the output would overwrite the file being read
+    # (also through a symlink or hardlink)
+    same_file = os.path.exists(output_file) and os.path.samefile(input_file, output_file)
+    
+    if format == 'columnar':
+        if input_format == 'json' and not _is_json_array(input_file):
+            click.echo("Error: JSON data structure not supported for columnar conversion.")
+            return
+        if input_format == 'csv':
+            columns = read_csv_columns(input_file, categorical=True)
+        elif input_format == 'columnar':
+            columns = read_columnar_file(input_file, mmap=False)
+        elif input_format == 'ndjson':
+            columns = pd.DataFrame.from_records(read_ndjson_file(input_file, workers=workers))
+        else:
+            columns = pd.DataFrame.from_records(read_json_file(input_file))
+        try:
+            write_columnar_file(columns, output_file)
+        except FileExistsError as e:
+            click.echo(f"Error: {e}.")
+            return
+        click.echo(f"Converted {input_file} to {output_file}")
+        return
+    
+    if input_format == 'json' and not _is_json_array(input_file):
         data = read_json_file(input_file)
-        # Convert to list of lists for CSV if needed
         if format == 'csv':
-            if isinstance(data, list) and all(isinstance(item, dict) for item in data):
-                # Get all possible keys
-                keys = set()
-                for item in data:
-                    keys.update(item.keys())
-                keys = sorted(keys)
-                
-                # Convert to list of lists
-                csv_data = [keys]
-                for item in data:
-                    row = [item.get(key, '') for key in keys]
-                    csv_data.append(row)
-                
-                write_csv_file(csv_data, output_file)
-            else:
-                click.echo("Error: JSON data structure not supported for CSV conversion.")
-                return
+            click.echo("Error: JSON data structure not supported for CSV conversion.")
+            return
+        if format == 'ndjson':
+            write_ndjson_file([data], output_file, compresslevel=compresslevel)
         else:
             # JSON to JSON (just copy)
-            write_json_file(data, output_file)
-    else:  # CSV input
-        data = read_csv_file(input_file)
-        if format == 'json':
-            # Convert to JSON
-            if data:
-                headers = data[0]
-                json_data = []
-                for row in data[1:]:
-                    item = {headers[i]: value for i, value in enumerate(row) if i < len(headers)}
-                    json_data.append(item)
-                write_json_file(json_data, output_file)
-            else:
-                write_json_file([], output_file)
-        else:
+            write_json_file(data, output_file, compresslevel=compresslevel, compact=compact)
+        click.echo(f"Converted {input_file} to {output_file}")
+        return
+    
+    # Read input file
+    if input_format == 'columnar':
+        columns = read_columnar_file(input_file)
+        headers = list(columns)
+        values = [column.tolist() for column in columns.values()]
+        if format == 'csv':
+            write_csv_file(chain([headers], zip(*values)), output_file, compresslevel=compresslevel)
+            click.echo(f"Converted {input_file} to {output_file}")
+            return
+        
+        items = lambda: (dict(zip(headers, row)) for row in zip(*values))
+    elif input_format == 'csv':
+        rows = iter(read_csv_file(input_file)) if same_file else iter_csv_rows(input_file)
+        if format == 'csv':
             # CSV to CSV (just copy)
-            write_csv_file(data, output_file)
+            write_csv_file(rows, output_file, compresslevel=compresslevel)
+            click.echo(f"Converted {input_file} to {output_file}")
+            return
+        
+        headers = next(rows, None)
+        records = (dict(zip(headers, row)) for row in rows) if headers is not None else iter(())
+        items = lambda: records
+    elif same_file:
+        if input_format == 'ndjson':
+            data = read_ndjson_file(input_file, workers=workers)
+        else:
+            data = read_json_file(input_file)
+        items = lambda: iter(data)
+    elif input_format == 'ndjson':
+        items = lambda: iter_ndjson(input_file, workers=workers)
+    else:
+        items = lambda: iter_json_array(input_file)
+    
+    # Write output file
+    if format == 'csv':
+        # First pass collects all possible keys, second pass writes rows
+        keys = set()
+        for item in items():
+            if not isinstance(item, dict):
+                click.echo("Error: JSON data structure not supported for CSV conversion.")
+                return
+            keys.update(item.keys())
+        keys = sorted(keys)
+        
+        rows = ([item.get(key, '') for key in keys] for item in items())
+        write_csv_file(chain([keys], rows), output_file, compresslevel=compresslevel)
+    elif format == 'ndjson':
+        write_ndjson_file(items(), output_file, compresslevel=compresslevel)
+    else:
+        write_json_array(items(), output_file, indent=None if compact else 2,
+                         compresslevel=compresslevel)
     
     click.echo(f"Converted {input_file} to {output_file}")
 
@@ -102,7 +170,7 @@ def create_user(username, email, first_name, last_name):
     try:
         user = User(username=username, email=email, first_name=first_name, last_name=last_name)
         user.validate()
-        click.echo(f"User created: {json.dumps(user.to_dict(), indent=2)}")
+        click.echo(f"User created: {serialization.dumps(user.to_dict(), indent=2)}")
     except ValueError as e:
         click.echo(f"Error: {str(e)}")
 
@@ -127,7 +195,7 @@ def create_product(name, price, description, category, discount):
             discounted_price = product.apply_discount(discount)
             result['discounted_price'] = discounted_price
         
-        click.echo(f"Product created: {json.dumps(result, indent=2)}")
+        click.echo(f"Product created: {serialization.dumps(result, indent=2)}")
     except ValueError as e:
         click.echo(f"Error: {str(e)}")
 
@@ -0,0 +1,107 @@
+"""Per-instance caching of encoded model JSON, invalidated on assignment."""
+import itertools
+from operator import is_
+
+from slow_tests_demo.utils import serialization
+from slow_tests_demo.models import encoding
+
+
+# Shared by every instance, so a version also identifies the object state
+# across instances and can be used on its own as a cache key
+_versions = itertools.count(1)
+
+_VERSION, _VALUES, _JSON = range(3)
+
+
+class CachedSerialization:
+    """
+    Mixin caching a model's ``to_dict`` representation encoded as JSON.
+
+    The cache remembers the field values it was built from and checks on
+    every read that the fields still hold the very same objects, so
+    assigning any field invalidates it, even with an equal value of another
+    type (10 by 10.0). Comparing identities is cheap, and unlike overriding
+    ``__setattr__`` costs nothing on assignment, which would slow down
+    every constructor.
+
+    ``to_dict`` is not cached: building a fresh dict costs about as much
+    as checking a cache would. Subclasses list their fields in ``_fields``,
+    in ``to_dict`` order, and set ``_snapshot = attrgetter(*_fields)``.
+    """
+
+    __slots__ = ('_serialized',)
+
+    _fields = ()
+    _snapshot = None
+
+    def _cache_entry(self):
+        values = self._snapshot(self)
+        entry = getattr(self, '_serialized', None)
+        if entry is None or not all(map(is_, values, entry[_VALUES])):
+            entry = [next(_versions), values, None]
+            self._serialized = entry
+        return entry
+
+    @property
+    def serialization_version(self):
+        """
+        Version of the field values, for use in cache keys.
+
+        Unique across instances and changed whenever a field has been
+        assigned since it was last read.
+        """
+        return self._cache_entry()[_VERSION]
+
+    def to_json(self):
+        """
+        Return the ``to_dict`` representation encoded as JSON.
+
+        The bytes are encoded once with the default serialization backend
+        and reused until a field is assigned.
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        entry = getattr(self, '_serialized', None)
+        if (entry is None or entry[_JSON] is None
+                or not all(map(is_, self._snapshot(self), entry[_VALUES]))):
+            entry = self._cache_entry()
+            entry[_JSON] = serialization.dumps(dict(zip(self._fields, entry[_VALUES]))).encode()
+        return entry[_JSON]
+
+
+def cached_json(models):
+    """
+    Return the cached JSON encodings of many models.
+
+    Models without an up-to-date encoding are encoded together, column by
+    column, rather than one ``to_json`` call at a time, and their caches
+    are filled.
+
+    Args:
+        models: Iterable of User or Product objects
+
+    Returns:
+        List of UTF-8 encoded JSON bytes, one per model
+    """
+    models = list(models)
+    result = []
+    stale = []
+    for model in models:
+        values = model._snapshot(model)
+        entry = getattr(model, '_serialized', None)
+        if entry is not None and not all(map(is_, values, entry[_VALUES])):
+            entry = None
+        if entry is None or entry[_JSON] is None:
+            stale.append((len(result), model, values, entry))
+            result.append(None)
+        else:
+            result.append(entry[_JSON])
+
+    if stale:
+        texts = encoding.encode_models([model for _, model, _, _ in stale])
+        for (i, model, values, entry), text in zip(stale, texts):
+            if entry is None:
+                entry = model._serialized = [next(_versions), values, None]
+            entry[_JSON] = result[i] = text.encode()
+    return result
@@ -0,0 +1,160 @@
+"""Stream collections of models to JSON without building per-model dicts."""
+import math
+from operator import attrgetter
+from itertools import groupby, islice
+from json.encoder import encode_basestring
+
+from slow_tests_demo.utils import serialization
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_NONE = type(None)
+
+
+def _encode_float(value):
+    if math.isfinite(value):
+        return float.__repr__(value)
+    # NaN and infinity are not JSON; write them as the backend does
+    return serialization.dumps(value)
+
+
+_ENCODERS = {
+    str: encode_basestring,
+    float: _encode_float,
+    int: int.__repr__,
+    bool: lambda value: 'true' if value else 'false',
+    _NONE: lambda value: 'null'
+}
+
+
+def encode_value(value):
+    """
+    Encode one field value as JSON text.
+
+    Strings, numbers, booleans and None are encoded directly; anything
+    else (numpy scalars, nested containers) goes through the default
+    serialization backend.
+    """
+    encoder = _ENCODERS.get(type(value))
+    if encoder is None:
+        return serialization.dumps(value)
+    return encoder(value)
+
+
+def _encode_column(values):
+    """
+    Encode one field of a run of models.
+
+    Columns of strings, possibly with None, are mapped through the C
+    string encoder. Numeric columns are encoded as one JSON array by the
+    serialization backend and split on commas, which cannot occur inside
+    a number. Anything else falls back to ``encode_value`` per value.
+    """
+    types = set(map(type, values))
+    types.discard(_NONE)
+    if types == {str}:
+        if None not in values:
+            return list(map(encode_basestring, values))
+        return ['null' if value is None else encode_basestring(value) for value in values]
+    if not types:
+        return ['null'] * len(values)
+    if types <= {float, int}:
+        return serialization.dumps(values)[1:-1].split(',')
+    return list(map(encode_value, values))
+
+
+_layouts = {}
+
+
+def _layout(model_class):
+    """
+    Return the %-format template and field getters for a model class.
+
+    The template has the key fragments baked in, for a User
+    ``{"id":%s,"username":%s,...}``; only the values are filled in per
+    object.
+    """
+    layout = _layouts.get(model_class)
+    if layout is None:
+        fields = model_class._fields
+        template = '{' + ','.join(encode_basestring(field).replace('%', '%%') + ':%s'
+                                  for field in fields) + '}'
+        layout = (template, [attrgetter(field) for field in fields])
+        _layouts[model_class] = layout
+    return layout
+
+
+def encode_models(models):
+    """
+    Encode each model of a sequence as a JSON object.
+
+    Args:
+        models: Sequence of User or Product objects (may be mixed)
+
+    Returns:
+        List of JSON strings, one per model, each decoding to ``to_dict()``
+    """
+    parts = []
+    for model_class, run in groupby(models, type):
+        run = list(run)
+        template, getters = _layout(model_class)
+        # Encode field by field, then fill the template row by row
+        encoded = [_encode_column(list(map(getter, run))) for getter in getters]
+        parts.extend([template % row for row in zip(*encoded)])
+    return parts
+
+
+def iter_json(models, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Encode a collection of models as a JSON array, chunk by chunk.
+
+    The output decodes to ``[model.to_dict() for model in models]``, but
+    no dicts are built: each chunk is encoded field by field and the
+    values are written into a template of precomputed key fragments for
+    the model's class.
+
+    Args:
+        models: Iterable of User or Product objects (may be mixed)
+        chunk_size: Number of models encoded per chunk
+
+    Yields:
+        UTF-8 encoded byte chunks; their concatenation is the JSON array
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    models = iter(models)
+    separator = ''
+    yield b'['
+    while True:
+        chunk = list(islice(models, chunk_size))
+        if not chunk:
+            break
+        yield (separator + ','.join(encode_models(chunk))).encode()
+        separator = ','
+    yield b']'
+
+
+def write_json(models, f, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Write a collection of models to a binary file object as a JSON array.
+
+    Args:
+        models: Iterable of User or Product objects
+        f: File object opened in binary mode
+        chunk_size: Number of models encoded per write
+
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    for chunk in iter_json(models, chunk_size):
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def dumps(models, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Encode a collection of models as one JSON ``bytes`` object."""
+    return b''.join(iter_json(models, chunk_size))
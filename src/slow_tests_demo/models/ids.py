@@ -0,0 +1,223 @@
+"""Pluggable, time-ordered id generation for models."""
+import os
+import time
+import uuid
+import weakref
+import threading
+
+
+ENTROPY_BLOCK_SIZE = 64 * 1024
+
+_COUNTER_BITS = 12
+
+_RAND_B_MASK = (1 << 62) - 1
+
+_VARIANT = 0b10 << 62
+
+_live_generators = weakref.WeakSet()
+
+
+def _prefix(ms):
+    """Format a millisecond timestamp as the first two UUID groups."""
+    h = f"{ms:012x}"
+    return f"{h[:8]}-{h[8:]}"
+
+
+class UUIDv7Generator:
+    """
+    Generate UUIDv7 strings: a 48-bit millisecond timestamp, a 12-bit
+    counter and 62 random bits.
+
+    Ids sort by creation time as strings, and ids from one generator are
+    strictly increasing. The counter starts at a random value below 2048
+    in each millisecond; if it runs out, the timestamp is advanced by one
+    millisecond rather than repeating. Random bits come from
+    ``os.urandom`` in blocks of ``entropy_block_size`` bytes instead of
+    one call per id, and the block is discarded in a forked child so
+    parent and child never hand out the same bits.
+    """
+
+    def __init__(self, entropy_block_size=ENTROPY_BLOCK_SIZE):
+        """
+        Initialize the generator.
+
+        Args:
+            entropy_block_size: Bytes of randomness fetched per os.urandom call
+        """
+        self.entropy_block_size = entropy_block_size
+        self._lock = threading.Lock()
+        self._entropy = b''
+        self._position = 0
+        self._last_ms = 0
+        self._counter = 0
+        self._prefix = _prefix(0)
+        _live_generators.add(self)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._entropy = b''
+        self._position = 0
+
+    def _take(self, size):
+        """Return ``size`` random bytes from the buffered entropy block."""
+        if self._position + size > len(self._entropy):
+            self._entropy = os.urandom(max(self.entropy_block_size, size))
+            self._position = 0
+        start = self._position
+        self._position += size
+        return self._entropy[start:self._position]
+
+    def _advance(self, seed):
+        """Start a new millisecond or step the counter; caller holds the lock."""
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > self._last_ms:
+            self._last_ms = now_ms
+            self._counter = seed & 0x7ff
+            self._prefix = _prefix(now_ms)
+        else:
+            self._counter += 1
+            if self._counter >> _COUNTER_BITS:
+                # Counter exhausted: borrow the next millisecond
+                self._last_ms += 1
+                self._counter = 0
+                self._prefix = _prefix(self._last_ms)
+
+    def generate(self):
+        """Return one new id string."""
+        with self._lock:
+            word = int.from_bytes(self._take(8), 'little')
+            self._advance(word >> 52)
+            rand_b = f"{(word & _RAND_B_MASK) | _VARIANT:016x}"
+            return f"{self._prefix}-7{self._counter:03x}-{rand_b[:4]}-{rand_b[4:]}"
+
+    __call__ = generate
+
+    def generate_many(self, count):
+        """
+        Allocate a block of ids.
+
+        Args:
+            count: Number of ids
+
+        Returns:
+            List of id strings in increasing order
+        """
+        ids = []
+        with self._lock:
+            words = memoryview(self._take(8 * count)).cast('Q')
+            for word in words:
+                self._advance(word >> 52)
+                rand_b = f"{(word & _RAND_B_MASK) | _VARIANT:016x}"
+                ids.append(f"{self._prefix}-7{self._counter:03x}-{rand_b[:4]}-{rand_b[4:]}")
+        return ids
+
+
+def _reset_after_fork():
+    for generator in list(_live_generators):
+        generator._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class UUID4Generator:
+    """Random ``uuid.uuid4`` ids, the models' original behaviour."""
+
+    def generate(self):
+        """Return one new id string."""
+        return str(uuid.uuid4())
+
+    def generate_many(self, count):
+        """Return a list of ``count`` new id strings."""
+        return [str(uuid.uuid4()) for _ in range(count)]
+
+    __call__ = generate
+
+
+class _CallableGenerator:
+    """Adapts a zero-argument function to the generator interface."""
+
+    def __init__(self, func):
+        self.generate = func
+
+    def generate_many(self, count):
+        return [self.generate() for _ in range(count)]
+
+
+_generator = UUIDv7Generator()
+
+
+def set_id_generator(generator=None):
+    """
+    Replace the generator used for new model ids.
+
+    Args:
+        generator: Object with ``generate()`` and ``generate_many(count)``
+            methods, a zero-argument function returning an id string, or
+            None to restore the default UUIDv7 generator
+    """
+    global _generator
+    if generator is None:
+        generator = UUIDv7Generator()
+    elif not hasattr(generator, 'generate_many'):
+        generator = _CallableGenerator(generator)
+    _generator = generator
+
+
+def get_id_generator():
+    """Return the generator used for new model ids."""
+    return _generator
+
+
+def generate_id():
+    """Return a new model id."""
+    return _generator.generate()
+
+
+def generate_ids(count):
+    """
+    Allocate ids for a batch of new models.
+
+    Args:
+        count: Number of ids
+
+    Returns:
+        List of id strings
+    """
+    return _generator.generate_many(count)
+
+
+def fill_ids(values):
+    """
+    Replace the missing entries of an id column with new ids.
+
+    Args:
+        values: List of id strings or None
+
+    Returns:
+        List with every None replaced, allocated in one ``generate_ids`` call
+    """
+    missing = [i for i, value in enumerate(values) if value is None]
+    if not missing:
+        return values
+    values = list(values)
+    for i, new_id in zip(missing, generate_ids(len(missing))):
+        values[i] = new_id
+    return values
+
+
+def timestamp_from_id(model_id):
+    """
+    Return the creation time encoded in a UUIDv7 id.
+
+    Args:
+        model_id: Id string produced by UUIDv7Generator
+
+    Returns:
+        Seconds since the epoch, with millisecond precision
+    """
+    value = uuid.UUID(model_id)
+    if value.version != 7:
+        raise ValueError(f"Not a UUIDv7 id: {model_id}")
+    return (value.int >> 80) / 1000
@@ -0,0 +1,186 @@
+"""Shared storage for repetitive string values of model fields."""
+import sys
+
+
+DEFAULT_MAX_SIZE = 100000
+
+_NONE = type(None)
+
+
+class StringInterner:
+    """
+    Pool mapping each distinct string to one shared instance.
+
+    Deserialized records carry a separate string object for every copy of
+    a value; passing them through an interner makes equal values share a
+    single object. Once ``max_size`` distinct values are pooled the field
+    is evidently not low-cardinality, and new values are returned as they
+    are instead of growing the pool. Only strings are pooled, so values of
+    other types that compare equal (1 and True) are never swapped.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size: Maximum number of distinct values kept
+        """
+        self.max_size = max_size
+        self._pool = {}
+
+    def __len__(self):
+        return len(self._pool)
+
+    def intern(self, value):
+        """
+        Return the pooled instance equal to ``value``.
+
+        Args:
+            value: Field value; anything but a string is returned unchanged
+
+        Returns:
+            Shared string, or ``value`` itself
+        """
+        if type(value) is not str:
+            return value
+        pooled = self._pool.get(value)
+        if pooled is None:
+            if len(self._pool) >= self.max_size:
+                return value
+            self._pool[value] = pooled = value
+        return pooled
+
+    def intern_many(self, values):
+        """
+        Intern a column of values.
+
+        Args:
+            values: Sequence of field values; anything but a string is
+                returned unchanged
+
+        Returns:
+            List of interned values
+        """
+        pool = self._pool
+        if set(map(type, values)) <= {str, _NONE}:
+            # setdefault stores new values and returns pooled ones in one C
+            # call, when every new value fits in the pool
+            new = set(values).difference(pool)
+            new.discard(None)
+            if len(pool) + len(new) <= self.max_size:
+                interned = list(map(pool.setdefault, values, values))
+                pool.pop(None, None)
+                return interned
+        return [self.intern(value) for value in values]
+
+    def clear(self):
+        """Drop every pooled value."""
+        self._pool.clear()
+
+
+_interners = {}
+
+
+def get_interner(model_class, field):
+    """
+    Return the interner shared by one field of a model class.
+
+    Args:
+        model_class: Model class, e.g. Product
+        field: Field name listed in the class's ``_interned_fields``
+
+    Returns:
+        StringInterner
+    """
+    key = (model_class.__name__, field)
+    interner = _interners.get(key)
+    if interner is None:
+        interner = _interners[key] = StringInterner()
+    return interner
+
+
+def clear_interners():
+    """
+    Drop the values pooled by every shared interner.
+
+    Pools keep their strings alive; call this once the models loaded
+    with them are gone to release the memory. Models keep the strings
+    they already reference.
+    """
+    for interner in _interners.values():
+        interner.clear()
+
+
+def intern_object(obj):
+    """
+    Replace an object's low-cardinality field values with pooled instances.
+
+    Args:
+        obj: User or Product
+
+    Returns:
+        The same object
+    """
+    model_class = type(obj)
+    for field in model_class._interned_fields:
+        setattr(obj, field, get_interner(model_class, field).intern(getattr(obj, field)))
+    return obj
+
+
+def intern_columns(model_class, columns):
+    """
+    Intern the low-cardinality columns of a bulk load in place.
+
+    Args:
+        model_class: Model class the columns belong to
+        columns: Dictionary mapping field names to lists of values
+    """
+    for field in model_class._interned_fields:
+        if columns.get(field) is not None:
+            columns[field] = get_interner(model_class, field).intern_many(columns[field])
+
+
+def interning_report(models):
+    """
+    Report the memory interning saves across a collection of models.
+
+    Without interning every value of a deserialized record is its own
+    string object; the saving is the size of those copies minus the size
+    of the distinct objects actually referenced.
+
+    Args:
+        models: Iterable of User or Product objects
+
+    Returns:
+        Dictionary mapping "Class.field" to a dictionary with 'values',
+        'distinct_objects', 'bytes_without_interning', 'bytes_used' and
+        'bytes_saved'
+    """
+    report = {}
+    totals = {}
+    for model in models:
+        model_class = type(model)
+        for field in model_class._interned_fields:
+            value = getattr(model, field)
+            if type(value) is not str:
+                continue
+            key = f"{model_class.__name__}.{field}"
+            entry = totals.get(key)
+            if entry is None:
+                entry = totals[key] = [0, 0, {}]
+            size = sys.getsizeof(value)
+            entry[0] += 1
+            entry[1] += size
+            entry[2][id(value)] = size
+
+    for key, (count, total_bytes, distinct) in totals.items():
+        used = sum(distinct.values())
+        report[key] = {
+            'values': count,
+            'distinct_objects': len(distinct),
+            'bytes_without_interning': total_bytes,
+            'bytes_used': used,
+            'bytes_saved': total_bytes - used
+        }
+    return report
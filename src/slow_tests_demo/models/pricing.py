@@ -0,0 +1,239 @@
+"""Declarative pricing rules evaluated over whole catalogs at once."""
+import time
+import random
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.models.validation import record_columns
+
+
+RULE_KINDS = ('percentage', 'fixed', 'cap')
+
+
+class PricingRule:
+    """
+    One declarative pricing rule.
+
+    A rule matches products whose category is one of ``categories`` (any
+    category if None) and whose price lies in ``[min_price, max_price)``,
+    and only while ``starts_at <= now < ends_at``. A matching product's
+    price is then reduced by a percentage (as ``Product.apply_discount``
+    does), reduced by a fixed amount (never below zero), or capped.
+    """
+
+    def __init__(self, name, kind, amount, categories=None, min_price=None, max_price=None,
+                 starts_at=None, ends_at=None):
+        """
+        Initialize a rule.
+
+        Args:
+            name: Name reported for the products the rule prices
+            kind: 'percentage', 'fixed' or 'cap'
+            amount: Discount percentage (0-100), amount subtracted, or price cap
+            categories: Categories the rule applies to (all if None)
+            min_price: Inclusive lower bound of the price band (unbounded if None)
+            max_price: Exclusive upper bound of the price band (unbounded if None)
+            starts_at: Timestamp the rule becomes active (always active if None)
+            ends_at: Timestamp the rule stops being active (never expires if None)
+        """
+        if kind not in RULE_KINDS:
+            raise ValueError(f"Rule kind must be one of {', '.join(RULE_KINDS)}")
+        if kind == 'percentage' and not 0 <= amount <= 100:
+            raise ValueError("Discount percentage must be between 0 and 100")
+        if kind != 'percentage' and amount < 0:
+            raise ValueError(f"Amount for a {kind} rule must be non-negative")
+
+        self.name = name
+        self.kind = kind
+        self.amount = amount
+        self.categories = None if categories is None else list(categories)
+        self.min_price = min_price
+        self.max_price = max_price
+        self.starts_at = starts_at
+        self.ends_at = ends_at
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a rule from a dictionary, e.g. one entry of a JSON rule file.
+
+        Args:
+            data: Dictionary with the constructor's arguments as keys
+
+        Returns:
+            PricingRule instance
+        """
+        return cls(**data)
+
+    def to_dict(self):
+        """Convert the rule to a dictionary accepted by ``from_dict``."""
+        return {
+            'name': self.name,
+            'kind': self.kind,
+            'amount': self.amount,
+            'categories': self.categories,
+            'min_price': self.min_price,
+            'max_price': self.max_price,
+            'starts_at': self.starts_at,
+            'ends_at': self.ends_at
+        }
+
+    def is_active(self, now):
+        """Whether the rule's time window contains ``now``."""
+        return ((self.starts_at is None or self.starts_at <= now)
+                and (self.ends_at is None or now < self.ends_at))
+
+    def apply(self, prices):
+        """
+        Compute new prices for products the rule matches.
+
+        Args:
+            prices: Array of current prices
+
+        Returns:
+            Array of new prices
+        """
+        if self.kind == 'percentage':
+            return prices * (1 - self.amount / 100)
+        if self.kind == 'fixed':
+            return np.maximum(prices - self.amount, 0)
+        return np.minimum(prices, self.amount)
+
+
+class PricingResult:
+    """
+    New prices for a catalog and the rule that produced each one.
+
+    ``rule_index`` holds, per product, the position of the rule that fired
+    in the engine's rule list, or -1 where no rule matched and the price
+    is unchanged.
+    """
+
+    def __init__(self, prices, rule_index, rule_names):
+        """
+        Initialize a result.
+
+        Args:
+            prices: Array of new prices
+            rule_index: Array of fired rule positions (-1 for none)
+            rule_names: Names of the engine's rules, in order
+        """
+        self.prices = prices
+        self.rule_index = rule_index
+        self.rule_names = list(rule_names)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def fired(self):
+        """Object array with the name of the rule that fired per product, None for none."""
+        # The last slot is picked by index -1
+        names = np.array(self.rule_names + [None], dtype=object)
+        return names[self.rule_index]
+
+    def fired_rule(self, index):
+        """Name of the rule that priced one product, or None."""
+        position = self.rule_index[index]
+        return None if position < 0 else self.rule_names[position]
+
+    def counts(self):
+        """Return the number of products each rule priced, with None for unmatched ones."""
+        counts = np.bincount(self.rule_index + 1, minlength=len(self.rule_names) + 1)
+        result = {name: int(count) for name, count in zip(self.rule_names, counts[1:])}
+        result[None] = int(counts[0])
+        return result
+
+
+class PricingEngine:
+    """
+    Evaluate an ordered list of pricing rules over a whole catalog.
+
+    Rules are tried in order and the first one matching a product prices
+    it, so tiers are written from the most to the least specific. Each
+    rule is evaluated as boolean masks over the price and category
+    arrays; categories are compared as integer codes.
+    """
+
+    def __init__(self, rules):
+        """
+        Initialize an engine.
+
+        Args:
+            rules: Iterable of PricingRule objects or dictionaries
+        """
+        self.rules = [rule if isinstance(rule, PricingRule) else PricingRule.from_dict(rule)
+                      for rule in rules]
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Rule names must be unique")
+
+    def price(self, products, now=None, delay=False):
+        """
+        Price every product in one call.
+
+        Args:
+            products: ProductTable, DataFrame, dictionary of columns, or
+                list of Product objects or dictionaries, with 'price' and
+                'category' fields
+            now: Timestamp deciding which rules are active (current time if None)
+            delay: Whether to add an artificial delay
+
+        Returns:
+            PricingResult
+        """
+        if delay:
+            time.sleep(random.uniform(0.2, 0.5))
+
+        columns, length = record_columns(products, ('price', 'category'))
+        return self.price_arrays(columns['price'], columns['category'], now=now)
+
+    def price_arrays(self, prices, categories=None, now=None):
+        """
+        Price products given as parallel arrays.
+
+        Args:
+            prices: Sequence of prices; None and NaN prices are never matched
+            categories: Sequence of categories or a pandas Categorical
+                (no category for any product if None)
+            now: Timestamp deciding which rules are active (current time if None)
+
+        Returns:
+            PricingResult
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if categories is None:
+            categories = pd.Categorical([None] * len(prices))
+        elif not isinstance(categories, pd.Categorical):
+            categories = pd.Categorical(np.asarray(categories, dtype=object))
+        if len(categories) != len(prices):
+            raise ValueError("prices and categories must have the same length")
+        now = time.time() if now is None else now
+
+        codes = categories.codes
+        new_prices = prices.copy()
+        rule_index = np.full(len(prices), -1, dtype=np.int32)
+        # NaN compares false, so unpriced products never match a band
+        unmatched = ~np.isnan(prices)
+
+        for position, rule in enumerate(self.rules):
+            if not rule.is_active(now):
+                continue
+            mask = unmatched.copy()
+            if rule.min_price is not None:
+                mask &= prices >= rule.min_price
+            if rule.max_price is not None:
+                mask &= prices < rule.max_price
+            if rule.categories is not None:
+                rule_codes = categories.categories.get_indexer(rule.categories)
+                mask &= np.isin(codes, rule_codes[rule_codes >= 0])
+
+            selected = np.flatnonzero(mask)
+            if not len(selected):
+                continue
+            new_prices[selected] = rule.apply(prices[selected])
+            rule_index[selected] = position
+            unmatched[selected] = False
+            if not unmatched.any():
+                break
+
+        return PricingResult(new_prices, rule_index, [rule.name for rule in self.rules])
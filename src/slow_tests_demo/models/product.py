@@ -1,12 +1,23 @@
 """Product model."""
 import time
 import random
-import uuid
+from operator import attrgetter
 
+from slow_tests_demo.models.ids import generate_id, fill_ids
+from slow_tests_demo.models.caching import CachedSerialization
+from slow_tests_demo.models.interning import get_interner, intern_columns
 
-class Product:
+
+class Product(CachedSerialization):
     """Product model class."""
     
+    # No per-instance __dict__: millions of instances are kept resident
+    __slots__ = ('id', 'name', 'price', 'description', 'category', 'created_at')
+    _fields = __slots__
+    _snapshot = attrgetter(*__slots__)
+    # Few distinct values repeated across many records; see models.interning
+    _interned_fields = ('description', 'category')
+    
     def __init__(self, name, price, description=None, category=None, delay=False):
         """
         Initialize a new Product.
@@ -21,7 +32,7 @@ class Product:
         if delay:
             time.sleep(random.uniform(0.1, 0.4))
         
-        self.id = str(uuid.uuid4())
+        self.id = generate_id()
         self.name = name
         self.price = price
         self.description = description
@@ -65,17 +76,121 @@ class Product:
         if delay:
             time.sleep(random.uniform(0.1, 0.3))
         
-        product = cls(
-            name=data['name'],
-            price=data['price'],
-            description=data.get('description'),
-            category=data.get('category')
-        )
-        product.id = data.get('id', product.id)
-        product.created_at = data.get('created_at', product.created_at)
+        product = cls.__new__(cls)
+        product.name = data['name']
+        product.price = data['price']
+        product.description = _intern_description(data.get('description'))
+        product.category = _intern_category(data.get('category'))
+        # Only generate an id and timestamp when the record has none (missing
+        # or None), as the bulk constructors do
+        product.id = data.get('id')
+        if product.id is None:
+            product.id = generate_id()
+        product.created_at = data.get('created_at')
+        if product.created_at is None:
+            product.created_at = time.time()
         
         return product
     
+    @classmethod
+    def from_dicts(cls, records, delay=False):
+        """
+        Create many Products from dictionaries.
+        
+        Ids and timestamps are only generated for records that lack them,
+        and missing ids are allocated in one block.
+        
+        Args:
+            records: Iterable of dictionaries with product data
+            delay: Whether to add an artificial delay
+        
+        Returns:
+            List of Product instances
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.3))
+        
+        records = list(records)
+        columns = {field: [record[field] for record in records] for field in ('name', 'price')}
+        for field in ('id', 'description', 'category', 'created_at'):
+            columns[field] = [record.get(field) for record in records]
+        return cls.from_columns(columns)
+    
+    @classmethod
+    def from_columns(cls, columns, delay=False):
+        """
+        Create many Products from a dictionary of columns.
+        
+        Allocating millions of objects triggers repeated cyclic garbage
+        collections that find nothing to free. The collector is process-wide,
+        so it is left alone here; a caller loading in a single thread can
+        raise its threshold around the call (see
+        ``benchmarks/bench_model_loading.py``).
+        
+        Args:
+            columns: Dictionary mapping field names to equal-length sequences;
+                'name' and 'price' are required, and None entries in the 'id' and
+                'created_at' columns are filled in
+            delay: Whether to add an artificial delay
+        
+        Returns:
+            List of Product instances
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.3))
+        
+        values = {}
+        for field in cls.__slots__:
+            column = columns.get(field)
+            if column is not None:
+                values[field] = column.tolist() if hasattr(column, 'tolist') else list(column)
+        length = len(values['name'])
+        if any(len(column) != length for column in values.values()):
+            raise ValueError("All columns must have the same length")
+        
+        values['id'] = fill_ids(values.get('id') or [None] * length)
+        now = time.time()
+        values['created_at'] = [now if value is None else value
+                                for value in values.get('created_at') or [None] * length]
+        
+        intern_columns(cls, values)
+        
+        new = cls.__new__
+        products = []
+        for id_, name, price, description, category, created_at in zip(
+                *(values.get(field) or [None] * length for field in cls.__slots__)):
+            product = new(cls)
+            product.id = id_
+            product.name = name
+            product.price = price
+            product.description = description
+            product.category = category
+            product.created_at = created_at
+            products.append(product)
+        return products
+    
+    @classmethod
+    def from_dataframe(cls, df, delay=False):
+        """
+        Create many Products from a DataFrame with the model's field names as columns.
+        
+        Missing values become None.
+        
+        Args:
+            df: pandas DataFrame
+            delay: Whether to add an artificial delay
+        
+        Returns:
+            List of Product instances
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.3))
+        
+        return cls.from_columns({
+            field: df[field].astype(object).where(df[field].notna(), None).tolist()
+            for field in cls.__slots__ if field in df
+        })
+    
     def validate(self, delay=False):
         """
         Validate product data.
@@ -116,3 +231,7 @@ class Product:
         
         discount_factor = 1 - (percentage / 100)
         return self.price * discount_factor
+
+
+_intern_description = get_interner(Product, 'description').intern
+_intern_category = get_interner(Product, 'category').intern
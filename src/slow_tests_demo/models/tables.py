@@ -0,0 +1,346 @@
+"""Column-oriented collections of users and products."""
+import time
+import random
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.models.ids import generate_ids, fill_ids
+from slow_tests_demo.models.interning import get_interner
+from slow_tests_demo.models.user import User
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.validation import validate_users, validate_products
+
+
+_AGGREGATIONS = ('sum', 'mean', 'min', 'max', 'count')
+
+
+def _object_array(values, length):
+    """Build a 1-d object array, filling with None when values is None."""
+    array = np.empty(length, dtype=object)
+    if values is not None:
+        array[:] = list(values)
+    return array
+
+
+class _ModelTable:
+    """
+    Struct-of-arrays storage for model instances.
+
+    Subclasses list their model's fields in ``_fields`` and say which are
+    float columns and which are categorical; every other field is kept in
+    a numpy object array.
+    """
+
+    _model = None
+    _fields = ()
+    _float_fields = ()
+    _categorical_fields = ()
+
+    def __init__(self, columns, intern=True):
+        lengths = {len(values) for values in columns.values() if values is not None}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        length = lengths.pop() if lengths else 0
+
+        self.columns = {}
+        for field in self._fields:
+            values = columns.get(field)
+            if field == 'id' and values is None:
+                values = generate_ids(length)
+            if field == 'created_at' and values is None:
+                values = np.full(length, time.time())
+
+            if field in self._float_fields or field == 'created_at':
+                column = np.asarray(values if values is not None else np.full(length, np.nan),
+                                    dtype=np.float64)
+            elif field in self._categorical_fields:
+                column = values if isinstance(values, pd.Categorical) else pd.Categorical(
+                    _object_array(values, length))
+            else:
+                if intern and values is not None and field in self._model._interned_fields:
+                    values = get_interner(self._model, field).intern_many(values)
+                column = _object_array(values, length)
+            self.columns[field] = column
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    def __getitem__(self, key):
+        """
+        Index the table.
+
+        Args:
+            key: Field name (returns the column), integer (returns a model
+                object), or slice, boolean mask or index array (returns a
+                new table)
+        """
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, (int, np.integer)):
+            return self._make_object({field: column[key] for field, column in self.columns.items()})
+        return self.filter(key)
+
+    def filter(self, mask):
+        """
+        Select rows.
+
+        Args:
+            mask: Boolean mask, index array or slice
+
+        Returns:
+            New table holding the selected rows
+        """
+        if not isinstance(mask, slice):
+            mask = np.asarray(mask)
+        # The selected values were interned when this table was built
+        return type(self)._from_columns({field: column[mask]
+                                         for field, column in self.columns.items()},
+                                        intern=False)
+
+    @classmethod
+    def _from_columns(cls, columns, intern=True):
+        table = cls.__new__(cls)
+        _ModelTable.__init__(table, columns, intern=intern)
+        return table
+
+    @classmethod
+    def _make_object(cls, values):
+        obj = cls._model.__new__(cls._model)
+        for field in cls._fields:
+            value = values[field]
+            if isinstance(value, float) and np.isnan(value) and field in cls._categorical_fields:
+                value = None
+            setattr(obj, field, value.item() if isinstance(value, np.generic) else value)
+        return obj
+
+    @classmethod
+    def from_objects(cls, objects):
+        """
+        Build a table from model objects.
+
+        Args:
+            objects: Iterable of model instances
+
+        Returns:
+            New table
+        """
+        objects = list(objects)
+        return cls._from_columns({field: [getattr(obj, field) for obj in objects]
+                                  for field in cls._fields})
+
+    @classmethod
+    def from_dicts(cls, records):
+        """
+        Build a table from dictionaries shaped like ``to_dict`` output.
+
+        Missing ids and creation times are generated as the model would.
+
+        Args:
+            records: Iterable of dictionaries
+
+        Returns:
+            New table
+        """
+        records = list(records)
+        columns = {}
+        for field in cls._fields:
+            values = [record.get(field) for record in records]
+            if field in ('id', 'created_at') and any(value is None for value in values):
+                if all(value is None for value in values):
+                    continue
+                if field == 'id':
+                    values = fill_ids(values)
+                else:
+                    now = time.time()
+                    values = [now if value is None else value for value in values]
+            columns[field] = values
+        return cls._from_columns(columns)
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        Build a table from a DataFrame with the model's field names as columns.
+
+        Args:
+            df: pandas DataFrame
+
+        Returns:
+            New table
+        """
+        columns = {}
+        for field in cls._fields:
+            if field not in df:
+                continue
+            series = df[field]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                columns[field] = series.array
+            elif field in cls._float_fields or field == 'created_at':
+                columns[field] = series.to_numpy(dtype=np.float64)
+            else:
+                # Missing values are None, as in Model.from_dataframe
+                values = series.to_numpy(dtype=object, copy=True)
+                values[pd.isna(values)] = None
+                columns[field] = values
+        return cls._from_columns(columns)
+
+    def to_objects(self):
+        """Convert the rows to model objects."""
+        return [self._make_object(dict(zip(self._fields, row))) for row in self._rows()]
+
+    def to_dicts(self):
+        """Convert the rows to dictionaries shaped like the model's ``to_dict``."""
+        return [dict(zip(self._fields, row)) for row in self._rows()]
+
+    def to_dataframe(self):
+        """Convert the table to a DataFrame; categorical fields stay categorical."""
+        return pd.DataFrame({field: self.columns[field] for field in self._fields})
+
+    def _rows(self):
+        lists = []
+        for field in self._fields:
+            column = self.columns[field]
+            if isinstance(column, pd.Categorical):
+                lists.append([None if value != value else value for value in column.tolist()])
+            else:
+                lists.append(column.tolist())
+        return zip(*lists)
+
+
+class ProductTable(_ModelTable):
+    """Column-oriented collection of products."""
+
+    _model = Product
+    _fields = ('id', 'name', 'price', 'description', 'category', 'created_at')
+    _float_fields = ('price',)
+    _categorical_fields = ('category',)
+
+    def __init__(self, names, prices, descriptions=None, categories=None, ids=None,
+                 created_at=None, delay=False):
+        """
+        Initialize a table from columns.
+
+        Args:
+            names: Product names
+            prices: Product prices
+            descriptions: Product descriptions (None for all if omitted)
+            categories: Product categories, stored as a pandas Categorical
+            ids: Product ids (generated if omitted)
+            created_at: Creation timestamps (now if omitted)
+            delay: Whether to add an artificial delay
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.4))
+
+        super().__init__({
+            'id': ids,
+            'name': names,
+            'price': prices,
+            'description': descriptions,
+            'category': categories,
+            'created_at': created_at
+        })
+
+    def validate(self, delay=False):
+        """
+        Validate every product at once.
+
+        Args:
+            delay: Whether to add an artificial delay
+
+        Returns:
+            True if all rows are valid, raises ValueError otherwise
+        """
+        if delay:
+            time.sleep(random.uniform(0.2, 0.5))
+
+        validate_products(self).raise_first()
+        return True
+
+    def apply_discount(self, percentage, delay=False):
+        """
+        Apply a discount to every price.
+
+        Args:
+            percentage: Discount percentage (0-100), a scalar or one per row
+            delay: Whether to add an artificial delay
+
+        Returns:
+            Array of discounted prices
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.4))
+
+        percentage = np.asarray(percentage, dtype=np.float64)
+        if np.any((percentage < 0) | (percentage > 100)):
+            raise ValueError("Discount percentage must be between 0 and 100")
+
+        return self.columns['price'] * (1 - percentage / 100)
+
+    def aggregate_prices(self, func='sum'):
+        """
+        Aggregate prices per category.
+
+        Args:
+            func: 'sum', 'mean', 'min', 'max' or 'count'
+
+        Returns:
+            Dictionary mapping each category (None for missing) to the result
+        """
+        if func not in _AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation: {func}")
+
+        categories = self.columns['category']
+        codes = categories.codes
+        result = pd.Series(self.columns['price']).groupby(codes).agg(func)
+        names = list(categories.categories)
+        keys = [names[code] if code >= 0 else None for code in result.index]
+        return dict(zip(keys, result.tolist()))
+
+
+class UserTable(_ModelTable):
+    """Column-oriented collection of users."""
+
+    _model = User
+    _fields = ('id', 'username', 'email', 'first_name', 'last_name', 'created_at')
+
+    def __init__(self, usernames, emails, first_names=None, last_names=None, ids=None,
+                 created_at=None, delay=False):
+        """
+        Initialize a table from columns.
+
+        Args:
+            usernames: Usernames
+            emails: Email addresses
+            first_names: First names (None for all if omitted)
+            last_names: Last names (None for all if omitted)
+            ids: User ids (generated if omitted)
+            created_at: Creation timestamps (now if omitted)
+            delay: Whether to add an artificial delay
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.4))
+
+        super().__init__({
+            'id': ids,
+            'username': usernames,
+            'email': emails,
+            'first_name': first_names,
+            'last_name': last_names,
+            'created_at': created_at
+        })
+
+    def validate(self, delay=False):
+        """
+        Validate every user at once.
+
+        Args:
+            delay: Whether to add an artificial delay
+
+        Returns:
+            True if all rows are valid, raises ValueError otherwise
+        """
+        if delay:
+            time.sleep(random.uniform(0.2, 0.5))
+
+        validate_users(self).raise_first()
+        return True
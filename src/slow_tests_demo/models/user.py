@@ -1,12 +1,23 @@
 """User model."""
 import time
 import random
-import uuid
+from operator import attrgetter
 
+from slow_tests_demo.models.ids import generate_id, fill_ids
+from slow_tests_demo.models.caching import CachedSerialization
+from slow_tests_demo.models.interning import get_interner, intern_columns
 
-class User:
+
+class User(CachedSerialization):
     """User model class."""
     
+    # No per-instance __dict__: millions of instances are kept resident
+    __slots__ = ('id', 'username', 'email', 'first_name', 'last_name', 'created_at')
+    _fields = __slots__
+    _snapshot = attrgetter(*__slots__)
+    # Few distinct values repeated across many records; see models.interning
+    _interned_fields = ('first_name', 'last_name')
+    
     def __init__(self, username, email, first_name=None, last_name=None, delay=False):
         """
         Initialize a new User.
@@ -21,7 +32,7 @@ class User:
         if delay:
             time.sleep(random.uniform(0.1, 0.4))
         
-        self.id = str(uuid.uuid4())
+        self.id = generate_id()
         self.username = username
         self.email = email
         self.first_name = first_name
@@ -65,17 +76,121 @@ class User:
         if delay:
             time.sleep(random.uniform(0.1, 0.3))
         
-        user = cls(
-            username=data['username'],
-            email=data['email'],
-            first_name=data.get('first_name'),
-            last_name=data.get('last_name')
-        )
-        user.id = data.get('id', user.id)
-        user.created_at = data.get('created_at', user.created_at)
+        user = cls.__new__(cls)
+        user.username = data['username']
+        user.email = data['email']
+        user.first_name = _intern_first_name(data.get('first_name'))
+        user.last_name = _intern_last_name(data.get('last_name'))
+        # Only generate an id and timestamp when the record has none (missing
+        # or None), as the bulk constructors do
+        user.id = data.get('id')
+        if user.id is None:
+            user.id = generate_id()
+        user.created_at = data.get('created_at')
+        if user.created_at is None:
+            user.created_at = time.time()
         
         return user
     
+    @classmethod
+    def from_dicts(cls, records, delay=False):
+        """
+        Create many Users from dictionaries.
+        
+        Ids and timestamps are only generated for records that lack them,
+        and missing ids are allocated in one block.
+        
+        Args:
+            records: Iterable of dictionaries with user data
+            delay: Whether to add an artificial delay
+        
+        Returns:
+            List of User instances
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.3))
+        
+        records = list(records)
+        columns = {field: [record[field] for record in records] for field in ('username', 'email')}
+        for field in ('id', 'first_name', 'last_name', 'created_at'):
+            columns[field] = [record.get(field) for record in records]
+        return cls.from_columns(columns)
+    
+    @classmethod
+    def from_columns(cls, columns, delay=False):
+        """
+        Create many Users from a dictionary of columns.
+        
+        Allocating millions of objects triggers repeated cyclic garbage
+        collections that find nothing to free. The collector is process-wide,
+        so it is left alone here; a caller loading in a single thread can
+        raise its threshold around the call (see
+        ``benchmarks/bench_model_loading.py``).
+        
+        Args:
+            columns: Dictionary mapping field names to equal-length sequences;
+                'username' and 'email' are required, and None entries in the 'id' and
+                'created_at' columns are filled in
+            delay: Whether to add an artificial delay
+        
+        Returns:
+            List of User instances
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.3))
+        
+        values = {}
+        for field in cls.__slots__:
+            column = columns.get(field)
+            if column is not None:
+                values[field] = column.tolist() if hasattr(column, 'tolist') else list(column)
+        length = len(values['username'])
+        if any(len(column) != length for column in values.values()):
+            raise ValueError("All columns must have the same length")
+        
+        values['id'] = fill_ids(values.get('id') or [None] * length)
+        now = time.time()
+        values['created_at'] = [now if value is None else value
+                                for value in values.get('created_at') or [None] * length]
+        
+        intern_columns(cls, values)
+        
+        new = cls.__new__
+        users = []
+        for id_, username, email, first_name, last_name, created_at in zip(
+                *(values.get(field) or [None] * length for field in cls.__slots__)):
+            user = new(cls)
+            user.id = id_
+            user.username = username
+            user.email = email
+            user.first_name = first_name
+            user.last_name = last_name
+            user.created_at = created_at
+            users.append(user)
+        return users
+    
+    @classmethod
+    def from_dataframe(cls, df, delay=False):
+        """
+        Create many Users from a DataFrame with the model's field names as columns.
+        
+        Missing values become None.
+        
+        Args:
+            df: pandas DataFrame
+            delay: Whether to add an artificial delay
+        
+        Returns:
+            List of User instances
+        """
+        if delay:
+            time.sleep(random.uniform(0.1, 0.3))
+        
+        return cls.from_columns({
+            field: df[field].astype(object).where(df[field].notna(), None).tolist()
+            for field in cls.__slots__ if field in df
+        })
+    
     def validate(self, delay=False):
         """
         Validate user data.
@@ -96,3 +211,7 @@ class User:
             raise ValueError("Invalid email address")
         
         return True
+
+
+_intern_first_name = get_interner(User, 'first_name').intern
+_intern_last_name = get_interner(User, 'last_name').intern
@@ -0,0 +1,210 @@
+"""Batch validation of many user or product records at once."""
+import time
+import random
+import numpy as np
+import pandas as pd
+
+
+USERNAME_MESSAGE = "Username must be at least 3 characters long"
+
+EMAIL_MESSAGE = "Invalid email address"
+
+PRODUCT_NAME_MESSAGE = "Product name must be at least 2 characters long"
+
+PRODUCT_PRICE_MESSAGE = "Product price must be a non-negative number"
+
+# Python and numpy number types; booleans and numeric strings are not prices
+_NUMBER_TYPES = frozenset([int, float] + [
+    scalar for scalar in set(np.sctypeDict.values())
+    if issubclass(scalar, (np.integer, np.floating)) and not issubclass(scalar, np.timedelta64)
+])
+
+
+class ValidationResult:
+    """
+    Per-record outcome of a batch validation.
+
+    ``errors`` maps each rule's message to a boolean mask of the records
+    that break it; ``invalid`` is the union of those masks.
+    """
+
+    def __init__(self, errors, length):
+        """
+        Initialize a result.
+
+        Args:
+            errors: Dictionary mapping error messages to boolean masks
+            length: Number of validated records
+        """
+        self.errors = errors
+        self.invalid = np.zeros(length, dtype=bool)
+        for mask in errors.values():
+            self.invalid |= mask
+
+    def __len__(self):
+        return len(self.invalid)
+
+    @property
+    def valid(self):
+        """Boolean mask of records that passed every rule."""
+        return ~self.invalid
+
+    @property
+    def all_valid(self):
+        """Whether every record passed every rule."""
+        return not self.invalid.any()
+
+    def reasons(self, index):
+        """
+        List the error messages for one record.
+
+        Args:
+            index: Position of the record
+
+        Returns:
+            List of messages, empty for a valid record
+        """
+        return [message for message, mask in self.errors.items() if mask[index]]
+
+    def iter_errors(self):
+        """Yield (index, messages) for every invalid record, in order."""
+        for index in np.flatnonzero(self.invalid):
+            yield int(index), self.reasons(index)
+
+    def summary(self):
+        """Return the number of records breaking each rule."""
+        return {message: int(mask.sum()) for message, mask in self.errors.items()}
+
+    def raise_first(self):
+        """
+        Raise ValueError for the first failing rule, as ``validate`` does.
+
+        The message is the model's, followed by how many records break the
+        rule and the first one's index.
+        """
+        for message, mask in self.errors.items():
+            if mask.any():
+                rows = np.flatnonzero(mask)
+                raise ValueError(f"{message} ({len(rows)} rows, first at index {rows[0]})")
+
+
+def string_lengths(values):
+    """
+    Length of each value, 0 for None, empty and non-string values.
+
+    Args:
+        values: Sequence of strings or None
+
+    Returns:
+        int64 array of lengths
+    """
+    # np.fromiter over the values is faster than the pandas .str accessor
+    return np.fromiter((len(value) if isinstance(value, str) else 0 for value in values),
+                       dtype=np.int64, count=len(values))
+
+
+def contains(values, substring):
+    """Boolean mask of the string values that contain ``substring``."""
+    return np.fromiter((isinstance(value, str) and substring in value for value in values),
+                       dtype=bool, count=len(values))
+
+
+def record_columns(records, fields):
+    """
+    Extract field columns from objects, dicts, a column mapping, a table or a DataFrame.
+
+    Args:
+        records: Records in any of the supported layouts
+        fields: Field names to extract; missing fields become None
+
+    Returns:
+        Tuple of (dictionary of field name to sequence, record count)
+    """
+    if isinstance(records, pd.DataFrame):
+        columns = {field: records[field].to_numpy(dtype=object) if field in records
+                   else [None] * len(records) for field in fields}
+        return columns, len(records)
+
+    table_columns = getattr(records, 'columns', None)
+    if isinstance(table_columns, dict):
+        # ProductTable / UserTable
+        records = table_columns
+
+    if isinstance(records, dict):
+        lengths = {len(values) for values in records.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        length = lengths.pop() if lengths else 0
+        return {field: records.get(field, [None] * length) for field in fields}, length
+
+    records = list(records)
+    if records and isinstance(records[0], dict):
+        return {field: [record.get(field) for record in records] for field in fields}, len(records)
+    return {field: [getattr(record, field, None) for record in records]
+            for field in fields}, len(records)
+
+
+def _price_array(values, length):
+    """Convert a price column to floats, with NaN for anything but a number."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'iuf':
+        return values.astype(np.float64)
+    numeric = np.fromiter(map(_NUMBER_TYPES.__contains__, map(type, values)), dtype=bool,
+                          count=length)
+    if numeric.all():
+        return np.asarray(values, dtype=np.float64)
+    prices = np.full(length, np.nan)
+    prices[numeric] = np.asarray(values, dtype=object)[numeric].astype(np.float64)
+    return prices
+
+
+def validate_users(records, delay=False):
+    """
+    Validate many users without raising.
+
+    Applies the same rules as ``User.validate``: a username of at least
+    three characters and an email address containing '@'.
+
+    Args:
+        records: List of User objects or dictionaries, a dictionary of
+            columns, a UserTable or a DataFrame
+        delay: Whether to add an artificial delay
+
+    Returns:
+        ValidationResult
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+
+    columns, length = record_columns(records, ('username', 'email'))
+    return ValidationResult({
+        USERNAME_MESSAGE: string_lengths(columns['username']) < 3,
+        EMAIL_MESSAGE: ~contains(columns['email'], '@')
+    }, length)
+
+
+def validate_products(records, delay=False):
+    """
+    Validate many products without raising.
+
+    Applies the same rules as ``Product.validate``: a name of at least two
+    characters and a non-negative numeric price. Missing, NaN and
+    non-numeric prices, including numeric strings and booleans, are all
+    reported as invalid.
+
+    Args:
+        records: List of Product objects or dictionaries, a dictionary of
+            columns, a ProductTable or a DataFrame
+        delay: Whether to add an artificial delay
+
+    Returns:
+        ValidationResult
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+
+    columns, length = record_columns(records, ('name', 'price'))
+    return ValidationResult({
+        PRODUCT_NAME_MESSAGE: string_lengths(columns['name']) < 2,
+        # Written as a negation so that NaN prices are invalid
+        PRODUCT_PRICE_MESSAGE: ~(_price_array(columns['price'], length) >= 0)
+    }, length)
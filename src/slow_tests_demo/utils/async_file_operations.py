@@ -0,0 +1,145 @@
+"""Asyncio variants of the file operations."""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from slow_tests_demo.utils.file_operations import (
+    read_json_file, write_json_file, read_csv_file, write_csv_file, read_file
+)
+
+
+DEFAULT_MAX_WORKERS = 8
+
+DEFAULT_CONCURRENCY = 32
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the shared bounded executor used for blocking file I/O."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS,
+                                           thread_name_prefix='file-io')
+        return _executor
+
+
+def configure_executor(max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Replace the shared executor with one of a different size.
+
+    Args:
+        max_workers: Maximum number of threads doing file I/O at once
+    """
+    global _executor
+    with _executor_lock:
+        previous, _executor = _executor, ThreadPoolExecutor(max_workers=max_workers,
+                                                            thread_name_prefix='file-io')
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+async def _run_blocking(func, *args, executor=None, **kwargs):
+    """
+    Run a blocking call on the executor without blocking the event loop.
+
+    Cancelling the awaiting task cancels the call if it has not started;
+    a call that is already running finishes in its thread and its result
+    is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(executor or get_executor(), call)
+
+
+async def read_json_file_async(filepath, executor=None, **kwargs):
+    """
+    Read a JSON file without blocking the event loop.
+
+    Args:
+        filepath: Path to the JSON file
+        executor: Executor to run on (the shared bounded executor if None)
+        **kwargs: Keyword arguments for ``read_json_file``
+
+    Returns:
+        Parsed JSON data
+    """
+    return await _run_blocking(read_json_file, filepath, executor=executor, **kwargs)
+
+
+async def write_json_file_async(data, filepath, executor=None, **kwargs):
+    """
+    Write data to a JSON file without blocking the event loop.
+
+    Args:
+        data: Data to write
+        filepath: Path to the JSON file
+        executor: Executor to run on (the shared bounded executor if None)
+        **kwargs: Keyword arguments for ``write_json_file``
+    """
+    return await _run_blocking(write_json_file, data, filepath, executor=executor, **kwargs)
+
+
+async def read_csv_file_async(filepath, executor=None, **kwargs):
+    """
+    Read a CSV file without blocking the event loop.
+
+    Args:
+        filepath: Path to the CSV file
+        executor: Executor to run on (the shared bounded executor if None)
+        **kwargs: Keyword arguments for ``read_csv_file``
+
+    Returns:
+        List of rows from the CSV file
+    """
+    return await _run_blocking(read_csv_file, filepath, executor=executor, **kwargs)
+
+
+async def write_csv_file_async(data, filepath, executor=None, **kwargs):
+    """
+    Write data to a CSV file without blocking the event loop.
+
+    Args:
+        data: List of rows to write
+        filepath: Path to the CSV file
+        executor: Executor to run on (the shared bounded executor if None)
+        **kwargs: Keyword arguments for ``write_csv_file``
+    """
+    return await _run_blocking(write_csv_file, data, filepath, executor=executor, **kwargs)
+
+
+async def read_many_async(filepaths, reader=None, limit=DEFAULT_CONCURRENCY, executor=None,
+                          return_exceptions=False):
+    """
+    Read many files concurrently with a bound on reads in progress.
+
+    Args:
+        filepaths: Iterable of file paths
+        reader: Function used to read each file (``read_file`` if None)
+        limit: Maximum number of files being read at once
+        executor: Executor to run on (the shared bounded executor if None)
+        return_exceptions: Return exceptions in place of results instead
+            of raising the first one
+
+    Returns:
+        List of results in the same order as ``filepaths``
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def read_one(filepath):
+        async with semaphore:
+            return await _run_blocking(reader or read_file, filepath, executor=executor)
+
+    tasks = [asyncio.ensure_future(read_one(filepath)) for filepath in filepaths]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
@@ -0,0 +1,235 @@
+"""Long-lived append writer that flushes batches from a background thread."""
+import io
+import os
+import csv
+import time
+import atexit
+import threading
+
+from slow_tests_demo.utils import serialization
+from slow_tests_demo.utils.file_operations import open_file, detect_format, JSON_ENCODING
+
+
+FSYNC_POLICIES = ('never', 'flush', 'close')
+
+
+class BufferedRecordWriter:
+    """
+    Queue records in memory and append them to a CSV or NDJSON file in batches.
+
+    ``write`` only appends to an in-memory queue; a background thread
+    encodes the queued records and writes them with a single call when
+    ``max_records`` are pending or ``flush_interval`` seconds have passed,
+    whichever comes first. The file stays open for the writer's lifetime.
+
+    Writers block once ``max_pending`` records are queued, so a slow disk
+    applies back-pressure instead of growing the queue without bound.
+    Errors raised while flushing are re-raised by the next call to
+    ``write``, ``flush`` or ``close``. A writer still open when the
+    interpreter exits is closed then, so queued records are not lost with
+    the daemon flush thread.
+    """
+
+    def __init__(self, filepath, file_format=None, headers=None, max_records=10000,
+                 flush_interval=1.0, max_pending=None, fsync='never', delimiter=','):
+        """
+        Open the file for appending and start the flush thread.
+
+        Args:
+            filepath: Path to the CSV or NDJSON file (compression suffixes allowed)
+            file_format: 'csv' or 'ndjson' (detected from the extension if None)
+            headers: CSV header row, written only if the file is new or empty
+            max_records: Number of queued records that triggers a flush
+            flush_interval: Maximum seconds a record waits before being flushed
+            max_pending: Queue length at which ``write`` blocks
+                (``10 * max_records`` if None)
+            fsync: 'never', 'flush' (after every batch) or 'close'
+            delimiter: CSV delimiter
+        """
+        if max_records < 1:
+            raise ValueError("max_records must be at least 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+
+        self.filepath = filepath
+        self.file_format = file_format or detect_format(filepath)
+        if self.file_format not in ('csv', 'ndjson'):
+            raise ValueError(f"Unsupported format for buffered writing: {self.file_format}")
+
+        self.max_records = max_records
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending or 10 * max_records
+        self.fsync = fsync
+        self.delimiter = delimiter
+
+        # Counters reported by stats()
+        self.records_written = 0
+        self.bytes_written = 0
+        self.flushes = 0
+        self.flush_seconds_total = 0.0
+        self.flush_seconds_max = 0.0
+        self.max_queue_depth = 0
+
+        self._pending = []
+        self._enqueued = 0
+        self._flushed = 0
+        self._flush_requested = False
+        self._closed = False
+        self._error = None
+        self._condition = threading.Condition()
+
+        is_new = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+        self._file = open_file(filepath, 'a', newline='',
+                               encoding=JSON_ENCODING if self.file_format == 'ndjson' else None)
+        if headers is not None and is_new and self.file_format == 'csv':
+            self._file.write(self._encode([list(headers)]))
+
+        self._thread = threading.Thread(target=self._run, name='buffered-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"Background flush to {self.filepath} failed") from self._error
+
+    def write(self, record):
+        """
+        Queue one record (a row list for CSV, a JSON-serializable value for NDJSON).
+
+        Args:
+            record: Record to append
+        """
+        self.write_many([record])
+
+    def write_many(self, records):
+        """
+        Queue several records.
+
+        Args:
+            records: Iterable of records to append
+        """
+        records = list(records)
+        with self._condition:
+            self._raise_error()
+            if self._closed:
+                raise ValueError("Cannot write to a closed writer")
+            while len(self._pending) >= self.max_pending and self._error is None:
+                self._condition.wait()
+            self._raise_error()
+
+            self._pending.extend(records)
+            self._enqueued += len(records)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._pending))
+            if len(self._pending) >= self.max_records:
+                self._condition.notify_all()
+
+    def flush(self):
+        """Block until every record queued so far has been written."""
+        with self._condition:
+            target = self._enqueued
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._flushed < target and self._error is None:
+                self._condition.wait()
+            self._raise_error()
+
+    def close(self):
+        """Flush the remaining records, stop the flush thread and close the file."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        atexit.unregister(self.close)
+        self._thread.join()
+
+        try:
+            if self._error is None and self.fsync != 'never':
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+        self._raise_error()
+
+    def _encode(self, batch):
+        if self.file_format == 'csv':
+            buffer = io.StringIO()
+            csv.writer(buffer, delimiter=self.delimiter).writerows(batch)
+            return buffer.getvalue()
+        encode = serialization.get_backend().dumps
+        return '\n'.join(map(encode, batch)) + '\n'
+
+    def _write_batch(self, batch):
+        start = time.perf_counter()
+        text = self._encode(batch)
+        self._file.write(text)
+        self._file.flush()
+        if self.fsync == 'flush':
+            os.fsync(self._file.fileno())
+        seconds = time.perf_counter() - start
+
+        self.records_written += len(batch)
+        self.bytes_written += len(text)
+        self.flushes += 1
+        self.flush_seconds_total += seconds
+        self.flush_seconds_max = max(self.flush_seconds_max, seconds)
+
+    def _run(self):
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            with self._condition:
+                while (not self._closed and not self._flush_requested
+                       and len(self._pending) < self.max_records):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._pending = self._pending, []
+                self._flush_requested = False
+                closing = self._closed
+                # Writers blocked on a full queue can continue
+                self._condition.notify_all()
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    with self._condition:
+                        self._error = e
+                        self._condition.notify_all()
+                    return
+
+            with self._condition:
+                self._flushed += len(batch)
+                self._condition.notify_all()
+
+            if closing:
+                return
+            deadline = time.monotonic() + self.flush_interval
+
+    def stats(self):
+        """
+        Report throughput, flush latency and queue depth.
+
+        Returns:
+            Dictionary of counters
+        """
+        with self._condition:
+            queue_depth = len(self._pending)
+        return {
+            'records_written': self.records_written,
+            'bytes_written': self.bytes_written,
+            'flushes': self.flushes,
+            'flush_seconds_mean': self.flush_seconds_total / self.flushes if self.flushes else 0.0,
+            'flush_seconds_max': self.flush_seconds_max,
+            'queue_depth': queue_depth,
+            'max_queue_depth': self.max_queue_depth
+        }
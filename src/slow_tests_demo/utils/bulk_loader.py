@@ -0,0 +1,162 @@
+"""Concurrent loading of many JSON, NDJSON and CSV files."""
+import os
+import glob
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from slow_tests_demo.utils.file_operations import read_file
+
+
+DEFAULT_WORKERS = 16
+
+
+class LoadResult:
+    """Outcome of loading a single file."""
+
+    __slots__ = ('index', 'path', 'data', 'error')
+
+    def __init__(self, index, path, data=None, error=None):
+        """
+        Initialize a load result.
+
+        Args:
+            index: Position of the file in the input list
+            path: Path to the file
+            data: Parsed contents (None if loading failed)
+            error: Exception raised while loading (None on success)
+        """
+        self.index = index
+        self.path = path
+        self.data = data
+        self.error = error
+
+    @property
+    def ok(self):
+        """Whether the file was loaded successfully."""
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else type(self.error).__name__
+        return f"LoadResult({self.index}, {self.path!r}, {status})"
+
+
+def expand_paths(paths):
+    """
+    Expand a glob pattern or list of paths into a list of file paths.
+
+    Args:
+        paths: A glob pattern string or an iterable of paths
+
+    Returns:
+        List of paths; glob matches are sorted for a stable order
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        return sorted(glob.glob(os.fspath(paths), recursive=True))
+    return list(paths)
+
+
+def _load_one(reader, filepath):
+    """Worker entry point: returns (data, None) or (None, error)."""
+    try:
+        return reader(filepath), None
+    except Exception as e:
+        return None, e
+
+
+def iter_load_files(paths, reader=None, workers=DEFAULT_WORKERS, use_processes=False,
+                    ordered=True, delay=False):
+    """
+    Load many files concurrently and yield one result per file.
+
+    Files are read on a thread pool, which overlaps the per-file open and
+    read latency; ``use_processes=True`` switches to a process pool for
+    parse-heavy files. At most ``4 * workers`` files are submitted ahead
+    of the consumer, so results do not pile up in memory.
+
+    Args:
+        paths: A glob pattern string or an iterable of paths
+        reader: Picklable function taking a path (``read_file`` if None)
+        workers: Number of threads or processes
+        use_processes: Whether to read on a process pool
+        ordered: Yield results in input order instead of as they complete
+        delay: Whether to add an artificial delay
+
+    Yields:
+        LoadResult for every file; errors are reported, not raised
+    """
+    if delay:
+        time.sleep(random.uniform(0.3, 0.7))
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    reader = reader or read_file
+    paths = expand_paths(paths)
+    window = 4 * workers
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+
+    with pool_class(max_workers=workers) as executor:
+        pending = {}
+        next_index = 0
+        next_to_yield = 0
+        done_results = {}
+
+        def submit_more():
+            nonlocal next_index
+            while next_index < len(paths) and len(pending) + len(done_results) < window:
+                future = executor.submit(_load_one, reader, paths[next_index])
+                pending[future] = next_index
+                next_index += 1
+
+        try:
+            submit_more()
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = pending.pop(future)
+                    try:
+                        data, error = future.result()
+                    except Exception as e:
+                        # Raised outside the reader, e.g. an unpicklable result
+                        data, error = None, e
+                    done_results[index] = LoadResult(index, paths[index], data, error)
+
+                if ordered:
+                    while next_to_yield in done_results:
+                        yield done_results.pop(next_to_yield)
+                        next_to_yield += 1
+                else:
+                    for index in sorted(done_results):
+                        yield done_results.pop(index)
+                submit_more()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def load_files(paths, reader=None, workers=DEFAULT_WORKERS, use_processes=False, delay=False):
+    """
+    Load many files concurrently.
+
+    Args:
+        paths: A glob pattern string or an iterable of paths
+        reader: Picklable function taking a path (``read_file`` if None)
+        workers: Number of threads or processes
+        use_processes: Whether to read on a process pool
+        delay: Whether to add an artificial delay
+
+    Returns:
+        Tuple of (results, errors): a dictionary mapping each successfully
+        loaded path to its contents, in input order, and a dictionary
+        mapping each failed path to its exception
+    """
+    results = {}
+    errors = {}
+    for result in iter_load_files(paths, reader=reader, workers=workers,
+                                  use_processes=use_processes, delay=delay):
+        if result.ok:
+            results[result.path] = result.data
+        else:
+            errors[result.path] = result.error
+    return results, errors
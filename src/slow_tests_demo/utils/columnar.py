@@ -0,0 +1,388 @@
+"""Typed columnar readers for tabular files."""
+import time
+import random
+import numpy as np
+import pandas as pd
+from itertools import chain
+from pandas.api.types import union_categoricals
+
+from slow_tests_demo.utils.file_operations import (
+    iter_csv_batches, open_file, DEFAULT_BUFFER_SIZE, WRITE_BUFFER_SIZE
+)
+
+
+COLUMN_TYPES = ('int64', 'float64', 'bool', 'str', 'category')
+
+_TRUE_VALUES = frozenset(['true', '1', 'yes'])
+_FALSE_VALUES = frozenset(['false', '0', 'no'])
+
+
+def _parse_column(values, column_type):
+    """
+    Parse a sequence of strings into a numpy array of the given type.
+
+    Args:
+        values: Sequence of strings
+        column_type: int64, float64, bool or str
+
+    Returns:
+        numpy array; raises ValueError if a value does not fit the type
+    """
+    if column_type == 'int64':
+        return np.array(values, dtype=np.int64)
+
+    if column_type == 'float64':
+        try:
+            return np.array(values, dtype=np.float64)
+        except ValueError:
+            # Empty cells become NaN
+            return np.array([value if value.strip() else 'nan' for value in values],
+                            dtype=np.float64)
+
+    if column_type == 'bool':
+        lowered = {value: value.strip().lower() for value in set(values)}
+        if not all(v in _TRUE_VALUES or v in _FALSE_VALUES for v in lowered.values()):
+            raise ValueError("Column contains non-boolean values")
+        truth = {value: low in _TRUE_VALUES for value, low in lowered.items()}
+        return np.fromiter(map(truth.__getitem__, values), dtype=bool, count=len(values))
+
+    if column_type == 'str':
+        return np.array(values, dtype=str)
+
+    raise ValueError(f"Unknown column type: {column_type}")
+
+
+def _infer_type(values):
+    """Return the narrowest column type that can hold all values."""
+    if not len(values):
+        return 'str'
+    for column_type in ('int64', 'float64', 'bool'):
+        try:
+            _parse_column(values, column_type)
+        except ValueError:
+            continue
+        return column_type
+    return 'str'
+
+
+def infer_schema(headers, rows):
+    """
+    Infer a column schema from sample rows.
+
+    Args:
+        headers: List of column names
+        rows: Sample data rows (lists of strings)
+
+    Returns:
+        Dictionary mapping column names to column types
+    """
+    columns = list(zip(*rows)) if rows else [() for _ in headers]
+    return {name: _infer_type(values) for name, values in zip(headers, columns)}
+
+
+class _ColumnBuilder:
+    """Accumulates parsed batches for one column."""
+
+    def __init__(self, name, column_type, explicit, string_type):
+        """Start an empty column; ``explicit`` types from the schema never widen."""
+        self.name = name
+        self.column_type = column_type
+        self.explicit = explicit
+        self.string_type = string_type
+        self.chunks = []
+        self.categories = {}
+        # Source text of each chunk, kept while the type may still widen so
+        # that earlier chunks are re-parsed rather than converted back to text
+        self.raw = [] if not explicit and column_type not in ('str', 'category') else None
+
+    def _encode(self, values):
+        """Map values to category codes shared across batches."""
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        lookup = np.array([self.categories.setdefault(value, len(self.categories))
+                           for value in uniques], dtype=np.int64)
+        return lookup[codes] if len(codes) else codes.astype(np.int64)
+
+    def _parse(self, values):
+        """Parse one batch of text values as the current column type."""
+        if self.column_type == 'category':
+            return self._encode(values)
+        return _parse_column(values, self.column_type)
+
+    def _promote(self):
+        """Widen the column type (int64 to float64 to a string type)."""
+        if self.column_type == 'int64':
+            self.column_type = 'float64'
+        else:
+            self.column_type = self.string_type
+        # Raises ValueError if an earlier chunk does not fit either
+        self.chunks = [self._parse(values) for values in self.raw]
+        if self.column_type == self.string_type:
+            self.raw = None
+
+    def append(self, values):
+        """Parse and add one batch, widening the column type if it does not fit."""
+        while True:
+            try:
+                parsed = self._parse(values)
+                break
+            except ValueError:
+                if self.explicit or self.column_type in ('str', 'category'):
+                    raise ValueError(f"Column {self.name} does not match type {self.column_type}")
+                self._promote()
+        self.chunks.append(parsed)
+        if self.raw is not None:
+            self.raw.append(values)
+
+    def finish(self):
+        """Concatenate the batches into an array or Categorical."""
+        if self.column_type == 'category':
+            codes = np.concatenate(self.chunks) if self.chunks else np.array([], dtype=np.int64)
+            return pd.Categorical.from_codes(codes, list(self.categories))
+
+        if self.chunks:
+            return np.concatenate(self.chunks)
+        return np.array([], dtype=self.column_type)
+
+
+def _check_schema(schema):
+    """Raise ValueError for unknown column types in a schema."""
+    for name, column_type in schema.items():
+        if column_type not in COLUMN_TYPES:
+            raise ValueError(f"Unknown column type for {name}: {column_type}")
+
+
+def rows_to_columns(headers, batches, schema=None, categorical=False, hints=None):
+    """
+    Convert batches of string rows into typed per-column arrays.
+
+    Args:
+        headers: List of column names
+        batches: Iterable of row lists; types not given in ``schema`` are
+            inferred from the first non-empty batch
+        schema: Dictionary mapping column names to column types
+        categorical: Whether inferred string columns become categoricals
+        hints: Dictionary of starting types for columns not in ``schema``;
+            unlike ``schema`` these are widened when values do not fit
+
+    Returns:
+        Dictionary mapping column names to numpy arrays or pandas Categoricals
+    """
+    schema = dict(schema or {})
+    _check_schema(schema)
+
+    batches = iter(batches)
+    first = next((batch for batch in batches if batch), [])
+
+    inferred = dict(hints) if hints else infer_schema(headers, first)
+    string_type = 'category' if categorical else 'str'
+    builders = []
+    for name in headers:
+        column_type = schema.get(name, inferred.get(name, 'str'))
+        if name not in schema and column_type == 'str':
+            column_type = string_type
+        builders.append(_ColumnBuilder(name, column_type, name in schema, string_type))
+
+    def consume(batch):
+        """Feed one batch of rows to the column builders."""
+        if set(map(len, batch)) - {len(headers)}:
+            raise ValueError("All rows must have the same number of fields as the header")
+
+        for builder, values in zip(builders, zip(*batch)):
+            builder.append(values)
+
+    if first:
+        consume(first)
+    for batch in batches:
+        if batch:
+            consume(batch)
+
+    return {builder.name: builder.finish() for builder in builders}
+
+
+def is_text_column(column):
+    """Whether a parsed column holds text (a string array or a Categorical)."""
+    return isinstance(column, pd.Categorical) or column.dtype.kind == 'U'
+
+
+def concat_columns(parts):
+    """
+    Concatenate column dictionaries produced for consecutive row ranges.
+
+    int64 and float64 parts of a column are combined as float64, and
+    string and categorical parts as the categorical if any part is one.
+    A column that is text in some parts and typed in others cannot be
+    combined without rewriting the typed values' original text; re-parse
+    those parts with a string type first.
+
+    Args:
+        parts: List of dictionaries mapping column names to arrays
+
+    Returns:
+        Dictionary mapping column names to concatenated arrays
+    """
+    if not parts:
+        return {}
+
+    result = {}
+    for name in parts[0]:
+        pieces = [part[name] for part in parts]
+        is_categorical = [isinstance(piece, pd.Categorical) for piece in pieces]
+        is_text = [is_text_column(piece) for piece in pieces]
+
+        if all(is_categorical):
+            result[name] = union_categoricals(pieces)
+        elif all(is_text):
+            strings = np.concatenate([np.asarray(piece, dtype=str) for piece in pieces])
+            result[name] = pd.Categorical(strings) if any(is_categorical) else strings
+        elif any(is_text):
+            raise ValueError(f"Column {name} is text in some parts and typed in others")
+        else:
+            result[name] = np.concatenate(pieces)
+    return result
+
+
+def read_csv_columns(filepath, schema=None, delimiter=',', categorical=False, header=True,
+                     batch_size=65536, buffer_size=DEFAULT_BUFFER_SIZE, delay=False):
+    """
+    Read a CSV file straight into typed per-column numpy arrays.
+
+    Rows are parsed in batches, and each batch is transposed and converted
+    column by column with numpy, so values never exist as one Python
+    object per cell for longer than a single batch.
+
+    Args:
+        filepath: Path to the CSV file
+        schema: Dictionary mapping column names to column types (int64,
+            float64, bool, str or category); inferred from the first batch
+            for any column that is not listed, and widened (int64 to float64
+            to str) if a later batch does not fit
+        delimiter: CSV delimiter
+        categorical: Whether inferred string columns become categoricals
+        header: Whether the first row holds column names
+        batch_size: Number of rows parsed per batch
+        buffer_size: Size in bytes of the underlying read buffer
+        delay: Whether to add an artificial delay
+
+    Returns:
+        Dictionary mapping column names to numpy arrays or pandas Categoricals
+    """
+    if delay:
+        time.sleep(random.uniform(0.3, 0.7))
+
+    batches = iter_csv_batches(filepath, batch_size=batch_size, delimiter=delimiter,
+                               buffer_size=buffer_size)
+    first = next(batches, [])
+
+    if header:
+        headers, first = (first[0], first[1:]) if first else ([], [])
+    else:
+        headers = [f"column_{i}" for i in range(len(first[0]))] if first else []
+
+    return rows_to_columns(headers, chain([first], batches), schema=schema, categorical=categorical)
+
+
+def _quote_strings(values, delimiter, quotechar):
+    """Quote the strings in a U array that need it, like csv.QUOTE_MINIMAL."""
+    needs_quoting = np.zeros(len(values), dtype=bool)
+    for special in (delimiter, quotechar, '\n', '\r'):
+        needs_quoting |= np.char.find(values, special) >= 0
+    if not needs_quoting.any():
+        return values
+    values = values.astype(object)
+    escaped = quotechar * 2
+    values[needs_quoting] = [quotechar + value.replace(quotechar, escaped) + quotechar
+                             for value in values[needs_quoting]]
+    return values
+
+
+def _format_column(values, delimiter, quotechar, na_rep):
+    """Format a block of one column as an array of CSV field strings."""
+    if isinstance(values, pd.Categorical):
+        categories = _format_column(np.asarray(values.categories, dtype=str), delimiter, quotechar,
+                                    na_rep)
+        # Append na_rep so that the -1 code of missing values selects it
+        lookup = np.append(np.asarray(categories, dtype=object), na_rep)
+        return lookup[values.codes]
+
+    kind = values.dtype.kind
+    if kind in 'iub':
+        return values.astype(str)
+    if kind == 'f':
+        text = values.astype(str)
+        missing = np.isnan(values)
+        if missing.any():
+            text = text.astype(object)
+            text[missing] = na_rep
+        return text
+    if kind == 'O':
+        values = np.array([na_rep if value is None or value != value else str(value)
+                           for value in values], dtype=str)
+    elif kind != 'U':
+        values = values.astype(str)
+    return _quote_strings(values, delimiter, quotechar)
+
+
+def write_csv_columns(columns, filepath, delimiter=',', quotechar='"', header=True,
+                      lineterminator='\r\n', na_rep='', block_size=65536,
+                      buffer_size=WRITE_BUFFER_SIZE, compresslevel=None, delay=False):
+    """
+    Write typed columns to a CSV file without building per-row lists.
+
+    Rows are written in blocks: each column of a block is converted to
+    text in one numpy call, the block is joined into a single string and
+    written with one call through a large buffer. Strings are quoted like
+    ``csv.writer`` does by default, so the output reads back identically
+    with ``read_csv_file``.
+
+    Args:
+        columns: Dictionary of column name to array/Categorical, or a DataFrame
+        filepath: Path to the CSV file (.gz/.bz2/.xz are compressed)
+        delimiter: CSV delimiter
+        quotechar: CSV quote character
+        header: Whether to write the column names as the first row
+        lineterminator: String written after each row
+        na_rep: Text written for NaN floats and missing values
+        block_size: Number of rows formatted per write
+        buffer_size: Size in bytes of the write buffer
+        compresslevel: Compression level for compressed output
+        delay: Whether to add an artificial delay
+
+    Returns:
+        Number of data rows written
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+
+    if isinstance(columns, pd.DataFrame):
+        columns = {str(name): columns[name] for name in columns.columns}
+    names = list(columns)
+    arrays = []
+    for name in names:
+        values = columns[name]
+        if isinstance(values, pd.Series):
+            is_categorical = isinstance(values.dtype, pd.CategoricalDtype)
+            values = values.array if is_categorical else values.to_numpy()
+        arrays.append(values if isinstance(values, pd.Categorical) else np.asarray(values))
+
+    rows = len(arrays[0]) if arrays else 0
+    if any(len(array) != rows for array in arrays):
+        raise ValueError("All columns must have the same length")
+
+    join_fields = delimiter.join
+    with open_file(filepath, 'w', compresslevel=compresslevel, buffering=buffer_size,
+                   newline='') as f:
+        if header:
+            names_text = _quote_strings(np.array(names, dtype=str), delimiter, quotechar)
+            f.write(join_fields(names_text.tolist()) + lineterminator)
+
+        for start in range(0, rows, block_size):
+            stop = min(start + block_size, rows)
+            fields = [_format_column(array[start:stop], delimiter, quotechar, na_rep).tolist()
+                      for array in arrays]
+            f.write(lineterminator.join(map(join_fields, zip(*fields))))
+            f.write(lineterminator)
+
+    return rows
@@ -0,0 +1,200 @@
+"""In-process cache for parsed files."""
+import os
+import sys
+import time
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_CONTAINERS = (dict, list, tuple, MappingProxyType)
+
+
+def _signature(filepath):
+    """Return the stat fields that change whenever a file is replaced or modified."""
+    st = os.stat(filepath)
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def estimate_size(value):
+    """
+    Estimate the memory held by a parsed JSON/CSV structure.
+
+    Args:
+        value: Nested lists, tuples and dicts of scalars
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, (dict, MappingProxyType)):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return size
+
+
+def copy_parsed(value):
+    """
+    Copy the containers of a parsed structure, sharing immutable scalars.
+
+    Much cheaper than ``copy.deepcopy`` for JSON/CSV data, which only
+    holds lists, dicts and immutable scalars.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: copy_parsed(item) if isinstance(item, _CONTAINERS) else item
+                for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [copy_parsed(item) if isinstance(item, _CONTAINERS) else item for item in value]
+    return value
+
+
+def freeze_parsed(value):
+    """Convert a parsed structure to tuples and read-only mappings."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_parsed(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_parsed(item) for item in value)
+    return value
+
+
+class _Entry:
+    """A cached value with the file signature it was loaded from."""
+
+    __slots__ = ('signature', 'value', 'size')
+
+    def __init__(self, signature, value, size):
+        self.signature = signature
+        self.value = value
+        self.size = size
+
+
+class ParsedFileCache:
+    """
+    LRU cache of parsed file contents keyed by path and stat signature.
+
+    Every lookup re-stats the file and compares device, inode, size, mtime
+    and ctime, so a modified or replaced file is always re-read. Files
+    modified within ``min_age`` seconds are not cached at all, because
+    a second write inside the filesystem's timestamp granularity could
+    otherwise go unnoticed.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, frozen=False, min_age=1.0):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Upper bound on the estimated size of cached values
+            frozen: Return shared read-only values (tuples and mapping
+                proxies) instead of a fresh copy on every read
+            min_age: Minimum age in seconds of a file's mtime before its
+                contents are cached
+        """
+        self.max_bytes = max_bytes
+        self.frozen = frozen
+        self.min_age = min_age
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _output(self, value):
+        return value if self.frozen else copy_parsed(value)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    def get_or_load(self, filepath, loader, key=()):
+        """
+        Return the parsed contents of a file, loading them on a miss.
+
+        Args:
+            filepath: Path to the file
+            loader: Zero-argument callable that reads and parses the file
+            key: Hashable extra key for the parse options used by ``loader``
+
+        Returns:
+            Parsed contents (a copy, or a frozen shared value)
+        """
+        path = os.path.realpath(filepath)
+        cache_key = (path, key)
+        signature = _signature(path)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return self._output(entry.value)
+            if entry is not None:
+                self._discard(cache_key)
+            self.misses += 1
+
+        value = loader()
+
+        # Do not cache if the file changed while it was being read or is
+        # too fresh for its timestamp to be trusted
+        stored = freeze_parsed(value) if self.frozen else value
+        if _signature(path) != signature:
+            return stored
+        if time.time() - signature[3] / 1e9 < self.min_age:
+            return stored
+
+        size = estimate_size(stored)
+        if size > self.max_bytes:
+            return stored
+
+        with self._lock:
+            self._discard(cache_key)
+            self._entries[cache_key] = _Entry(signature, stored, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.size
+                self.evictions += 1
+
+        # The cached value itself must never reach a caller that may mutate it
+        return stored if self.frozen else copy_parsed(value)
+
+    def invalidate(self, filepath=None):
+        """
+        Drop cached entries.
+
+        Args:
+            filepath: Drop only entries for this file (all entries if None)
+        """
+        with self._lock:
+            if filepath is None:
+                self._entries.clear()
+                self.current_bytes = 0
+                return
+            path = os.path.realpath(filepath)
+            for cache_key in [k for k in self._entries if k[0] == path]:
+                self._discard(cache_key)
+
+    def stats(self):
+        """Return hit, miss and eviction counters and current usage."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+
+default_cache = ParsedFileCache()
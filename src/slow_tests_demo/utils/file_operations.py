@@ -2,17 +2,341 @@
 import os
 import time
 import random
+import re
 import json
 import csv
+import gzip
+import bz2
+import lzma
+import shutil
+import operator
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, chain
 
+from slow_tests_demo.utils import serialization
+from slow_tests_demo.utils.file_cache import default_cache
 
-def read_json_file(filepath, delay=False):
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+NDJSON_WRITE_BUFFER_SIZE = WRITE_BUFFER_SIZE
+
+DEFAULT_GZIP_COMPRESSLEVEL = 6
+
+# JSON text is UTF-8 (RFC 8259) whatever the locale
+JSON_ENCODING = 'utf-8'
+
+_COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz'
+}
+
+# bz2 streams start with 'BZh' and the block size digit, so plain text
+# starting with 'BZh' is not mistaken for one
+_COMPRESSION_MAGIC = (
+    (re.compile(rb'\x1f\x8b'), 'gzip'),
+    (re.compile(rb'BZh[1-9]'), 'bz2'),
+    (re.compile(rb'\xfd7zXZ\x00'), 'xz')
+)
+
+_FORMAT_EXTENSIONS = {
+    '.json': 'json',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv',
+    '.cols': 'columnar'
+}
+
+COLUMNAR_FORMAT_VERSION = 1
+
+_COLUMNAR_HEADER = 'header.json'
+
+_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda cell, value: cell in value
+}
+
+_PREDICATE_PATTERN = re.compile(r'^\s*(\w+)\s*(==|!=|<=|>=|<|>|\bin\b)\s*(.+?)\s*$')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Characters that can follow a complete array element
+_ELEMENT_END = frozenset(' \t\n\r,]')
+
+
+def detect_compression(filepath, mode='r'):
+    """
+    Detect the compression codec of a file.
+    
+    The extension is checked first; when reading, files without a known
+    extension are identified by their magic bytes.
+    
+    Args:
+        filepath: Path to the file
+        mode: Mode the file will be opened with
+        
+    Returns:
+        'gzip', 'bz2', 'xz' or None for uncompressed files
+    """
+    extension = os.path.splitext(filepath.lower())[1]
+    if extension in _COMPRESSION_EXTENSIONS:
+        return _COMPRESSION_EXTENSIONS[extension]
+    
+    if 'r' in mode and os.path.isfile(filepath):
+        with open(filepath, 'rb') as f:
+            head = f.read(6)
+        for magic, compression in _COMPRESSION_MAGIC:
+            if magic.match(head):
+                return compression
+    
+    return None
+
+
+def open_file(filepath, mode='r', compresslevel=None, buffering=-1, newline=None,
+              compression='infer', encoding=None):
+    """
+    Open a plain or gzip/bz2/xz-compressed file.
+    
+    Compressed files are streamed through the stdlib codecs and never
+    decompressed to disk.
+    
+    Args:
+        filepath: Path to the file
+        mode: File mode, as for ``open``
+        compresslevel: Compression level for writing (preset for xz)
+        buffering: Buffer size for uncompressed files, as for ``open``
+        newline: Newline handling for text modes, as for ``open``
+        compression: 'infer', 'gzip', 'bz2', 'xz' or None
+        encoding: Text encoding, as for ``open`` (the locale's if None)
+        
+    Returns:
+        File object
+    """
+    if compression == 'infer':
+        compression = detect_compression(filepath, mode)
+    
+    if compression is None:
+        return open(filepath, mode, buffering=buffering, newline=newline, encoding=encoding)
+    
+    kwargs = {}
+    if 'r' not in mode:
+        if compresslevel is None and compression == 'gzip':
+            compresslevel = DEFAULT_GZIP_COMPRESSLEVEL
+        if compresslevel is not None:
+            kwargs['preset' if compression == 'xz' else 'compresslevel'] = compresslevel
+    if 'b' not in mode:
+        mode = mode if 't' in mode else mode + 't'
+        kwargs['newline'] = newline
+        kwargs['encoding'] = encoding
+    
+    if compression == 'gzip':
+        return gzip.open(filepath, mode, **kwargs)
+    if compression == 'bz2':
+        return bz2.open(filepath, mode, **kwargs)
+    if compression == 'xz':
+        return lzma.open(filepath, mode, **kwargs)
+    
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def parse_predicate(where):
+    """
+    Parse a simple ``column op value`` filter.
+    
+    Args:
+        where: Tuple ``(column, op, value)`` or a string such as
+            ``"price > 10"`` or ``'category == "books"'``; string values
+            are decoded as JSON when possible
+        
+    Returns:
+        Tuple of (column, comparison function, value)
+    """
+    if isinstance(where, str):
+        match = _PREDICATE_PATTERN.match(where)
+        if not match:
+            raise ValueError(f"Invalid predicate: {where}")
+        column, op, raw = match.groups()
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+    else:
+        column, op, value = where
+    
+    if op not in _OPERATORS:
+        raise ValueError(f"Unknown operator: {op}")
+    
+    return column, _OPERATORS[op], value
+
+
+def _cell_converter(value):
+    """Return a function converting CSV cells to the type of ``value``."""
+    if isinstance(value, (list, tuple, set)):
+        value = next(iter(value), '')
+    if isinstance(value, bool):
+        return lambda cell: cell.strip().lower() in ('true', '1', 'yes')
+    if isinstance(value, (int, float)):
+        return float
+    return str
+
+
+def _select_csv_rows(rows, columns=None, where=None):
+    """
+    Apply a predicate and column projection to CSV rows as they are parsed.
+    
+    The first row is treated as the header. Rows failing the predicate are
+    dropped before anything else is done with them, and kept rows are cut
+    down to the requested columns immediately.
+    """
+    header = next(rows, None)
+    if header is None:
+        return
+    
+    def index_of(column):
+        try:
+            return header.index(column)
+        except ValueError:
+            raise ValueError(f"Unknown column: {column}") from None
+    
+    keep = [index_of(column) for column in columns] if columns is not None else None
+    yield [header[i] for i in keep] if keep is not None else header
+    
+    test = None
+    if where is not None:
+        column, compare, value = parse_predicate(where)
+        position = index_of(column)
+        convert = _cell_converter(value)
+        
+        def test(row):
+            try:
+                return compare(convert(row[position]), value)
+            except (IndexError, TypeError, ValueError):
+                return False
+    
+    project = None
+    if keep is not None:
+        getter = operator.itemgetter(*keep)
+        if len(keep) == 1:
+            project = lambda row: [getter(row)]
+        else:
+            project = lambda row: list(getter(row))
+    
+    for row in rows:
+        if test is not None and not test(row):
+            continue
+        if project is not None:
+            try:
+                row = project(row)
+            except IndexError:
+                row = [row[i] if i < len(row) else '' for i in keep]
+        yield row
+
+
+def _decode_json_array(f, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Incrementally decode the elements of a top-level JSON array.
+    
+    Only the unconsumed tail of the file plus one read buffer is held in
+    memory. An element is only accepted once the character following it
+    is whitespace, ',' or ']' (or the file has ended), so numbers split
+    across reads, e.g. after '1.' or '1e', are never cut short.
+    """
+    decoder = json.JSONDecoder()
+    state = {'buffer': '', 'index': 0, 'eof': False}
+    
+    def fill(size):
+        chunk = f.read(size)
+        if not chunk:
+            state['eof'] = True
+            return
+        state['buffer'] = state['buffer'][state['index']:] + chunk
+        state['index'] = 0
+    
+    def skip_whitespace():
+        while True:
+            state['index'] = _WHITESPACE.match(state['buffer'], state['index']).end()
+            if state['index'] < len(state['buffer']) or state['eof']:
+                return state['buffer'][state['index']:state['index'] + 1]
+            fill(buffer_size)
+    
+    if skip_whitespace() != '[':
+        raise ValueError("JSON data must be a top-level array")
+    state['index'] += 1
+    if skip_whitespace() == ']':
+        return
+    
+    while True:
+        read_size = buffer_size
+        while True:
+            buffer, index = state['buffer'], state['index']
+            try:
+                element, end = decoder.raw_decode(buffer, index)
+                if buffer[end:end + 1] in _ELEMENT_END or state['eof']:
+                    following = _WHITESPACE.match(buffer, end).end()
+                    break
+            except json.JSONDecodeError:
+                if state['eof']:
+                    raise
+            # Element incomplete: read more, growing the read size so large
+            # elements are not re-decoded once per buffer
+            fill(read_size)
+            read_size *= 2
+        
+        yield element
+        state['index'] = following
+        separator = skip_whitespace()
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError("Expected ',' or ']' in JSON array")
+        state['index'] += 1
+        skip_whitespace()
+
+
+def _select_json_records(records, columns=None, where=None):
+    """Apply a predicate and key projection to JSON records as they are decoded."""
+    test = None
+    if where is not None:
+        column, compare, value = parse_predicate(where)
+        
+        def test(record):
+            if not isinstance(record, dict) or column not in record:
+                return False
+            try:
+                return compare(record[column], value)
+            except TypeError:
+                return False
+    
+    for record in records:
+        if test is not None and not test(record):
+            continue
+        if columns is not None and isinstance(record, dict):
+            record = {key: record[key] for key in columns if key in record}
+        yield record
+
+
+def read_json_file(filepath, delay=False, *, columns=None, where=None, cache=None):
     """
     Read a JSON file with optional delay.
     
     Args:
         filepath: Path to the JSON file
         delay: Whether to add an artificial delay
+        columns: Keys to keep from each record of a top-level array
+        where: Record filter, see ``parse_predicate``
+        cache: ParsedFileCache to serve repeated reads from, or True for
+            the shared default cache
         
     Returns:
         Parsed JSON data
@@ -20,11 +344,43 @@ def read_json_file(filepath, delay=False):
     if delay:
         time.sleep(random.uniform(0.2, 0.6))
     
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    if cache:
+        cache = default_cache if cache is True else cache
+        return cache.get_or_load(filepath, lambda: read_json_file(filepath, columns=columns, where=where),
+                                 key=('json', repr(columns), repr(where)))
+    
+    with open_file(filepath, 'r', encoding=JSON_ENCODING) as f:
+        if columns is None and where is None:
+            return serialization.load(f)
+        
+        # Decode one element at a time so dropped records and keys are
+        # released straight away instead of after the whole array is built
+        return list(_select_json_records(_decode_json_array(f), columns, where))
+
+
+def iter_json_array(filepath, buffer_size=DEFAULT_BUFFER_SIZE, columns=None, where=None,
+                    delay=False):
+    """
+    Stream the elements of a top-level JSON array with bounded memory.
+    
+    Args:
+        filepath: Path to the JSON file
+        buffer_size: Number of characters read at a time
+        columns: Keys to keep from each record
+        where: Record filter, see ``parse_predicate``
+        delay: Whether to add an artificial delay
+        
+    Yields:
+        Decoded array elements
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.6))
+    
+    with open_file(filepath, 'r', encoding=JSON_ENCODING) as f:
+        yield from _select_json_records(_decode_json_array(f, buffer_size), columns, where)
 
 
-def write_json_file(data, filepath, delay=False):
+def write_json_file(data, filepath, delay=False, *, compresslevel=None, compact=False):
     """
     Write data to a JSON file with optional delay.
     
@@ -32,15 +388,56 @@ def write_json_file(data, filepath, delay=False):
         data: Data to write
         filepath: Path to the JSON file
         delay: Whether to add an artificial delay
+        compresslevel: Compression level for .gz/.bz2/.xz files
+        compact: Write without indentation or spaces instead of indent=2
     """
     if delay:
         time.sleep(random.uniform(0.2, 0.5))
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open_file(filepath, 'w', compresslevel=compresslevel, encoding=JSON_ENCODING) as f:
+        serialization.dump(data, f, indent=None if compact else 2)
 
 
-def read_csv_file(filepath, delimiter=',', delay=False):
+def write_json_array(items, filepath, indent=None, compresslevel=None, delay=False):
+    """
+    Stream any iterable to a file as a JSON array, one element at a time.
+    
+    Args:
+        items: Iterable of JSON-serializable elements
+        filepath: Path to the JSON file
+        indent: Indentation width as for ``json.dump``; compact output if None
+        compresslevel: Compression level for .gz/.bz2/.xz files
+        delay: Whether to add an artificial delay
+        
+    Returns:
+        Number of elements written
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+    
+    backend = serialization.get_backend()
+    if indent is None:
+        opening, separator, closing = '[', ',', ']'
+        encode = backend.dumps
+    else:
+        # Match the layout json.dump produces for a whole list
+        prefix = ' ' * indent
+        opening, separator, closing = '[\n' + prefix, ',\n' + prefix, '\n]'
+        encode = lambda item: backend.dumps(item, indent=indent).replace('\n', '\n' + prefix)
+    
+    count = 0
+    with open_file(filepath, 'w', compresslevel=compresslevel,
+                   buffering=DEFAULT_BUFFER_SIZE, encoding=JSON_ENCODING) as f:
+        for item in items:
+            f.write(separator if count else opening)
+            f.write(encode(item))
+            count += 1
+        f.write(closing if count else '[]')
+    
+    return count
+
+
+def read_csv_file(filepath, delimiter=',', delay=False, *, columns=None, where=None, cache=None):
     """
     Read a CSV file with optional delay.
     
@@ -48,6 +445,10 @@ def read_csv_file(filepath, delimiter=',', delay=False):
         filepath: Path to the CSV file
         delimiter: CSV delimiter
         delay: Whether to add an artificial delay
+        columns: Header names of the columns to keep
+        where: Row filter, see ``parse_predicate``
+        cache: ParsedFileCache to serve repeated reads from, or True for
+            the shared default cache
         
     Returns:
         List of rows from the CSV file
@@ -55,28 +456,451 @@ def read_csv_file(filepath, delimiter=',', delay=False):
     if delay:
         time.sleep(random.uniform(0.3, 0.7))
     
+    if cache:
+        cache = default_cache if cache is True else cache
+        return cache.get_or_load(filepath,
+                                 lambda: read_csv_file(filepath, delimiter, columns=columns,
+                                                       where=where),
+                                 key=('csv', delimiter, repr(columns), repr(where)))
+    
     rows = []
-    with open(filepath, 'r') as f:
+    with open_file(filepath, 'r') as f:
         reader = csv.reader(f, delimiter=delimiter)
+        if columns is not None or where is not None:
+            reader = _select_csv_rows(reader, columns, where)
         for row in reader:
             rows.append(row)
     
     return rows
 
 
-def write_csv_file(data, filepath, delimiter=',', delay=False):
+def iter_csv_rows(filepath, delimiter=',', buffer_size=DEFAULT_BUFFER_SIZE, columns=None,
+                  where=None, delay=False):
+    """
+    Stream the rows of a CSV file one at a time.
+    
+    Args:
+        filepath: Path to the CSV file
+        delimiter: CSV delimiter
+        buffer_size: Size in bytes of the underlying read buffer
+        columns: Header names of the columns to keep
+        where: Row filter, see ``parse_predicate``
+        delay: Whether to add an artificial delay
+        
+    Yields:
+        Rows from the CSV file as lists of strings
+    """
+    if delay:
+        time.sleep(random.uniform(0.3, 0.7))
+    
+    with open_file(filepath, 'r', newline='', buffering=buffer_size) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        if columns is not None or where is not None:
+            reader = _select_csv_rows(reader, columns, where)
+        yield from reader
+
+
+def iter_csv_batches(filepath, batch_size=1000, delimiter=',', buffer_size=DEFAULT_BUFFER_SIZE,
+                     delay=False):
+    """
+    Stream the rows of a CSV file in fixed-size batches.
+    
+    Args:
+        filepath: Path to the CSV file
+        batch_size: Maximum number of rows per batch
+        delimiter: CSV delimiter
+        buffer_size: Size in bytes of the underlying read buffer
+        delay: Whether to add an artificial delay
+        
+    Yields:
+        Lists of at most ``batch_size`` rows; the header row is part of the first batch
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    
+    if delay:
+        time.sleep(random.uniform(0.3, 0.7))
+    
+    with open_file(filepath, 'r', newline='', buffering=buffer_size) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        while True:
+            batch = list(islice(reader, batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+def write_csv_file(data, filepath, delimiter=',', delay=False, *, compresslevel=None):
     """
     Write data to a CSV file with optional delay.
     
     Args:
-        data: List of rows to write
+        data: List (or any iterable) of rows to write
         filepath: Path to the CSV file
         delimiter: CSV delimiter
         delay: Whether to add an artificial delay
+        compresslevel: Compression level for .gz/.bz2/.xz files
     """
     if delay:
         time.sleep(random.uniform(0.2, 0.6))
     
-    with open(filepath, 'w', newline='') as f:
+    with open_file(filepath, 'w', compresslevel=compresslevel, newline='') as f:
         writer = csv.writer(f, delimiter=delimiter)
         writer.writerows(data)
+
+
+def detect_format(filepath, default='csv'):
+    """
+    Detect a file format from its extension, ignoring any compression suffix.
+    
+    Args:
+        filepath: Path to the file
+        default: Format returned for unknown extensions
+        
+    Returns:
+        'json', 'ndjson', 'csv' or 'columnar'
+    """
+    root, extension = os.path.splitext(filepath.lower().rstrip('/' + os.sep))
+    if extension in _COMPRESSION_EXTENSIONS:
+        extension = os.path.splitext(root)[1]
+    return _FORMAT_EXTENSIONS.get(extension, default)
+
+
+def read_file(filepath, **kwargs):
+    """
+    Read a JSON, NDJSON, CSV or columnar file, choosing the reader by extension.
+    
+    Args:
+        filepath: Path to the file (compression suffixes are allowed)
+        **kwargs: Keyword arguments for the selected reader
+        
+    Returns:
+        Parsed file contents
+    """
+    file_format = detect_format(filepath)
+    if file_format == 'json':
+        return read_json_file(filepath, **kwargs)
+    if file_format == 'ndjson':
+        return read_ndjson_file(filepath, **kwargs)
+    if file_format == 'columnar':
+        return read_columnar_file(filepath, **kwargs)
+    return read_csv_file(filepath, **kwargs)
+
+
+def _parse_ndjson_lines(lines, first_line=1):
+    """
+    Parse a batch of NDJSON lines.
+    
+    Args:
+        lines: List of raw lines, blank lines allowed
+        first_line: Line number of the first line, used in error messages
+        
+    Returns:
+        List of decoded records
+    """
+    decode = serialization.get_backend().loads
+    try:
+        return [decode(line) for line in lines if not line.isspace()]
+    except ValueError:
+        pass
+    
+    # Locate the offending line for a useful error message
+    for number, line in enumerate(lines, first_line):
+        if line.isspace():
+            continue
+        try:
+            decode(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON on line {number}: {e}") from None
+
+
+def _iter_line_batches(f, batch_size):
+    """Yield (first line number, lines) pairs of raw lines."""
+    line_number = 1
+    while True:
+        lines = list(islice(f, batch_size))
+        if not lines:
+            return
+        yield line_number, lines
+        line_number += len(lines)
+
+
+def iter_ndjson_batches(filepath, batch_size=1000, workers=None, buffer_size=DEFAULT_BUFFER_SIZE,
+                        delay=False):
+    """
+    Stream the records of an NDJSON (JSON Lines) file in batches.
+    
+    Lines are read and decoded a batch at a time. With ``workers`` greater
+    than 1 the batches are decoded in a process pool, since every line is
+    independent; batches are still returned in file order.
+    
+    Args:
+        filepath: Path to the NDJSON file
+        batch_size: Number of lines decoded per batch
+        workers: Number of worker processes (decode in-process if None or 1)
+        buffer_size: Size in bytes of the underlying read buffer
+        delay: Whether to add an artificial delay
+        
+    Yields:
+        Lists of decoded records
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    
+    if delay:
+        time.sleep(random.uniform(0.2, 0.6))
+    
+    with open_file(filepath, 'r', buffering=buffer_size, encoding=JSON_ENCODING) as f:
+        batches = _iter_line_batches(f, batch_size)
+        
+        if not workers or workers == 1:
+            for first_line, lines in batches:
+                yield _parse_ndjson_lines(lines, first_line)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep a bounded number of batches in flight
+            pending = deque()
+            for first_line, lines in batches:
+                pending.append(executor.submit(_parse_ndjson_lines, lines, first_line))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def iter_ndjson(filepath, batch_size=1000, workers=None, delay=False):
+    """
+    Stream the records of an NDJSON file one at a time.
+    
+    Args:
+        filepath: Path to the NDJSON file
+        batch_size: Number of lines decoded per batch
+        workers: Number of worker processes used for decoding
+        delay: Whether to add an artificial delay
+        
+    Yields:
+        Decoded records
+    """
+    for batch in iter_ndjson_batches(filepath, batch_size=batch_size, workers=workers, delay=delay):
+        yield from batch
+
+
+def read_ndjson_file(filepath, workers=None, delay=False):
+    """
+    Read an NDJSON (JSON Lines) file with optional delay.
+    
+    Args:
+        filepath: Path to the NDJSON file
+        workers: Number of worker processes used for decoding
+        delay: Whether to add an artificial delay
+        
+    Returns:
+        List of decoded records
+    """
+    records = []
+    for batch in iter_ndjson_batches(filepath, workers=workers, delay=delay):
+        records.extend(batch)
+    return records
+
+
+def write_ndjson_file(records, filepath, batch_size=1000, buffer_size=NDJSON_WRITE_BUFFER_SIZE,
+                      compresslevel=None, delay=False):
+    """
+    Write records to an NDJSON (JSON Lines) file with optional delay.
+    
+    Records are encoded in batches and each batch is written with a single
+    call through a large buffer.
+    
+    Args:
+        records: Iterable of JSON-serializable records
+        filepath: Path to the NDJSON file
+        batch_size: Number of records encoded per write
+        buffer_size: Size in bytes of the write buffer
+        compresslevel: Compression level for .gz/.bz2/.xz files
+        delay: Whether to add an artificial delay
+        
+    Returns:
+        Number of records written
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+    
+    encode = serialization.get_backend().dumps
+    records = iter(records)
+    count = 0
+    with open_file(filepath, 'w', compresslevel=compresslevel, buffering=buffer_size,
+                   encoding=JSON_ENCODING) as f:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            f.write('\n'.join(map(encode, batch)))
+            f.write('\n')
+            count += len(batch)
+    
+    return count
+
+
+def _columnar_arrays(values):
+    """Split a column into the arrays stored on disk and its type name."""
+    if isinstance(values, pd.Series):
+        values = values.array if isinstance(values.dtype, pd.CategoricalDtype) else values.to_numpy()
+    if isinstance(values, pd.Categorical):
+        categories = np.asarray(values.categories.astype(str), dtype=str)
+        return {'codes': np.asarray(values.codes)}, {'categories': categories}, 'category'
+    
+    array = np.asarray(values)
+    if array.dtype.kind == 'O':
+        # Missing values (None, or NaN in pandas string columns) become empty strings
+        array = np.array(['' if value is None or value != value else str(value) for value in array],
+                         dtype=str)
+        return {'values': array}, {}, 'str'
+    if array.dtype.kind in 'SU':
+        array = np.asarray(array, dtype=str)
+        return {'values': array}, {}, 'str'
+    if array.dtype.kind not in 'biuf':
+        raise ValueError(f"Unsupported column dtype: {array.dtype}")
+    return {'values': array}, {}, str(array.dtype)
+
+
+def _is_columnar_store(dirpath):
+    """Whether a directory holds only a header and the files it lists."""
+    try:
+        with open(os.path.join(dirpath, _COLUMNAR_HEADER)) as f:
+            header = json.load(f)
+        listed = {_COLUMNAR_HEADER}
+        for entry in header['columns']:
+            listed.update(filename for part, filename in entry.items()
+                          if part not in ('name', 'type'))
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    with os.scandir(dirpath) as entries:
+        return all(entry.name in listed and entry.is_file(follow_symlinks=False)
+                   for entry in entries)
+
+
+def _check_columnar_target(dirpath):
+    """Refuse to overwrite anything but an empty or columnar directory."""
+    if not os.path.lexists(dirpath):
+        return
+    if (os.path.islink(dirpath) or not os.path.isdir(dirpath)
+            or (os.listdir(dirpath) and not _is_columnar_store(dirpath))):
+        raise FileExistsError(f"{dirpath} exists and is not a columnar directory")
+
+
+def write_columnar_file(columns, dirpath, delay=False):
+    """
+    Write typed columns to a binary columnar directory.
+    
+    Each column is stored as a raw ``.npy`` array (categoricals as integer
+    codes plus a categories array) next to a small ``header.json`` that
+    records the column names, types and row count. The directory is
+    written beside the target and moved into place when complete. An
+    existing target is only replaced if it is empty or a columnar
+    directory itself.
+    
+    Args:
+        columns: Dictionary of column name to array/Categorical, or a DataFrame
+        dirpath: Path to the output directory (conventionally ``*.cols``)
+        delay: Whether to add an artificial delay
+        
+    Returns:
+        Number of rows written
+        
+    Raises:
+        FileExistsError: If the target exists and is not a columnar directory
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+    
+    if isinstance(columns, pd.DataFrame):
+        columns = {str(name): columns[name] for name in columns.columns}
+    
+    dirpath = dirpath.rstrip('/' + os.sep)
+    _check_columnar_target(dirpath)
+    tmp_path = f"{dirpath}.tmp-{os.getpid()}"
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+    
+    rows = None
+    header = {'version': COLUMNAR_FORMAT_VERSION, 'rows': 0, 'columns': []}
+    try:
+        for i, (name, values) in enumerate(columns.items()):
+            arrays, extra, column_type = _columnar_arrays(values)
+            length = len(next(iter(arrays.values())))
+            if rows is None:
+                rows = length
+            elif length != rows:
+                raise ValueError(f"Column {name!r} has {length} rows, expected {rows}")
+            
+            entry = {'name': name, 'type': column_type}
+            for part, array in chain(arrays.items(), extra.items()):
+                filename = f"{i}.{part}.npy"
+                np.save(os.path.join(tmp_path, filename), array, allow_pickle=False)
+                entry[part] = filename
+            header['columns'].append(entry)
+        
+        header['rows'] = rows or 0
+        with open(os.path.join(tmp_path, _COLUMNAR_HEADER), 'w') as f:
+            json.dump(header, f, indent=2)
+        
+        _check_columnar_target(dirpath)
+        if os.path.isdir(dirpath):
+            shutil.rmtree(dirpath)
+        os.replace(tmp_path, dirpath)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    
+    return header['rows']
+
+
+def read_columnar_file(dirpath, columns=None, mmap=True, delay=False):
+    """
+    Read a binary columnar directory written by ``write_columnar_file``.
+    
+    With ``mmap=True`` numeric and string columns are memory-mapped
+    read-only, so loading does not copy or parse the data; pages are read
+    from disk only when values are touched.
+    
+    Args:
+        dirpath: Path to the columnar directory
+        columns: Optional list of column names to load (all if None)
+        mmap: Whether to memory-map the column arrays
+        delay: Whether to add an artificial delay
+        
+    Returns:
+        Dictionary mapping column names to numpy arrays, or pandas
+        Categoricals for category columns
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+    
+    with open(os.path.join(dirpath, _COLUMNAR_HEADER)) as f:
+        header = json.load(f)
+    if header.get('version') != COLUMNAR_FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format version: {header.get('version')}")
+    
+    entries = {entry['name']: entry for entry in header['columns']}
+    if columns is not None:
+        unknown = [name for name in columns if name not in entries]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        entries = {name: entries[name] for name in columns}
+    
+    mmap_mode = 'r' if mmap else None
+    
+    def load(filename):
+        return np.load(os.path.join(dirpath, filename), mmap_mode=mmap_mode, allow_pickle=False)
+    
+    result = {}
+    for name, entry in entries.items():
+        if entry['type'] == 'category':
+            categories = np.load(os.path.join(dirpath, entry['categories']), allow_pickle=False)
+            dtype = pd.CategoricalDtype(categories)
+            result[name] = pd.Categorical.from_codes(load(entry['codes']), dtype=dtype)
+        else:
+            result[name] = load(entry['values'])
+    return result
@@ -0,0 +1,262 @@
+"""Memory-mapped, multi-process CSV parsing."""
+import io
+import os
+import csv
+import mmap
+import time
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from slow_tests_demo.utils.columnar import (
+    rows_to_columns, concat_columns, infer_schema, is_text_column
+)
+from slow_tests_demo.utils.file_operations import detect_compression
+
+
+DEFAULT_CHUNK_BYTES = 32 * 1024 * 1024
+
+_SCAN_BLOCK = 16 * 1024 * 1024
+
+# Types are inferred from the rows in about this many leading bytes
+SAMPLE_BYTES = 1024 * 1024
+
+SAMPLE_ROWS = 10000
+
+
+def _count(mm, byte, start, end):
+    """Count occurrences of a byte in mm[start:end] without one large copy."""
+    total = 0
+    while start < end:
+        stop = min(start + _SCAN_BLOCK, end)
+        total += mm[start:stop].count(byte)
+        start = stop
+    return total
+
+
+def _next_row_start(mm, pos, target, quotechar):
+    """
+    Find the first row start at or after ``target``.
+
+    ``pos`` must itself be a row start. A newline ends a row only when the
+    number of quote characters since ``pos`` is even, so newlines inside
+    quoted fields are skipped; doubled (escaped) quotes keep the parity
+    unchanged.
+    """
+    size = len(mm)
+    if target <= pos:
+        return pos
+
+    parity = _count(mm, quotechar, pos, target) % 2
+    scan = target
+    while scan < size:
+        newline = mm.find(b'\n', scan)
+        if newline == -1:
+            return size
+        parity = (parity + _count(mm, quotechar, scan, newline)) % 2
+        if parity == 0:
+            return newline + 1
+        scan = newline + 1
+    return size
+
+
+def find_row_boundaries(filepath, parts, start=0, quotechar='"'):
+    """
+    Split a CSV file into byte ranges that begin and end on row boundaries.
+
+    Args:
+        filepath: Path to the CSV file
+        parts: Desired number of ranges
+        start: Offset of the first row to include (must be a row start)
+        quotechar: CSV quote character
+
+    Returns:
+        Sorted list of offsets; consecutive pairs delimit the ranges
+    """
+    size = os.path.getsize(filepath)
+    if size <= start:
+        return [start]
+
+    quote = quotechar.encode()
+    step = (size - start) / max(1, parts)
+    boundaries = [start]
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, parts):
+            boundary = _next_row_start(mm, boundaries[-1], start + int(step * i), quote)
+            if boundary >= size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+    boundaries.append(size)
+    return boundaries
+
+
+def _header_end(filepath, quotechar):
+    """Return the offset just after the header row."""
+    with open(filepath, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _next_row_start(mm, 0, 1, quotechar.encode())
+
+
+def _sample_end(filepath, start, end, quotechar):
+    """Return the first row start after ``SAMPLE_BYTES`` past ``start``, capped at ``end``."""
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return min(_next_row_start(mm, start, start + SAMPLE_BYTES, quotechar.encode()), end)
+
+
+def _read_range_rows(filepath, start, end, delimiter, quotechar, encoding):
+    """Parse the rows in a byte range of a CSV file."""
+    if start >= end:
+        return []
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode(encoding)
+    return list(csv.reader(io.StringIO(text, newline=''), delimiter=delimiter, quotechar=quotechar))
+
+
+def _parse_range(task):
+    """Worker entry point: parse one range into rows or typed columns."""
+    filepath, start, end, delimiter, quotechar, encoding, headers, schema, hints, categorical = task
+    rows = _read_range_rows(filepath, start, end, delimiter, quotechar, encoding)
+    if headers is None:
+        return rows
+    return rows_to_columns(headers, [rows], schema=schema, categorical=categorical, hints=hints)
+
+
+def _run_ordered(tasks, workers):
+    """
+    Run tasks on a process pool and yield results in submission order.
+
+    At most ``2 * workers`` ranges are submitted ahead of the consumer so
+    that parsed results do not pile up in memory.
+    """
+    if workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            yield _parse_range(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        tasks = iter(tasks)
+        for task in tasks:
+            pending.append(executor.submit(_parse_range, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _plan(filepath, workers, chunk_bytes, start, quotechar):
+    if detect_compression(filepath):
+        raise ValueError("Compressed files cannot be memory-mapped; use iter_csv_batches instead")
+    size = os.path.getsize(filepath)
+    workers = workers or os.cpu_count() or 1
+    parts = max(workers, -(-(size - start) // chunk_bytes))
+    return workers, find_row_boundaries(filepath, parts, start=start, quotechar=quotechar)
+
+
+def iter_csv_parallel_batches(filepath, delimiter=',', quotechar='"', workers=None,
+                              chunk_bytes=DEFAULT_CHUNK_BYTES, encoding='utf-8', delay=False):
+    """
+    Parse a CSV file in parallel and stream the rows back in file order.
+
+    The file is memory-mapped and split at row boundaries into ranges of
+    roughly ``chunk_bytes`` bytes, which are parsed in a process pool.
+
+    Args:
+        filepath: Path to the CSV file
+        delimiter: CSV delimiter
+        quotechar: CSV quote character
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_bytes: Target size in bytes of each parsed range
+        encoding: Text encoding of the file
+        delay: Whether to add an artificial delay
+
+    Yields:
+        One list of rows per range; the header row is part of the first batch
+    """
+    if delay:
+        time.sleep(random.uniform(0.3, 0.7))
+
+    workers, boundaries = _plan(filepath, workers, chunk_bytes, 0, quotechar)
+    tasks = [(filepath, start, end, delimiter, quotechar, encoding, None, None, None, False)
+             for start, end in zip(boundaries, boundaries[1:])]
+    yield from _run_ordered(tasks, workers)
+
+
+def read_csv_parallel(filepath, delimiter=',', quotechar='"', workers=None, columnar=False,
+                      schema=None, categorical=False, chunk_bytes=DEFAULT_CHUNK_BYTES,
+                      encoding='utf-8', delay=False):
+    """
+    Read a CSV file using several processes.
+
+    Args:
+        filepath: Path to the CSV file
+        delimiter: CSV delimiter
+        quotechar: CSV quote character
+        workers: Number of worker processes (defaults to the CPU count)
+        columnar: Whether to return typed columns instead of rows
+        schema: Column types for columnar output (see ``read_csv_columns``);
+            missing types are inferred from the first range
+        categorical: Whether inferred string columns become categoricals
+        chunk_bytes: Target size in bytes of each parsed range
+        encoding: Text encoding of the file
+        delay: Whether to add an artificial delay
+
+    Returns:
+        List of rows (header first, like ``read_csv_file``) or, with
+        ``columnar=True``, a dictionary mapping column names to arrays
+    """
+    if delay:
+        time.sleep(random.uniform(0.3, 0.7))
+
+    if not columnar:
+        rows = []
+        for batch in iter_csv_parallel_batches(filepath, delimiter=delimiter, quotechar=quotechar,
+                                               workers=workers, chunk_bytes=chunk_bytes,
+                                               encoding=encoding):
+            rows.extend(batch)
+        return rows
+
+    if detect_compression(filepath):
+        raise ValueError("Compressed files cannot be memory-mapped; use read_csv_columns instead")
+
+    header_end = _header_end(filepath, quotechar)
+    header_rows = _read_range_rows(filepath, 0, header_end, delimiter, quotechar, encoding)
+    if not header_rows:
+        return {}
+    headers = header_rows[0]
+
+    workers, boundaries = _plan(filepath, workers, chunk_bytes, header_end, quotechar)
+    ranges = list(zip(boundaries, boundaries[1:]))
+    if not ranges:
+        return rows_to_columns(headers, [], schema=schema, categorical=categorical)
+
+    # Infer starting types once, from a bounded prefix, so every worker
+    # begins from the same schema; workers may still widen them and
+    # concat_columns reconciles the parts
+    sample_start = ranges[0][0]
+    sample_end = _sample_end(filepath, sample_start, ranges[0][1], quotechar)
+    sample = _read_range_rows(filepath, sample_start, sample_end, delimiter, quotechar, encoding)
+    hints = infer_schema(headers, sample[:SAMPLE_ROWS])
+    if categorical:
+        hints = {name: 'category' if t == 'str' else t for name, t in hints.items()}
+
+    tasks = [(filepath, start, end, delimiter, quotechar, encoding, headers, schema, hints,
+              categorical) for start, end in ranges]
+    parts = list(_run_ordered(tasks, workers))
+
+    # A column one range had to widen to text is re-parsed as text in the
+    # ranges that kept it typed, so their values keep their original text
+    widened = {name for name in headers
+               if len({is_text_column(part[name]) for part in parts}) > 1}
+    if widened:
+        string_type = 'category' if categorical else 'str'
+        text_schema = dict(schema or {}, **{name: string_type for name in widened})
+        for i, (start, end) in enumerate(ranges):
+            if not all(is_text_column(parts[i][name]) for name in widened):
+                rows = _read_range_rows(filepath, start, end, delimiter, quotechar, encoding)
+                parts[i] = rows_to_columns(headers, [rows], schema=text_schema,
+                                           categorical=categorical, hints=hints)
+    return concat_columns(parts)
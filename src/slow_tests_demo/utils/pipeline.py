@@ -0,0 +1,280 @@
+"""Chunk-streaming transformation pipelines."""
+import os
+import time
+import random
+import queue
+import threading
+import pandas as pd
+from itertools import islice
+
+from slow_tests_demo.utils.data_processing import transform_dataframe
+from slow_tests_demo.utils.file_operations import (
+    iter_json_array, open_file, detect_format, detect_compression, JSON_ENCODING
+)
+
+
+_END = object()
+
+
+class StageStats:
+    """Throughput counters for a single pipeline stage."""
+
+    def __init__(self, name):
+        """
+        Initialize empty counters.
+
+        Args:
+            name: Stage name (read, transform or write)
+        """
+        self.name = name
+        self.chunks = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    def record(self, rows, seconds):
+        """Record one processed chunk."""
+        self.chunks += 1
+        self.rows += rows
+        self.seconds += seconds
+
+    @property
+    def rows_per_second(self):
+        """Rows processed per second of time spent in this stage."""
+        if self.seconds == 0:
+            return 0.0
+        return self.rows / self.seconds
+
+    def to_dict(self):
+        """Convert the counters to a dictionary."""
+        return {
+            'chunks': self.chunks,
+            'rows': self.rows,
+            'seconds': self.seconds,
+            'rows_per_second': self.rows_per_second
+        }
+
+
+class PipelineStats:
+    """Per-stage throughput report for a pipeline run."""
+
+    def __init__(self):
+        """Initialize counters for the read, transform and write stages."""
+        self.read = StageStats('read')
+        self.transform = StageStats('transform')
+        self.write = StageStats('write')
+        self.total_seconds = 0.0
+
+    def to_dict(self):
+        """Convert the report to a dictionary."""
+        return {
+            'read': self.read.to_dict(),
+            'transform': self.transform.to_dict(),
+            'write': self.write.to_dict(),
+            'total_seconds': self.total_seconds
+        }
+
+
+class _Failure:
+    """Wraps an exception raised in a worker stage."""
+
+    def __init__(self, error):
+        """Wrap the exception to be re-raised by the consumer."""
+        self.error = error
+
+
+def _detect_format(filepath):
+    """Detect a file's format, naming NDJSON 'jsonl' as pandas does."""
+    file_format = detect_format(filepath)
+    return 'jsonl' if file_format == 'ndjson' else file_format
+
+
+def iter_dataframe_chunks(filepath, chunksize=10000, input_format=None):
+    """
+    Read a CSV or JSON file, optionally compressed, as a sequence of DataFrame chunks.
+
+    CSV, JSON Lines and top-level JSON array sources are all read
+    incrementally.
+
+    Args:
+        filepath: Path to the source file
+        chunksize: Number of rows per chunk
+        input_format: 'csv', 'json' or 'jsonl' (detected from extension if None)
+
+    Yields:
+        pandas DataFrames of at most ``chunksize`` rows
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    input_format = input_format or _detect_format(filepath)
+    compression = detect_compression(filepath)
+
+    if input_format == 'csv':
+        with pd.read_csv(filepath, chunksize=chunksize, compression=compression) as reader:
+            for chunk in reader:
+                yield chunk
+    elif input_format == 'jsonl':
+        with pd.read_json(filepath, lines=True, chunksize=chunksize,
+                          compression=compression) as reader:
+            for chunk in reader:
+                yield chunk
+    elif input_format == 'json':
+        records = iter_json_array(filepath)
+        while True:
+            batch = list(islice(records, chunksize))
+            if not batch:
+                return
+            yield pd.DataFrame(batch)
+    else:
+        raise ValueError(f"Unknown input format: {input_format}")
+
+
+class _ChunkWriter:
+    """Appends DataFrame chunks to a CSV, JSON or JSON Lines file."""
+
+    def __init__(self, filepath, output_format):
+        """Open the output file, writing the opening bracket of a JSON array."""
+        if output_format not in ('csv', 'json', 'jsonl'):
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        self.output_format = output_format
+        self.file = open_file(filepath, 'w', newline='',
+                              encoding=None if output_format == 'csv' else JSON_ENCODING)
+        self.chunks_written = 0
+
+        if output_format == 'json':
+            self.file.write('[')
+
+    def write(self, chunk):
+        """Append one chunk, writing the CSV header only with the first."""
+        if self.output_format == 'csv':
+            chunk.to_csv(self.file, header=self.chunks_written == 0, index=False)
+        elif self.output_format == 'jsonl':
+            if len(chunk):
+                self.file.write(chunk.to_json(orient='records', lines=True))
+                self.file.write('\n')
+        elif len(chunk):
+            records = chunk.to_json(orient='records')[1:-1]
+            if self.chunks_written:
+                self.file.write(',')
+            self.file.write(records)
+        if self.output_format != 'json' or len(chunk):
+            self.chunks_written += 1
+
+    def close(self):
+        """Close the JSON array, if any, and the file."""
+        if self.output_format == 'json':
+            self.file.write(']')
+        self.file.close()
+
+
+def run_pipeline(input_file, output_file, transformations=None, chunksize=10000,
+                 max_in_flight=4, input_format=None, output_format=None, delay=False):
+    """
+    Stream a file through a list of DataFrame transformations.
+
+    The source is read in chunks on a reader thread, each chunk is passed
+    through ``transform_dataframe`` on a transform thread, and the result
+    is appended to the output file. At most ``max_in_flight`` chunks are
+    held in memory at any time, so files far larger than memory can be
+    processed.
+
+    Args:
+        input_file: Path to the CSV/JSON source file
+        output_file: Path to the output file
+        transformations: List of transformation functions to apply
+        chunksize: Number of rows per chunk
+        max_in_flight: Maximum number of chunks read but not yet written
+        input_format: 'csv', 'json' or 'jsonl' (detected from extension if None)
+        output_format: 'csv', 'json' or 'jsonl' (detected from extension if None)
+        delay: Whether to add an artificial delay
+
+    Returns:
+        PipelineStats with per-stage throughput
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.7))
+
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    output_format = output_format or _detect_format(output_file)
+    chunks = iter_dataframe_chunks(input_file, chunksize=chunksize, input_format=input_format)
+    writer = _ChunkWriter(output_file, output_format)
+
+    stats = PipelineStats()
+    slots = threading.Semaphore(max_in_flight)
+    stop = threading.Event()
+    read_queue = queue.Queue()
+    write_queue = queue.Queue()
+
+    def acquire_slot():
+        while not stop.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def read_stage():
+        try:
+            while acquire_slot():
+                start = time.perf_counter()
+                chunk = next(chunks, _END)
+                if chunk is _END:
+                    slots.release()
+                    break
+                stats.read.record(len(chunk), time.perf_counter() - start)
+                read_queue.put(chunk)
+        except Exception as e:
+            read_queue.put(_Failure(e))
+            return
+        read_queue.put(_END)
+
+    def transform_stage():
+        while True:
+            item = read_queue.get()
+            if item is _END or isinstance(item, _Failure):
+                write_queue.put(item)
+                return
+            try:
+                start = time.perf_counter()
+                result = transform_dataframe(item, transformations)
+                stats.transform.record(len(result), time.perf_counter() - start)
+            except Exception as e:
+                write_queue.put(_Failure(e))
+                return
+            write_queue.put(result)
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=read_stage, daemon=True),
+        threading.Thread(target=transform_stage, daemon=True)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = write_queue.get()
+            if item is _END:
+                break
+            if isinstance(item, _Failure):
+                raise item.error
+            start = time.perf_counter()
+            writer.write(item)
+            stats.write.record(len(item), time.perf_counter() - start)
+            slots.release()
+    except BaseException:
+        stop.set()
+        writer.close()
+        if os.path.exists(output_file):
+            os.unlink(output_file)
+        raise
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        chunks.close()
+
+    writer.close()
+    stats.total_seconds = time.perf_counter() - started
+    return stats
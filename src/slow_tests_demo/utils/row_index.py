@@ -0,0 +1,356 @@
+"""Row-offset indexes for random access into large CSV and NDJSON files."""
+import io
+import os
+import csv
+import json
+import time
+import zlib
+import random
+import numpy as np
+from itertools import islice
+
+from slow_tests_demo.utils.file_operations import detect_format, detect_compression
+
+
+DEFAULT_EVERY = 1000
+
+INDEX_SUFFIX = '.idx'
+
+INDEX_VERSION = 2
+
+_SCAN_BLOCK = 4 * 1024 * 1024
+
+_FINGERPRINT_BYTES = 64 * 1024
+
+# ASCII bytes str.isspace() accepts; a line made only of these is blank
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+
+def index_path(filepath):
+    """Return the path of the sidecar index for a file."""
+    return filepath + INDEX_SUFFIX
+
+
+def _fingerprint(f, end):
+    """Checksum the first and last bytes of the indexed region."""
+    f.seek(0)
+    head = zlib.crc32(f.read(min(end, _FINGERPRINT_BYTES)))
+    f.seek(max(0, end - _FINGERPRINT_BYTES))
+    tail = zlib.crc32(f.read(end - f.tell()))
+    return head, tail
+
+
+class RowIndex:
+    """
+    Byte offsets of every Nth row of a file.
+
+    ``offsets[j]`` is the offset at which row ``j * every`` starts. Only
+    rows terminated by a newline are indexed: ``rows`` complete rows end
+    at byte ``end``, so a partially written last row is picked up once an
+    append completes it.
+    """
+
+    def __init__(self, every=DEFAULT_EVERY, quotechar='"', skip_blank=False):
+        """
+        Initialize an empty index.
+
+        Args:
+            every: Number of rows between recorded offsets
+            quotechar: CSV quote character, or None when newlines never
+                appear inside values (NDJSON)
+            skip_blank: Whether blank and whitespace-only lines are ignored
+                rather than counted
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.quotechar = quotechar
+        self.skip_blank = skip_blank
+        self.offsets = np.zeros(0, dtype=np.int64)
+        self.rows = 0
+        self.end = 0
+        self.fingerprint = (0, 0)
+
+    def _options(self):
+        quote = ord(self.quotechar) if self.quotechar else -1
+        return (self.every, quote, int(self.skip_blank))
+
+    def scan(self, filepath):
+        """
+        Index the complete rows after ``end``.
+
+        Newlines end a row only when the number of quote characters seen
+        since the row started is even, so quoted multi-line values are
+        handled without parsing.
+
+        Args:
+            filepath: Path to the indexed file
+        """
+        quote = ord(self.quotechar) if self.quotechar else None
+        new_offsets = []
+
+        with open(filepath, 'rb') as f:
+            f.seek(self.end)
+            pos = self.end
+            row_start = self.end
+            parity = 0
+            # Running count of non-whitespace bytes, at the block start and
+            # at the start of the current row
+            content = 0
+            row_content = 0
+
+            while True:
+                block = f.read(_SCAN_BLOCK)
+                if not block:
+                    break
+                buf = np.frombuffer(block, dtype=np.uint8)
+                newlines = np.flatnonzero(buf == 10)
+
+                if quote is not None:
+                    quotes = np.cumsum(buf == quote, dtype=np.int64)
+                    newlines = newlines[(quotes[newlines] + parity) % 2 == 0]
+                    parity = (parity + int(quotes[-1])) % 2
+
+                if len(newlines):
+                    ends = newlines + pos
+                    starts = np.concatenate(([row_start], ends[:-1] + 1))
+                    if self.skip_blank:
+                        counts = content + np.cumsum(~_WHITESPACE[buf], dtype=np.int64)
+                        at_ends = counts[newlines]
+                        at_starts = np.concatenate(([row_content], at_ends[:-1]))
+                        starts = starts[at_ends > at_starts]
+                        row_content = int(at_ends[-1])
+
+                    numbers = self.rows + np.arange(len(starts))
+                    new_offsets.append(starts[numbers % self.every == 0])
+                    self.rows += len(starts)
+                    row_start = int(ends[-1]) + 1
+
+                if self.skip_blank:
+                    content += int(np.count_nonzero(~_WHITESPACE[buf]))
+                pos += len(block)
+
+            self.end = row_start
+            self.fingerprint = _fingerprint(f, self.end)
+
+        if new_offsets:
+            self.offsets = np.concatenate([self.offsets] + new_offsets).astype(np.int64)
+
+    def locate(self, row):
+        """
+        Find where to start reading to reach a row.
+
+        Args:
+            row: Zero-based row number
+
+        Returns:
+            Tuple of (byte offset, rows to skip after seeking there)
+        """
+        if row >= self.rows:
+            return self.end, row - self.rows
+        block = row // self.every
+        return int(self.offsets[block]), row - block * self.every
+
+    def is_valid_for(self, filepath):
+        """Check that the file still starts with the indexed bytes."""
+        if os.path.getsize(filepath) < self.end:
+            return False
+        with open(filepath, 'rb') as f:
+            return _fingerprint(f, self.end) == self.fingerprint
+
+    def save(self, path):
+        """Write the index atomically to ``path``."""
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, version=INDEX_VERSION, options=self._options(), offsets=self.offsets,
+                     rows=self.rows, end=self.end, fingerprint=self.fingerprint)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read an index written by ``save``.
+
+        Args:
+            path: Path to the sidecar file
+
+        Returns:
+            RowIndex
+        """
+        with np.load(path) as data:
+            if int(data['version']) != INDEX_VERSION:
+                raise ValueError(f"Unsupported row index version: {int(data['version'])}")
+            every, quote, skip_blank = (int(v) for v in data['options'])
+            index = cls(every=every, quotechar=chr(quote) if quote >= 0 else None,
+                        skip_blank=bool(skip_blank))
+            index.offsets = data['offsets'].astype(np.int64)
+            index.rows = int(data['rows'])
+            index.end = int(data['end'])
+            index.fingerprint = tuple(int(v) for v in data['fingerprint'])
+        return index
+
+
+def _index_options(filepath, every, quotechar):
+    if detect_compression(filepath):
+        raise ValueError("Compressed files cannot be indexed; decompress them first")
+    file_format = detect_format(filepath)
+    if file_format == 'csv':
+        return file_format, RowIndex(every=every, quotechar=quotechar)
+    if file_format == 'ndjson':
+        return file_format, RowIndex(every=every, quotechar=None, skip_blank=True)
+    raise ValueError(f"Row indexes support CSV and NDJSON files, not {file_format}")
+
+
+def build_row_index(filepath, every=DEFAULT_EVERY, quotechar='"', delay=False):
+    """
+    Build a row index for a file and save it next to the file.
+
+    Args:
+        filepath: Path to a CSV or NDJSON file
+        every: Number of rows between recorded offsets
+        quotechar: CSV quote character
+        delay: Whether to add an artificial delay
+
+    Returns:
+        RowIndex
+    """
+    if delay:
+        time.sleep(random.uniform(0.3, 0.7))
+
+    _, index = _index_options(filepath, every, quotechar)
+    index.scan(filepath)
+    index.save(index_path(filepath))
+    return index
+
+
+def get_row_index(filepath, every=DEFAULT_EVERY, quotechar='"'):
+    """
+    Load the sidecar index for a file, bringing it up to date.
+
+    Rows appended since the index was written are scanned and added. The
+    index is rebuilt if it is missing, was built with other options, or
+    the indexed bytes have changed (the file was truncated or rewritten).
+
+    Args:
+        filepath: Path to a CSV or NDJSON file
+        every: Number of rows between recorded offsets
+        quotechar: CSV quote character
+
+    Returns:
+        RowIndex
+    """
+    _, fresh = _index_options(filepath, every, quotechar)
+    path = index_path(filepath)
+
+    try:
+        index = RowIndex.load(path)
+    except (OSError, ValueError, KeyError):
+        index = None
+
+    if index is None or index._options() != fresh._options() or not index.is_valid_for(filepath):
+        return build_row_index(filepath, every=every, quotechar=quotechar)
+
+    if os.path.getsize(filepath) > index.end:
+        index.scan(filepath)
+        index.save(path)
+    return index
+
+
+def _iter_rows(text, file_format, delimiter, quotechar):
+    if file_format == 'csv':
+        return csv.reader(text, delimiter=delimiter, quotechar=quotechar)
+    return (json.loads(line) for line in text if line.strip())
+
+
+def read_rows(filepath, start, stop=None, header=True, delimiter=',', quotechar='"',
+              every=DEFAULT_EVERY, encoding='utf-8', delay=False):
+    """
+    Read a range of rows by position without parsing the rows before it.
+
+    Args:
+        filepath: Path to a CSV or NDJSON file
+        start: Zero-based position of the first row
+        stop: Position after the last row (one row if None)
+        header: Whether a CSV file has a header row; positions then count
+            data rows only
+        delimiter: CSV delimiter
+        quotechar: CSV quote character
+        every: Number of rows between recorded offsets if an index is built
+        encoding: Text encoding of the file
+        delay: Whether to add an artificial delay
+
+    Returns:
+        List of rows (lists of strings for CSV, decoded records for NDJSON)
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+
+    stop = start + 1 if stop is None else stop
+    if start < 0 or stop < start:
+        raise ValueError("Row range must satisfy 0 <= start <= stop")
+
+    file_format, _ = _index_options(filepath, every, quotechar)
+    index = get_row_index(filepath, every=every, quotechar=quotechar)
+    first = start + (1 if header and file_format == 'csv' else 0)
+    offset, skip = index.locate(first)
+
+    with open(filepath, 'rb') as f:
+        f.seek(offset)
+        text = io.TextIOWrapper(f, encoding=encoding, newline='')
+        rows = _iter_rows(text, file_format, delimiter, quotechar)
+        return list(islice(rows, skip, skip + stop - start))
+
+
+def take_rows(filepath, positions, header=True, delimiter=',', quotechar='"',
+              every=DEFAULT_EVERY, encoding='utf-8', delay=False):
+    """
+    Read individual rows by position.
+
+    Positions falling in the same indexed block are read with one seek.
+
+    Args:
+        filepath: Path to a CSV or NDJSON file
+        positions: Iterable of zero-based row positions
+        header: Whether a CSV file has a header row
+        delimiter: CSV delimiter
+        quotechar: CSV quote character
+        every: Number of rows between recorded offsets if an index is built
+        encoding: Text encoding of the file
+        delay: Whether to add an artificial delay
+
+    Returns:
+        List of rows in the order of ``positions``; positions past the end
+        of the file are omitted
+    """
+    if delay:
+        time.sleep(random.uniform(0.2, 0.5))
+
+    positions = list(positions)
+    if any(position < 0 for position in positions):
+        raise ValueError("Row positions must be non-negative")
+
+    file_format, _ = _index_options(filepath, every, quotechar)
+    index = get_row_index(filepath, every=every, quotechar=quotechar)
+    shift = 1 if header and file_format == 'csv' else 0
+
+    found = {}
+    wanted = sorted(set(positions))
+    with open(filepath, 'rb') as f:
+        i = 0
+        while i < len(wanted):
+            offset, skip = index.locate(wanted[i] + shift)
+            base = wanted[i] - skip
+            # Every wanted row before the next recorded offset is reached from this seek
+            j = i + 1
+            while j < len(wanted) and wanted[j] < base + index.every:
+                j += 1
+            f.seek(offset)
+            text = io.TextIOWrapper(f, encoding=encoding, newline='')
+            rows = _iter_rows(text, file_format, delimiter, quotechar)
+            for position, row in enumerate(islice(rows, wanted[j - 1] - base + 1), base):
+                found[position] = row
+            text.detach()
+            i = j
+
+    return [found[position] for position in positions if position in found]
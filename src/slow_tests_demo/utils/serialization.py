@@ -0,0 +1,270 @@
+"""JSON serialization with pluggable backends."""
+import abc
+import json
+import math
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the environment
+    ujson = None
+
+
+def _default(obj):
+    """Convert numpy scalars and arrays, which no backend handles natively everywhere."""
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _chain_default(default):
+    """Return a hook trying numpy conversion first, then ``default``."""
+    if default is None:
+        return _default
+
+    def chained(obj):
+        try:
+            return _default(obj)
+        except TypeError:
+            return default(obj)
+    return chained
+
+
+def _has_non_finite(obj):
+    """Whether NaN or infinity occurs anywhere in a decoded-JSON-like object."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, (np.ndarray, np.floating)):
+            if value.dtype.kind in 'fc' and not np.isfinite(value).all():
+                return True
+    return False
+
+
+class JsonBackend(abc.ABC):
+    """Base class for JSON backends; ``dumps`` always returns ``str``."""
+
+    name = None
+
+    @abc.abstractmethod
+    def dumps(self, obj, indent=None, sort_keys=False, default=None):
+        """
+        Encode an object as JSON text.
+
+        Args:
+            obj: Object to encode
+            indent: Indentation width; compact output without spaces if None
+            sort_keys: Whether to sort dictionary keys
+            default: Function converting objects the backend cannot encode,
+                tried after the built-in numpy conversion
+
+        Returns:
+            JSON string
+        """
+
+    @abc.abstractmethod
+    def loads(self, text):
+        """Decode JSON text or bytes."""
+
+
+class StdlibBackend(JsonBackend):
+    """
+    The standard library ``json`` module.
+
+    Non-ASCII characters are written as they are, as the extension
+    backends do, rather than as ``\\u`` escapes.
+    """
+
+    name = 'json'
+
+    def __init__(self):
+        self._compact = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False,
+                                         default=_default)
+
+    def dumps(self, obj, indent=None, sort_keys=False, default=None):
+        if indent is None and not sort_keys and default is None:
+            return self._compact.encode(obj)
+        separators = (',', ':') if indent is None else None
+        return json.dumps(obj, indent=indent, separators=separators, sort_keys=sort_keys,
+                          ensure_ascii=False, default=_chain_default(default))
+
+    def loads(self, text):
+        return json.loads(text)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    The ``orjson`` extension module.
+
+    orjson only indents by two spaces and only encodes 64-bit integers, so
+    other indents and values it rejects are handed to the standard library.
+    It writes NaN and infinity as ``null`` and does not accept them on
+    input, so documents containing them are encoded and decoded by the
+    standard library too. Floats may be spelled differently from the
+    standard library (``1e16`` for ``1e+16``) but decode to the same values.
+    When a ``default`` hook is given, dates and dataclasses are passed to
+    it rather than encoded natively, as the standard library does.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        self._fallback = StdlibBackend()
+
+    def dumps(self, obj, indent=None, sort_keys=False, default=None):
+        if indent not in (None, 2):
+            return self._fallback.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            encoded = orjson.dumps(obj, default=_chain_default(default), option=option)
+        except TypeError:
+            return self._fallback.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+        # NaN and infinity come out as null; only look for them when it occurs
+        if b'null' in encoded and _has_non_finite(obj):
+            return self._fallback.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+        return encoded.decode()
+
+    def loads(self, text):
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            return self._fallback.loads(text)
+
+
+class UjsonBackend(JsonBackend):
+    """
+    The ``ujson`` extension module.
+
+    ujson rejects NaN, infinity and integers wider than 64 bits; documents
+    containing them are encoded by the standard library.
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        self._fallback = StdlibBackend()
+
+    def dumps(self, obj, indent=None, sort_keys=False, default=None):
+        try:
+            return ujson.dumps(obj, indent=indent or 0, sort_keys=sort_keys, ensure_ascii=False,
+                               escape_forward_slashes=False, default=_chain_default(default))
+        except OverflowError:
+            return self._fallback.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+
+    def loads(self, text):
+        return ujson.loads(text)
+
+
+_BACKENDS = {
+    'orjson': (OrjsonBackend, orjson),
+    'ujson': (UjsonBackend, ujson),
+    'json': (StdlibBackend, json)
+}
+
+_instances = {}
+
+_default_name = None
+
+
+def available_backends():
+    """Return the names of the installed backends, fastest first."""
+    return [name for name, (_, module) in _BACKENDS.items() if module is not None]
+
+
+def get_backend(name=None):
+    """
+    Return a backend instance.
+
+    Args:
+        name: 'orjson', 'ujson' or 'json' (the default backend if None)
+
+    Returns:
+        JsonBackend
+    """
+    name = name or _default_name or available_backends()[0]
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    backend_class, module = _BACKENDS[name]
+    if module is None:
+        raise ValueError(f"JSON backend {name} is not installed")
+    if name not in _instances:
+        _instances[name] = backend_class()
+    return _instances[name]
+
+
+def set_default_backend(name=None):
+    """
+    Choose the backend used when none is given.
+
+    Args:
+        name: Backend name, or None to select the fastest installed one
+    """
+    global _default_name
+    if name is not None:
+        get_backend(name)
+    _default_name = name
+
+
+def dumps(obj, indent=None, sort_keys=False, backend=None, default=None):
+    """
+    Encode an object as JSON text.
+
+    Args:
+        obj: Object to encode; numpy scalars and arrays are supported
+        indent: Indentation width; compact output without spaces if None
+        sort_keys: Whether to sort dictionary keys
+        backend: Backend name (the default backend if None)
+        default: Function converting other objects to encodable ones
+
+    Returns:
+        JSON string
+    """
+    return get_backend(backend).dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+
+
+def loads(text, backend=None):
+    """
+    Decode JSON text or bytes.
+
+    Args:
+        text: JSON document
+        backend: Backend name (the default backend if None)
+
+    Returns:
+        Decoded object
+    """
+    return get_backend(backend).loads(text)
+
+
+def dump(obj, f, indent=None, sort_keys=False, backend=None):
+    """Encode an object as JSON and write it to a text file object."""
+    f.write(dumps(obj, indent=indent, sort_keys=sort_keys, backend=backend))
+
+
+def load(f, backend=None):
+    """Read and decode a JSON document from a file object."""
+    return loads(f.read(), backend=backend)
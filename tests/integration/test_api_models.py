@@ -54,6 +54,20 @@ class TestApiUsers:
         assert len(data) == 1
         assert data[0]["username"] == "testuser"
         assert data[0]["email"] == "test@example.com"
+        assert response.content_type == "application/json"
+    
+    def test_get_users_after_update(self, client, sample_user):
+        """Test that a listed user reflects changes made after a previous listing."""
+        time.sleep(0.2)
+        
+        users.clear()
+        users[sample_user.id] = sample_user
+        client.get('/api/users')
+        
+        sample_user.email = "updated@example.com"
+        data = json.loads(client.get('/api/users').data)
+        
+        assert data[0]["email"] == "updated@example.com"
     
     def test_get_user_not_found(self, client):
         """Test getting a non-existent user."""
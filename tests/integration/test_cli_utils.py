@@ -8,7 +8,7 @@ import pytest
 from click.testing import CliRunner
 
 from slow_tests_demo.cli.main import cli
-from slow_tests_demo.utils.file_operations import read_json_file, read_csv_file
+from slow_tests_demo.utils.file_operations import read_json_file, read_csv_file, read_columnar_file
 
 
 class TestCliCalculate:
@@ -144,6 +144,110 @@ class TestCliConvert:
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
+    
+    def test_convert_csv_to_columnar_and_back(self, temp_csv_file, tmpdir):
+        """Test converting CSV to the binary columnar format and back."""
+        time.sleep(0.2)
+        
+        columnar_path = os.path.join(tmpdir, "data.cols")
+        csv_path = os.path.join(tmpdir, "back.csv")
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ['convert', temp_csv_file, columnar_path, '--format', 'columnar'])
+        assert result.exit_code == 0
+        assert read_columnar_file(columnar_path)["value"].tolist() == [10, 20, 30]
+        
+        result = runner.invoke(cli, ['convert', columnar_path, csv_path, '--format', 'csv'])
+        assert result.exit_code == 0
+        assert read_csv_file(csv_path) == read_csv_file(temp_csv_file)
+    
+    def test_convert_onto_link_to_input(self, temp_csv_file, tmpdir):
+        """Test converting onto a symlink or hardlink of the input keeps the data."""
+        time.sleep(0.2)
+        
+        expected = read_csv_file(temp_csv_file)
+        symlink = os.path.join(tmpdir, "link.csv")
+        hardlink = os.path.join(tmpdir, "hard.csv")
+        os.symlink(temp_csv_file, symlink)
+        os.link(temp_csv_file, hardlink)
+        
+        runner = CliRunner()
+        for link in (symlink, hardlink):
+            result = runner.invoke(cli, ['convert', temp_csv_file, link, '--format', 'csv'])
+            assert result.exit_code == 0
+            assert read_csv_file(temp_csv_file) == expected
+    
+    def test_convert_to_columnar_keeps_unrelated_directory(self, temp_csv_file, tmpdir):
+        """Test that converting onto a non-empty unrelated directory leaves it alone."""
+        time.sleep(0.2)
+        
+        victim = os.path.join(tmpdir, "victim")
+        os.makedirs(os.path.join(victim, "sub"))
+        notes = os.path.join(victim, "sub", "notes.txt")
+        with open(notes, 'w') as f:
+            f.write("keep")
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ['convert', temp_csv_file, victim, '--format', 'columnar'])
+        
+        assert result.exit_code == 0
+        assert "Error" in result.output
+        with open(notes) as f:
+            assert f.read() == "keep"
+        assert os.listdir(victim) == ["sub"]
+    
+    def test_convert_json_object_to_csv(self, tmpdir):
+        """Test that a non-array JSON document cannot be converted to CSV."""
+        time.sleep(0.2)
+        
+        input_path = os.path.join(tmpdir, "object.json")
+        output_path = os.path.join(tmpdir, "object.csv")
+        with open(input_path, 'w') as f:
+            json.dump({"id": 1}, f)
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ['convert', input_path, output_path, '--format', 'csv'])
+        
+        assert result.exit_code == 0
+        assert "JSON data structure not supported" in result.output
+        assert not os.path.exists(output_path)
+    
+    def test_convert_csv_to_ndjson_and_back(self, temp_csv_file, tmpdir):
+        """Test converting CSV to NDJSON and NDJSON to JSON."""
+        time.sleep(0.2)
+        
+        ndjson_path = os.path.join(tmpdir, "items.ndjson")
+        json_path = os.path.join(tmpdir, "items.json")
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ['convert', temp_csv_file, ndjson_path, '--format', 'ndjson'])
+        assert result.exit_code == 0
+        
+        with open(ndjson_path, 'r') as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0]) == {"id": "1", "name": "Item 1", "value": "10"}
+        
+        result = runner.invoke(cli, ['convert', ndjson_path, json_path, '--format', 'json',
+                                     '--workers', '2'])
+        assert result.exit_code == 0
+        assert read_json_file(json_path)[2]["name"] == "Item 3"
+    
+    def test_convert_to_compressed_json(self, temp_csv_file, tmpdir):
+        """Test converting CSV to gzip-compressed JSON."""
+        time.sleep(0.2)
+        
+        output_path = os.path.join(tmpdir, "items.json.gz")
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ['convert', temp_csv_file, output_path, '--format', 'json',
+                                     '--compresslevel', '1'])
+        
+        assert result.exit_code == 0
+        with open(output_path, 'rb') as f:
+            assert f.read(2) == b"\x1f\x8b"
+        assert read_json_file(output_path)[0]["name"] == "Item 1"
+
 
 class TestCliUser:
     """Integration tests for the create_user CLI command."""
@@ -0,0 +1,72 @@
+"""Tests for asyncio file operations."""
+import os
+import time
+import asyncio
+import pytest
+
+from slow_tests_demo.utils.async_file_operations import (
+    read_json_file_async, write_json_file_async, read_csv_file_async, write_csv_file_async,
+    read_many_async
+)
+
+
+class TestAsyncFileOperations:
+    """Tests for the async file operation variants."""
+
+    def test_json_round_trip(self, tmpdir):
+        """Test writing and reading JSON asynchronously."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "async.json")
+        data = [{"id": 1, "name": "Item 1"}]
+
+        async def run():
+            await write_json_file_async(data, filepath)
+            return await read_json_file_async(filepath)
+
+        assert asyncio.run(run()) == data
+
+    def test_csv_round_trip(self, tmpdir):
+        """Test writing and reading CSV asynchronously."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "async.csv")
+        rows = [["id", "name"], ["1", "Item 1"]]
+
+        async def run():
+            await write_csv_file_async(rows, filepath)
+            return await read_csv_file_async(filepath, columns=["name"])
+
+        assert asyncio.run(run()) == [["name"], ["Item 1"]]
+
+    def test_read_many_in_order(self, temp_json_file, temp_csv_file):
+        """Test concurrent reads return results in input order."""
+        time.sleep(0.2)
+
+        results = asyncio.run(read_many_async([temp_csv_file, temp_json_file], limit=1))
+
+        assert results[0][0] == ["id", "name", "value"]
+        assert results[1][0]["id"] == 1
+
+    def test_read_many_collects_errors(self, temp_json_file, tmpdir):
+        """Test returning exceptions instead of raising."""
+        time.sleep(0.2)
+
+        missing = os.path.join(tmpdir, "missing.json")
+        results = asyncio.run(read_many_async([missing, temp_json_file], return_exceptions=True))
+
+        assert isinstance(results[0], FileNotFoundError)
+        assert len(results[1]) == 3
+
+    def test_cancellation(self, temp_json_file):
+        """Test that a pending read can be cancelled."""
+        time.sleep(0.2)
+
+        async def run():
+            task = asyncio.ensure_future(read_json_file_async(temp_json_file, delay=True))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
@@ -0,0 +1,98 @@
+"""Tests for the background buffered writer."""
+import os
+import sys
+import time
+import pytest
+import subprocess
+
+from slow_tests_demo.utils.buffered_writer import BufferedRecordWriter
+from slow_tests_demo.utils.file_operations import read_csv_file, read_ndjson_file
+
+
+class TestBufferedRecordWriter:
+    """Tests for BufferedRecordWriter."""
+
+    def test_csv_append_with_header(self, tmpdir):
+        """Test that the header is written once across reopened writers."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "events.csv")
+        for start in (0, 2):
+            with BufferedRecordWriter(filepath, headers=["id", "name"]) as writer:
+                writer.write([start, "a"])
+                writer.write_many([[start + 1, "b,c"]])
+
+        assert read_csv_file(filepath) == [["id", "name"], ["0", "a"], ["1", "b,c"],
+                                           ["2", "a"], ["3", "b,c"]]
+
+    def test_size_triggered_flush(self, tmpdir):
+        """Test that reaching max_records flushes without waiting for the interval."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "events.ndjson")
+        writer = BufferedRecordWriter(filepath, max_records=10, flush_interval=60)
+        try:
+            writer.write_many({"id": i} for i in range(25))
+            deadline = time.time() + 5
+            while writer.stats()['records_written'] < 20 and time.time() < deadline:
+                time.sleep(0.01)
+
+            assert writer.stats()['records_written'] >= 20
+            assert writer.stats()['max_queue_depth'] >= 10
+        finally:
+            writer.close()
+        assert [r["id"] for r in read_ndjson_file(filepath)] == list(range(25))
+
+    def test_time_triggered_flush_and_explicit_flush(self, tmpdir):
+        """Test interval-based flushing and flush()."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "events.jsonl")
+        with BufferedRecordWriter(filepath, flush_interval=0.05, fsync='flush') as writer:
+            writer.write({"id": 1})
+            time.sleep(0.3)
+            assert read_ndjson_file(filepath) == [{"id": 1}]
+
+            writer.write({"id": 2})
+            writer.flush()
+            assert len(read_ndjson_file(filepath)) == 2
+
+            stats = writer.stats()
+            assert stats['flushes'] == 2
+            assert stats['queue_depth'] == 0
+            assert stats['flush_seconds_max'] >= stats['flush_seconds_mean'] > 0
+
+    def test_flush_errors_are_raised(self, tmpdir):
+        """Test that an encoding failure surfaces on the caller's thread."""
+        time.sleep(0.2)
+
+        writer = BufferedRecordWriter(os.path.join(tmpdir, "bad.ndjson"))
+        writer.write({"value": object()})
+
+        with pytest.raises(RuntimeError):
+            writer.flush()
+        with pytest.raises(RuntimeError):
+            writer.close()
+
+    def test_unclosed_writer_flushed_at_exit(self, tmpdir):
+        """Test that records queued in a writer never closed are written at exit."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "events.ndjson")
+        script = (
+            "from slow_tests_demo.utils.buffered_writer import BufferedRecordWriter\n"
+            f"writer = BufferedRecordWriter({filepath!r}, flush_interval=60)\n"
+            "writer.write_many({'id': i} for i in range(5))\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, env=dict(os.environ))
+
+        assert read_ndjson_file(filepath) == [{"id": i} for i in range(5)]
+
+    def test_invalid_options(self, tmpdir):
+        """Test that invalid options are rejected."""
+        time.sleep(0.2)
+
+        with pytest.raises(ValueError):
+            BufferedRecordWriter(os.path.join(tmpdir, "x.csv"), fsync='sometimes')
+        with pytest.raises(ValueError):
+            BufferedRecordWriter(os.path.join(tmpdir, "x.json"))
@@ -0,0 +1,78 @@
+"""Tests for the bulk multi-file loader."""
+import os
+import time
+import json
+import pytest
+
+from slow_tests_demo.utils.bulk_loader import iter_load_files, load_files, expand_paths
+
+
+@pytest.fixture
+def json_files(tmpdir):
+    """Create five small JSON files."""
+    paths = []
+    for i in range(5):
+        filepath = os.path.join(tmpdir, f"part-{i}.json")
+        with open(filepath, 'w') as f:
+            json.dump([{"id": i}], f)
+        paths.append(filepath)
+    return paths
+
+
+class TestBulkLoader:
+    """Tests for concurrent multi-file loading."""
+
+    def test_ordered_results(self, json_files, temp_csv_file):
+        """Test results are yielded in input order with mixed formats."""
+        time.sleep(0.2)
+
+        paths = json_files + [temp_csv_file]
+        results = list(iter_load_files(paths, workers=3))
+
+        assert [r.path for r in results] == paths
+        assert results[2].data == [{"id": 2}]
+        assert results[-1].data[0] == ["id", "name", "value"]
+
+    def test_glob_pattern(self, json_files, tmpdir):
+        """Test expanding a glob pattern."""
+        time.sleep(0.2)
+
+        pattern = os.path.join(tmpdir, "part-*.json")
+
+        assert expand_paths(pattern) == sorted(json_files)
+        results, errors = load_files(pattern)
+        assert len(results) == 5
+        assert errors == {}
+
+    def test_errors_are_collected(self, json_files, tmpdir):
+        """Test a bad file does not abort the batch."""
+        time.sleep(0.2)
+
+        broken = os.path.join(tmpdir, "broken.json")
+        with open(broken, 'w') as f:
+            f.write("[{")
+        missing = os.path.join(tmpdir, "missing.json")
+
+        results, errors = load_files([broken] + json_files + [missing], workers=2)
+
+        assert list(results) == json_files
+        assert set(errors) == {broken, missing}
+        assert isinstance(errors[missing], FileNotFoundError)
+
+    def test_as_completed(self, json_files):
+        """Test unordered mode still yields every file once."""
+        time.sleep(0.2)
+
+        results = list(iter_load_files(json_files, ordered=False))
+
+        assert sorted(r.index for r in results) == list(range(5))
+        assert all(r.ok for r in results)
+
+    def test_process_pool(self, json_files):
+        """Test loading on a process pool."""
+        time.sleep(0.2)
+
+        results, errors = load_files(json_files, workers=2, use_processes=True)
+
+        assert results[json_files[4]] == [{"id": 4}]
+        assert errors == {}
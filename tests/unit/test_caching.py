@@ -0,0 +1,91 @@
+"""Tests for cached model serialization."""
+import json
+import time
+
+from slow_tests_demo.models.user import User
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.caching import cached_json
+
+
+class TestCachedSerialization:
+    """Tests for the to_dict / to_json caches."""
+
+    def test_to_json_matches_to_dict(self, sample_product):
+        """Test that the cached JSON decodes to the to_dict output."""
+        time.sleep(0.2)
+
+        assert json.loads(sample_product.to_json()) == sample_product.to_dict()
+        assert sample_product.to_json() is sample_product.to_json()
+
+    def test_assignment_invalidates(self, sample_user):
+        """Test that assigning a field refreshes the caches and the version."""
+        time.sleep(0.2)
+
+        version = sample_user.serialization_version
+        encoded = sample_user.to_json()
+        assert sample_user.serialization_version == version
+
+        sample_user.email = "changed@example.com"
+
+        assert sample_user.serialization_version != version
+        assert sample_user.to_dict()["email"] == "changed@example.com"
+        assert json.loads(sample_user.to_json())["email"] == "changed@example.com"
+        assert sample_user.to_json() != encoded
+
+    def test_equal_value_of_another_type_invalidates(self):
+        """Test that replacing a value by an equal one of another type is seen."""
+        time.sleep(0.2)
+
+        product = Product("Widget", 10)
+        assert product.to_json() == product.to_json()
+
+        product.price = 10.0
+
+        assert json.loads(product.to_json())["price"] == 10.0
+        assert b'"price":10.0' in product.to_json()
+        assert type(product.to_dict()["price"]) is float
+
+    def test_cached_json_for_many_models(self):
+        """Test filling and reusing the caches of a collection in one call."""
+        time.sleep(0.2)
+
+        products = Product.from_dicts([{"name": f"Item {i}", "price": i * 1.5, "category": "Tools"}
+                                       for i in range(4)])
+        users = [User("alice", "alice@example.com", first_name="Ann")]
+        first = products[0].to_json()
+        version = products[0].serialization_version
+
+        encoded = cached_json(products + users)
+
+        assert [json.loads(text) for text in encoded] == [
+            model.to_dict() for model in products + users
+        ]
+        assert encoded[0] is first
+        assert products[0].serialization_version == version
+        assert all(product.to_json() is text for product, text in zip(products, encoded))
+
+        products[1].price = 2
+        refreshed = cached_json(products)
+
+        assert json.loads(refreshed[1])["price"] == 2
+        assert refreshed[2] is encoded[2]
+
+    def test_to_dict_returns_copies(self, sample_product):
+        """Test that mutating a returned dict does not leak into the cache."""
+        time.sleep(0.2)
+
+        result = sample_product.to_dict()
+        result["discounted_price"] = 1.0
+
+        assert "discounted_price" not in sample_product.to_dict()
+        assert "discounted_price" not in json.loads(sample_product.to_json())
+
+    def test_versions_are_unique_across_instances(self):
+        """Test that versions can be used as cache keys without the id."""
+        time.sleep(0.2)
+
+        products = Product.from_dicts([{"name": "Widget", "price": 1.0}] * 3)
+        users = [User("alice", "alice@example.com")]
+
+        versions = [model.serialization_version for model in products + users]
+        assert len(set(versions)) == len(versions)
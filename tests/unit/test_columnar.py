@@ -0,0 +1,146 @@
+"""Tests for typed columnar readers and writers."""
+import os
+import time
+import pytest
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.utils.columnar import read_csv_columns, infer_schema, write_csv_columns
+from slow_tests_demo.utils.file_operations import write_csv_file
+from slow_tests_demo.utils.data_processing import process_data, clean_data
+
+
+@pytest.fixture
+def typed_csv_file(tmpdir):
+    """Fixture providing a CSV file with mixed column types."""
+    filepath = os.path.join(tmpdir, "typed.csv")
+    with open(filepath, 'w') as f:
+        f.write("id,price,category,active\n")
+        f.write("1,9.5,books,true\n")
+        f.write("2,,games,false\n")
+        f.write("3,20,books,TRUE\n")
+    return filepath
+
+
+class TestReadCsvColumns:
+    """Tests for the read_csv_columns function."""
+
+    def test_inferred_types(self, typed_csv_file):
+        """Test schema inference."""
+        time.sleep(0.2)
+
+        columns = read_csv_columns(typed_csv_file)
+
+        assert columns['id'].dtype == np.int64
+        assert columns['price'].dtype == np.float64
+        assert np.isnan(columns['price'][1])
+        assert list(columns['category']) == ["books", "games", "books"]
+        assert list(columns['active']) == [True, False, True]
+
+    def test_explicit_schema(self, typed_csv_file):
+        """Test parsing with an explicit schema."""
+        time.sleep(0.2)
+
+        columns = read_csv_columns(typed_csv_file, schema={'id': 'float64', 'category': 'category'})
+
+        assert columns['id'].dtype == np.float64
+        assert isinstance(columns['category'], pd.Categorical)
+        assert list(columns['category'].categories) == ["books", "games"]
+
+    def test_explicit_schema_mismatch(self, typed_csv_file):
+        """Test that values not matching an explicit schema raise."""
+        time.sleep(0.2)
+
+        with pytest.raises(ValueError):
+            read_csv_columns(typed_csv_file, schema={'category': 'int64'})
+
+    def test_promotion_across_batches(self, tmpdir):
+        """Test widening a column when a later batch does not fit."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "promote.csv")
+        with open(filepath, 'w') as f:
+            f.write("value\n1\n2\n3.5\n")
+
+        columns = read_csv_columns(filepath, batch_size=2)
+
+        assert columns['value'].dtype == np.float64
+        assert list(columns['value']) == [1.0, 2.0, 3.5]
+
+    def test_widening_to_text_keeps_source_text(self, tmpdir):
+        """Test that earlier batches keep their original text when a column becomes a string column."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "widen.csv")
+        with open(filepath, 'w') as f:
+            f.write("number,flag,amount\n1,yes,1.50\n2,no,2\nabc,maybe,x\n")
+
+        for categorical in (False, True):
+            columns = read_csv_columns(filepath, batch_size=2, categorical=categorical)
+
+            assert list(columns['number']) == ['1', '2', 'abc']
+            assert list(columns['flag']) == ['yes', 'no', 'maybe']
+            assert list(columns['amount']) == ['1.50', '2', 'x']
+
+    def test_feeds_data_processing(self, typed_csv_file):
+        """Test that columns go straight into process_data and clean_data."""
+        time.sleep(0.2)
+
+        columns = read_csv_columns(typed_csv_file, categorical=True)
+
+        assert process_data(columns['id'], operation="sum") == 6
+        assert len(clean_data(pd.DataFrame(columns))) == 2
+
+    def test_infer_schema(self):
+        """Test infer_schema on sample rows."""
+        time.sleep(0.2)
+
+        schema = infer_schema(["a", "b", "c"], [["1", "x", "1.5"], ["2", "y", ""]])
+
+        assert schema == {'a': 'int64', 'b': 'str', 'c': 'float64'}
+
+
+class TestWriteCsvColumns:
+    """Tests for the vectorized CSV writer."""
+
+    def test_matches_write_csv_file(self, tmpdir):
+        """Test output is byte-identical to write_csv_file for quoted strings."""
+        time.sleep(0.2)
+
+        expected_path = os.path.join(tmpdir, "expected.csv")
+        actual_path = os.path.join(tmpdir, "actual.csv")
+        names = ["plain", "with,comma", 'with "quote"', "multi\nline"]
+        write_csv_file([["id", "name"]] + [[i, name] for i, name in enumerate(names)], expected_path)
+
+        count = write_csv_columns({"id": np.arange(4), "name": np.array(names)}, actual_path,
+                                  block_size=3)
+
+        assert count == 4
+        with open(expected_path, 'rb') as expected, open(actual_path, 'rb') as actual:
+            assert actual.read() == expected.read()
+
+    def test_dataframe_round_trip(self, tmpdir):
+        """Test writing a DataFrame with missing values and categoricals."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "frame.csv.gz")
+        df = pd.DataFrame({
+            "price": [1.25, np.nan, 3.0],
+            "flag": [True, False, True],
+            "category": pd.Categorical(["a", None, "b"])
+        })
+
+        write_csv_columns(df, filepath)
+        columns = read_csv_columns(filepath)
+
+        assert columns["price"][0] == 1.25
+        assert np.isnan(columns["price"][1])
+        assert columns["flag"].tolist() == [True, False, True]
+        assert columns["category"].tolist() == ["a", "", "b"]
+
+    def test_mismatched_lengths(self, tmpdir):
+        """Test that columns of different lengths are rejected."""
+        time.sleep(0.2)
+
+        with pytest.raises(ValueError):
+            write_csv_columns({"a": np.arange(2), "b": np.arange(3)}, os.path.join(tmpdir, "x.csv"))
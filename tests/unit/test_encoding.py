@@ -0,0 +1,59 @@
+"""Tests for streaming model JSON encoding."""
+import io
+import json
+import math
+import time
+import numpy as np
+import pytest
+
+from slow_tests_demo.models.user import User
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.encoding import iter_json, write_json, dumps, encode_value
+
+
+class TestModelEncoding:
+    """Tests for iter_json, write_json and dumps."""
+
+    def test_matches_to_dict(self):
+        """Test that the output decodes to the models' to_dict output across chunks."""
+        time.sleep(0.2)
+
+        models = [Product(f'Item "{i}" é', i * 1.5, category="Tools" if i % 2 else None)
+                  for i in range(25)]
+        models += [User("alice", "alice@example.com", first_name="Al\nice"),
+                   User("bob", "bob@example.com")]
+        models.append(Product("Widget", 3))
+
+        chunks = list(iter_json(models, chunk_size=4))
+
+        assert len(chunks) > 3
+        assert json.loads(b''.join(chunks)) == [model.to_dict() for model in models]
+
+    def test_unusual_values(self):
+        """Test NaN, numpy scalars, booleans and empty collections."""
+        time.sleep(0.2)
+
+        products = [Product("Widget", float('nan')), Product("Gadget", np.float64(2.5)),
+                    Product("Gizmo", True, description=["a", 1])]
+
+        data = json.loads(dumps(products))
+
+        # null with orjson, NaN with the standard library backend
+        assert data[0]["price"] is None or math.isnan(data[0]["price"])
+        assert data[1]["price"] == 2.5
+        assert data[2]["price"] is True
+        assert data[2]["description"] == ["a", 1]
+        assert json.loads(dumps([])) == []
+        assert encode_value(None) == 'null'
+        with pytest.raises(ValueError):
+            list(iter_json([], chunk_size=0))
+
+    def test_write_json(self, sample_user):
+        """Test writing to a binary file object."""
+        time.sleep(0.2)
+
+        buffer = io.BytesIO()
+        written = write_json(iter([sample_user] * 3), buffer, chunk_size=2)
+
+        assert written == len(buffer.getvalue())
+        assert json.loads(buffer.getvalue()) == [sample_user.to_dict()] * 3
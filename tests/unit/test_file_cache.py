@@ -0,0 +1,126 @@
+"""Tests for the parsed-file cache."""
+import os
+import time
+import json
+import pytest
+from types import MappingProxyType
+
+from slow_tests_demo.utils.file_cache import ParsedFileCache, copy_parsed, estimate_size
+from slow_tests_demo.utils.file_operations import read_json_file, read_csv_file
+
+
+def _age(filepath, seconds=10):
+    """Move a file's mtime into the past so the cache trusts it."""
+    past = time.time() - seconds
+    os.utime(filepath, (past, past))
+
+
+class TestParsedFileCache:
+    """Tests for the ParsedFileCache class."""
+
+    def test_hit_returns_copy(self, temp_json_file):
+        """Test that repeated reads hit the cache and return independent copies."""
+        time.sleep(0.2)
+
+        _age(temp_json_file)
+        cache = ParsedFileCache()
+
+        first = read_json_file(temp_json_file, cache=cache)
+        first[0]["name"] = "changed"
+        second = read_json_file(temp_json_file, cache=cache)
+
+        assert second[0]["name"] == "Item 1"
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_modified_file_is_reloaded(self, temp_json_file):
+        """Test that a changed file is never served stale."""
+        time.sleep(0.2)
+
+        _age(temp_json_file, 20)
+        cache = ParsedFileCache()
+        read_json_file(temp_json_file, cache=cache)
+
+        with open(temp_json_file, 'w') as f:
+            json.dump([{"id": 9}], f)
+        _age(temp_json_file, 10)
+
+        assert read_json_file(temp_json_file, cache=cache) == [{"id": 9}]
+        assert cache.stats()['misses'] == 2
+
+    def test_fresh_file_not_cached(self, temp_csv_file):
+        """Test that files modified very recently are not cached."""
+        time.sleep(0.2)
+
+        cache = ParsedFileCache(min_age=60)
+        read_csv_file(temp_csv_file, cache=cache)
+        read_csv_file(temp_csv_file, cache=cache)
+
+        assert cache.stats()['entries'] == 0
+        assert cache.stats()['misses'] == 2
+
+    def test_options_are_part_of_key(self, temp_csv_file):
+        """Test that different parse options are cached separately."""
+        time.sleep(0.2)
+
+        _age(temp_csv_file)
+        cache = ParsedFileCache()
+
+        full = read_csv_file(temp_csv_file, cache=cache)
+        projected = read_csv_file(temp_csv_file, columns=["id"], cache=cache)
+
+        assert full[0] == ["id", "name", "value"]
+        assert projected[0] == ["id"]
+        assert cache.stats()['entries'] == 2
+
+    def test_lru_eviction(self, tmpdir):
+        """Test eviction of least recently used entries by estimated size."""
+        time.sleep(0.2)
+
+        paths = []
+        for i in range(3):
+            filepath = os.path.join(tmpdir, f"data{i}.json")
+            with open(filepath, 'w') as f:
+                json.dump([{"id": j, "name": "x" * 50} for j in range(20)], f)
+            _age(filepath)
+            paths.append(filepath)
+
+        entry_size = estimate_size(read_json_file(paths[0]))
+        cache = ParsedFileCache(max_bytes=int(entry_size * 2.5))
+        read_json_file(paths[0], cache=cache)
+        read_json_file(paths[1], cache=cache)
+        read_json_file(paths[0], cache=cache)
+        read_json_file(paths[2], cache=cache)
+
+        assert cache.stats()['evictions'] == 1
+        read_json_file(paths[0], cache=cache)
+        assert cache.stats()['hits'] == 2
+        read_json_file(paths[1], cache=cache)
+        assert cache.stats()['misses'] == 4
+
+    def test_frozen_results(self, temp_json_file):
+        """Test that frozen mode returns shared read-only values."""
+        time.sleep(0.2)
+
+        _age(temp_json_file)
+        cache = ParsedFileCache(frozen=True)
+
+        first = read_json_file(temp_json_file, cache=cache)
+        second = read_json_file(temp_json_file, cache=cache)
+
+        assert first is second
+        assert isinstance(first, tuple)
+        assert isinstance(first[0], MappingProxyType)
+        with pytest.raises(TypeError):
+            first[0]["name"] = "changed"
+
+    def test_copy_parsed(self):
+        """Test that containers are copied and scalars shared."""
+        time.sleep(0.2)
+
+        data = {"rows": [["a", "b"]], "meta": {"count": 1}}
+        copied = copy_parsed(data)
+
+        assert copied == data
+        assert copied["rows"] is not data["rows"]
+        assert copied["rows"][0] is not data["rows"][0]
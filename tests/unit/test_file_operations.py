@@ -3,9 +3,16 @@ import os
 import time
 import random
 import json
+import numpy as np
+import pandas as pd
 import pytest
 
-from slow_tests_demo.utils.file_operations import read_json_file, write_json_file, read_csv_file, write_csv_file
+from slow_tests_demo.utils.file_operations import (
+    read_json_file, write_json_file, read_csv_file, write_csv_file, iter_csv_rows, iter_csv_batches,
+    parse_predicate, iter_json_array, write_json_array, read_ndjson_file, iter_ndjson_batches,
+    write_ndjson_file, detect_format, detect_compression, open_file, write_columnar_file,
+    read_columnar_file
+)
 
 
 class TestJsonOperations:
@@ -41,6 +48,81 @@ class TestJsonOperations:
         
         assert written_data == data
     
+    def test_read_json_projection_and_filter(self, temp_json_file):
+        """Test reading selected keys of matching JSON records."""
+        time.sleep(0.2)
+        
+        data = read_json_file(temp_json_file, columns=["name"], where="value >= 20")
+        
+        assert data == [{"name": "Item 2"}, {"name": "Item 3"}]
+    
+    def test_read_json_filter_requires_array(self, tmpdir):
+        """Test that filtering a non-array JSON document raises."""
+        time.sleep(0.2)
+        
+        filepath = os.path.join(tmpdir, "object.json")
+        write_json_file({"id": 1}, filepath)
+        
+        with pytest.raises(ValueError):
+            read_json_file(filepath, where=("id", "==", 1))
+    
+    def test_iter_json_array(self, temp_json_file):
+        """Test streaming the elements of a JSON array."""
+        time.sleep(0.2)
+        
+        items = iter_json_array(temp_json_file, buffer_size=4)
+        
+        assert next(items) == {"id": 1, "name": "Item 1", "value": 10}
+        assert list(items) == read_json_file(temp_json_file)[1:]
+    
+    def test_iter_json_array_read_boundaries(self, tmpdir):
+        """Test that elements split at every possible read boundary decode whole."""
+        time.sleep(0.2)
+        
+        filepath = os.path.join(tmpdir, "numbers.json")
+        text = '[1.5, 2, -3e10,4.25E-2 , {"a": [1.0e+5, "x,]"]}, true,null]'
+        with open(filepath, 'w') as f:
+            f.write(text)
+        expected = json.loads(text)
+        
+        for buffer_size in range(1, len(text) + 1):
+            assert list(iter_json_array(filepath, buffer_size=buffer_size)) == expected
+    
+    def test_iter_json_array_invalid(self, tmpdir):
+        """Test that non-array and truncated documents raise."""
+        time.sleep(0.2)
+        
+        filepath = os.path.join(tmpdir, "bad.json")
+        for content in ['{"id": 1}', '[1, 2', '[1 2]']:
+            with open(filepath, 'w') as f:
+                f.write(content)
+            with pytest.raises(ValueError):
+                list(iter_json_array(filepath, buffer_size=2))
+    
+    def test_write_json_array(self, tmpdir):
+        """Test streaming a generator to a JSON array."""
+        time.sleep(0.2)
+        
+        filepath = os.path.join(tmpdir, "stream.json")
+        count = write_json_array(({"id": i} for i in range(3)), filepath)
+        
+        with open(filepath, 'r') as f:
+            assert f.read() == '[{"id":0},{"id":1},{"id":2}]'
+        assert count == 3
+    
+    def test_write_json_array_indent(self, tmpdir):
+        """Test that indented output matches write_json_file."""
+        time.sleep(0.2)
+        
+        data = [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}]
+        streamed = os.path.join(tmpdir, "streamed.json")
+        regular = os.path.join(tmpdir, "regular.json")
+        write_json_array(iter(data), streamed, indent=2)
+        write_json_file(data, regular)
+        
+        with open(streamed, 'r') as f1, open(regular, 'r') as f2:
+            assert f1.read() == f2.read()
+    
     def test_read_with_delay(self, temp_json_file):
         """Test reading a JSON file with delay."""
         time.sleep(0.2)
@@ -83,6 +165,29 @@ class TestCsvOperations:
         assert rows[2] == ["2", "Item 2", "20"]
         assert rows[3] == ["3", "Item 3", "30"]
     
+    def test_read_csv_projection_and_filter(self, temp_csv_file):
+        """Test reading selected columns of matching CSV rows."""
+        time.sleep(0.2)
+        
+        rows = read_csv_file(temp_csv_file, columns=["value", "id"], where=("value", ">", 10))
+        
+        assert rows == [["value", "id"], ["20", "2"], ["30", "3"]]
+    
+    def test_read_csv_string_filter(self, temp_csv_file):
+        """Test filtering CSV rows on a string column."""
+        time.sleep(0.2)
+        
+        rows = list(iter_csv_rows(temp_csv_file, columns=["id"], where='name == "Item 3"'))
+        
+        assert rows == [["id"], ["3"]]
+    
+    def test_read_csv_unknown_column(self, temp_csv_file):
+        """Test that projecting an unknown column raises."""
+        time.sleep(0.2)
+        
+        with pytest.raises(ValueError):
+            read_csv_file(temp_csv_file, columns=["missing"])
+    
     def test_write_csv_file(self, tmpdir):
         """Test writing a CSV file."""
         time.sleep(0.2)
@@ -127,3 +232,256 @@ class TestCsvOperations:
         
         assert os.path.exists(filepath)
         assert end_time - start_time >= 0.2  # Should have at least the minimum delay
+    
+    def test_iter_csv_rows(self, temp_csv_file):
+        """Test streaming rows from a CSV file."""
+        time.sleep(0.2)
+        
+        rows = iter_csv_rows(temp_csv_file, buffer_size=16)
+        
+        assert not isinstance(rows, list)
+        assert next(rows) == ["id", "name", "value"]
+        assert list(rows) == read_csv_file(temp_csv_file)[1:]
+    
+    def test_iter_csv_batches(self, temp_csv_file):
+        """Test streaming fixed-size batches from a CSV file."""
+        time.sleep(0.2)
+        
+        batches = list(iter_csv_batches(temp_csv_file, batch_size=3))
+        
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert batches[1] == [["3", "Item 3", "30"]]
+        
+        with pytest.raises(ValueError):
+            list(iter_csv_batches(temp_csv_file, batch_size=0))
+
+
+class TestNdjsonOperations:
+    """Tests for NDJSON file operations."""
+    
+    def test_write_and_read_ndjson(self, tmpdir):
+        """Test an NDJSON round trip."""
+        time.sleep(0.2)
+        
+        records = [{"id": i, "name": f"Item {i}\n"} for i in range(5)]
+        filepath = os.path.join(tmpdir, "records.ndjson")
+        
+        assert write_ndjson_file(iter(records), filepath, batch_size=2) == 5
+        with open(filepath, 'r') as f:
+            assert len(f.readlines()) == 5
+        assert read_ndjson_file(filepath) == records
+    
+    def test_batches_skip_blank_lines(self, tmpdir):
+        """Test batched reading with blank lines."""
+        time.sleep(0.2)
+        
+        filepath = os.path.join(tmpdir, "blank.ndjson")
+        with open(filepath, 'w') as f:
+            f.write('{"id": 1}\n\n{"id": 2}\n{"id": 3}\n')
+        
+        batches = list(iter_ndjson_batches(filepath, batch_size=2))
+        
+        assert batches == [[{"id": 1}], [{"id": 2}, {"id": 3}]]
+    
+    def test_parallel_read(self, tmpdir):
+        """Test decoding lines in worker processes."""
+        time.sleep(0.2)
+        
+        records = [{"id": i} for i in range(50)]
+        filepath = os.path.join(tmpdir, "parallel.ndjson")
+        write_ndjson_file(records, filepath)
+        
+        batches = list(iter_ndjson_batches(filepath, batch_size=7, workers=2))
+        
+        assert [record for batch in batches for record in batch] == records
+    
+    def test_invalid_line(self, tmpdir):
+        """Test that the offending line number is reported."""
+        time.sleep(0.2)
+        
+        filepath = os.path.join(tmpdir, "invalid.ndjson")
+        with open(filepath, 'w') as f:
+            f.write('{"id": 1}\n\n{bad\n')
+        
+        with pytest.raises(ValueError) as excinfo:
+            read_ndjson_file(filepath)
+        
+        assert "line 3" in str(excinfo.value)
+    
+    def test_detect_format(self):
+        """Test format detection from extensions."""
+        time.sleep(0.2)
+        
+        assert detect_format("data.JSON") == "json"
+        assert detect_format("data.jsonl") == "ndjson"
+        assert detect_format("data.ndjson") == "ndjson"
+        assert detect_format("data.txt") == "csv"
+
+
+class TestCompressedFiles:
+    """Tests for transparent compression support."""
+    
+    @pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz"])
+    def test_json_round_trip(self, tmpdir, extension):
+        """Test writing and reading compressed JSON."""
+        time.sleep(0.2)
+        
+        data = [{"id": i, "name": f"Item {i}"} for i in range(20)]
+        filepath = os.path.join(tmpdir, "data.json" + extension)
+        write_json_file(data, filepath, compresslevel=1)
+        
+        assert detect_compression(filepath) == extension.lstrip(".").replace("gz", "gzip")
+        assert read_json_file(filepath) == data
+        assert list(iter_json_array(filepath)) == data
+    
+    def test_csv_detected_by_magic_bytes(self, tmpdir):
+        """Test reading a compressed CSV file without a compression extension."""
+        time.sleep(0.2)
+        
+        rows = [["id", "name"], ["1", "Item 1"]]
+        compressed = os.path.join(tmpdir, "data.csv.gz")
+        renamed = os.path.join(tmpdir, "data.csv")
+        write_csv_file(rows, compressed)
+        os.rename(compressed, renamed)
+        
+        with open(renamed, 'rb') as f:
+            assert f.read(2) == b"\x1f\x8b"
+        assert detect_compression(renamed) == "gzip"
+        assert read_csv_file(renamed) == rows
+    
+    def test_text_starting_like_bz2_magic(self, tmpdir):
+        """Test that only 'BZh' followed by a block size digit is taken as bz2."""
+        time.sleep(0.2)
+        
+        rows = [["BZhx", "name"], ["1", "Item 1"]]
+        filepath = os.path.join(tmpdir, "data.csv")
+        write_csv_file(rows, filepath)
+        
+        assert detect_compression(filepath) is None
+        assert read_csv_file(filepath) == rows
+        
+        compressed = os.path.join(tmpdir, "data.csv.bz2")
+        renamed = os.path.join(tmpdir, "renamed.csv")
+        write_csv_file(rows, compressed)
+        os.rename(compressed, renamed)
+        assert detect_compression(renamed) == "bz2"
+    
+    def test_ndjson_compression_level(self, tmpdir):
+        """Test that the compression level is applied."""
+        time.sleep(0.2)
+        
+        records = [{"id": i, "name": "same text " * 5} for i in range(500)]
+        fast = os.path.join(tmpdir, "fast.ndjson.gz")
+        small = os.path.join(tmpdir, "small.ndjson.gz")
+        write_ndjson_file(records, fast, compresslevel=0)
+        write_ndjson_file(records, small, compresslevel=9)
+        
+        assert os.path.getsize(small) < os.path.getsize(fast)
+        assert read_ndjson_file(small) == records
+    
+    def test_uncompressed_passthrough(self, temp_csv_file):
+        """Test that plain files are opened normally."""
+        time.sleep(0.2)
+        
+        assert detect_compression(temp_csv_file) is None
+        assert detect_format(temp_csv_file + ".bz2") == "csv"
+        with open_file(temp_csv_file) as f:
+            assert f.readline().strip() == "id,name,value"
+
+
+class TestColumnarFiles:
+    """Tests for the binary columnar format."""
+    
+    def test_round_trip(self, tmpdir):
+        """Test writing and memory-mapping typed columns."""
+        time.sleep(0.2)
+        
+        dirpath = os.path.join(tmpdir, "data.cols")
+        columns = {
+            "id": np.arange(4),
+            "price": np.array([1.5, 2.0, np.nan, 4.25]),
+            "name": np.array(["a", "bb", "ccc", "d"]),
+            "category": pd.Categorical(["x", "y", "x", "x"])
+        }
+        
+        assert write_columnar_file(columns, dirpath) == 4
+        loaded = read_columnar_file(dirpath)
+        
+        assert isinstance(loaded["id"], np.memmap)
+        assert loaded["id"].tolist() == [0, 1, 2, 3]
+        assert np.isnan(loaded["price"][2])
+        assert loaded["name"].tolist() == ["a", "bb", "ccc", "d"]
+        assert list(loaded["category"].categories) == ["x", "y"]
+        assert loaded["category"].tolist() == ["x", "y", "x", "x"]
+        assert detect_format(dirpath + "/") == "columnar"
+    
+    def test_dataframe_and_column_selection(self, tmpdir):
+        """Test writing a DataFrame and loading a subset of columns."""
+        time.sleep(0.2)
+        
+        dirpath = os.path.join(tmpdir, "frame.cols")
+        write_columnar_file(pd.DataFrame({"id": [1, 2], "note": ["a", None]}), dirpath)
+        
+        loaded = read_columnar_file(dirpath, columns=["note"], mmap=False)
+        
+        assert list(loaded) == ["note"]
+        assert loaded["note"].tolist() == ["a", ""]
+        with pytest.raises(ValueError):
+            read_columnar_file(dirpath, columns=["missing"])
+    
+    def test_replaces_only_columnar_directories(self, tmpdir):
+        """Test that an existing store is replaced but other paths are left alone."""
+        time.sleep(0.2)
+        
+        dirpath = os.path.join(tmpdir, "data.cols")
+        write_columnar_file({"a": np.arange(3)}, dirpath)
+        write_columnar_file({"b": np.arange(2)}, dirpath)
+        assert list(read_columnar_file(dirpath)) == ["b"]
+        
+        victim = os.path.join(tmpdir, "victim")
+        os.makedirs(os.path.join(victim, "sub"))
+        with open(os.path.join(victim, "sub", "notes.txt"), 'w') as f:
+            f.write("keep")
+        with open(os.path.join(dirpath, "extra.txt"), 'w') as f:
+            f.write("keep")
+        
+        for target in (victim, dirpath):
+            with pytest.raises(FileExistsError):
+                write_columnar_file({"a": np.arange(3)}, target)
+        assert os.path.exists(os.path.join(victim, "sub", "notes.txt"))
+        assert os.path.exists(os.path.join(dirpath, "extra.txt"))
+        assert sorted(os.listdir(tmpdir)) == ["data.cols", "victim"]
+    
+    def test_mismatched_lengths(self, tmpdir):
+        """Test that columns of different lengths are rejected."""
+        time.sleep(0.2)
+        
+        dirpath = os.path.join(tmpdir, "bad.cols")
+        
+        with pytest.raises(ValueError):
+            write_columnar_file({"a": np.arange(3), "b": np.arange(2)}, dirpath)
+        assert os.listdir(tmpdir) == []
+
+
+class TestParsePredicate:
+    """Tests for the parse_predicate function."""
+    
+    def test_parse_string(self):
+        """Test parsing predicates from strings."""
+        time.sleep(0.2)
+        
+        column, compare, value = parse_predicate('category in ["a", "b"]')
+        
+        assert column == "category"
+        assert value == ["a", "b"]
+        assert compare("a", value)
+        assert parse_predicate("price <= 9.5")[2] == 9.5
+    
+    def test_parse_invalid(self):
+        """Test that malformed predicates raise."""
+        time.sleep(0.2)
+        
+        with pytest.raises(ValueError):
+            parse_predicate("price ~ 3")
+        with pytest.raises(ValueError):
+            parse_predicate(("price", "~", 3))
@@ -0,0 +1,75 @@
+"""Tests for model id generation."""
+import os
+import time
+import uuid
+import pytest
+
+from slow_tests_demo.models.ids import (
+    UUIDv7Generator, UUID4Generator, generate_id, generate_ids, set_id_generator,
+    get_id_generator, timestamp_from_id
+)
+from slow_tests_demo.models.user import User
+
+
+class TestIds:
+    """Tests for id generators."""
+
+    def test_uuid7_format_and_order(self):
+        """Test that ids are valid, unique UUIDv7 strings in increasing order."""
+        time.sleep(0.2)
+
+        generator = UUIDv7Generator(entropy_block_size=64)
+        ids = generator.generate_many(5000) + [generator.generate() for _ in range(100)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        parsed = uuid.UUID(ids[0])
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+        assert abs(timestamp_from_id(ids[-1]) - time.time()) < 5
+
+    def test_counter_overflow_advances_time(self):
+        """Test that more than 4096 ids in one millisecond stay ordered."""
+        time.sleep(0.2)
+
+        ids = UUIDv7Generator().generate_many(10000)
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 10000
+
+    def test_pluggable_generator(self):
+        """Test replacing the generator used by the models."""
+        time.sleep(0.2)
+
+        try:
+            set_id_generator(lambda: "fixed-id")
+            assert User("alice", "alice@example.com").id == "fixed-id"
+            assert generate_ids(2) == ["fixed-id", "fixed-id"]
+
+            set_id_generator(UUID4Generator())
+            assert uuid.UUID(generate_id()).version == 4
+            with pytest.raises(ValueError):
+                timestamp_from_id(generate_id())
+        finally:
+            set_id_generator(None)
+        assert isinstance(get_id_generator(), UUIDv7Generator)
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+    def test_fork_does_not_repeat_entropy(self):
+        """Test that a forked child does not reuse the parent's buffered entropy."""
+        time.sleep(0.2)
+
+        generator = UUIDv7Generator()
+        generator.generate()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, generator.generate().encode())
+            os._exit(0)
+        os.close(write_fd)
+        child_id = os.read(read_fd, 100).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_id[-16:] != generator.generate()[-16:]
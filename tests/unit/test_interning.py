@@ -0,0 +1,134 @@
+"""Tests for interning of repetitive model fields."""
+import json
+import time
+
+from slow_tests_demo.models.user import User
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.interning import (
+    StringInterner, get_interner, intern_object, interning_report, clear_interners
+)
+
+
+def _loaded(records):
+    """Round-trip through JSON so every string is a separate object."""
+    return json.loads(json.dumps(records))
+
+
+class TestStringInterner:
+    """Tests for StringInterner."""
+
+    def test_intern_shares_equal_strings(self):
+        """Test that equal strings map to one object and other values pass through."""
+        time.sleep(0.2)
+
+        interner = StringInterner()
+        first, second = _loaded(["Tools", "Tools"])
+
+        assert first is not second
+        assert interner.intern(first) is interner.intern(second) is first
+        assert interner.intern(None) is None
+        assert interner.intern(["a"]) == ["a"]
+        interned = interner.intern_many(_loaded(["Toys", None, "Tools", "Toys"]))
+        assert interned == ["Toys", None, "Tools", "Toys"]
+        assert interned[0] is interned[3]
+        assert interned[2] is first
+        assert len(interner) == 2
+
+    def test_max_size(self):
+        """Test that a full pool stops growing but still shares pooled values."""
+        time.sleep(0.2)
+
+        interner = StringInterner(max_size=1)
+        interner.intern("alpha")
+        values = _loaded(["alpha", "beta", "beta"])
+
+        interned = interner.intern_many(values)
+
+        assert len(interner) == 1
+        assert interned[1] is not interned[2]
+        assert interner.intern(values[0]) is interned[0]
+
+    def test_max_size_within_one_column(self):
+        """Test that a single bulk call does not grow the pool past max_size."""
+        time.sleep(0.2)
+
+        interner = StringInterner(max_size=10)
+        values = _loaded([f"value {i % 100}" for i in range(1000)])
+
+        interned = interner.intern_many(values)
+
+        assert len(interner) == 10
+        assert interned == values
+        assert interned[0] is interned[100]
+
+    def test_only_strings_are_pooled(self):
+        """Test that equal values of other types are passed through unchanged."""
+        time.sleep(0.2)
+
+        interner = StringInterner()
+        interned = interner.intern_many([True, 1, 1.0, "1"])
+
+        assert [type(value) for value in interned] == [bool, int, float, str]
+        assert len(interner) == 1
+
+    def test_unhashable_column(self):
+        """Test that a column with unhashable values is interned value by value."""
+        time.sleep(0.2)
+
+        interner = StringInterner()
+
+        assert interner.intern_many([["x"], "y"]) == [["x"], "y"]
+
+
+class TestModelInterning:
+    """Tests for interning in the model constructors."""
+
+    def test_loaders_share_values(self):
+        """Test that from_dict and the bulk constructors intern category and description."""
+        time.sleep(0.2)
+
+        records = _loaded([{"name": f"Item {i}", "price": 1.0, "category": "Tools",
+                            "description": "Standard"} for i in range(4)])
+
+        single = Product.from_dict(records[0])
+        bulk = Product.from_dicts(records[1:])
+
+        assert all(product.category is single.category for product in bulk)
+        assert all(product.description is single.description for product in bulk)
+        assert get_interner(Product, "category").intern("Tools") is single.category
+
+    def test_mixed_type_column(self):
+        """Test that a bulk load keeps 1 and True apart in an interned field."""
+        time.sleep(0.2)
+
+        products = Product.from_dicts([{"name": "Flag", "price": 1.0, "category": True},
+                                       {"name": "Count", "price": 1.0, "category": 1}])
+
+        assert [type(product.category) for product in products] == [bool, int]
+
+    def test_clear_interners(self):
+        """Test that the shared pools can be released."""
+        time.sleep(0.2)
+
+        Product.from_dicts(_loaded([{"name": "Item", "price": 1.0, "category": "Garden"}]))
+        assert len(get_interner(Product, "category")) > 0
+
+        clear_interners()
+
+        assert len(get_interner(Product, "category")) == 0
+
+    def test_report(self):
+        """Test the memory saving report."""
+        time.sleep(0.2)
+
+        records = _loaded([{"username": f"user{i}", "email": f"u{i}@example.com",
+                            "first_name": "Ann", "last_name": None} for i in range(10)])
+        users = User.from_dicts(records)
+        users.append(intern_object(User("solo", "solo@example.com", first_name="Ann")))
+
+        report = interning_report(users)["User.first_name"]
+
+        assert report["values"] == 11
+        assert report["distinct_objects"] == 1
+        assert report["bytes_saved"] == report["bytes_without_interning"] - report["bytes_used"]
+        assert report["bytes_saved"] > 0
@@ -0,0 +1,120 @@
+"""Tests for parallel CSV parsing."""
+import os
+import csv
+import time
+import pytest
+import numpy as np
+
+from slow_tests_demo.utils import parallel_csv
+from slow_tests_demo.utils.file_operations import read_csv_file
+from slow_tests_demo.utils.parallel_csv import (
+    read_csv_parallel, iter_csv_parallel_batches, find_row_boundaries
+)
+
+
+@pytest.fixture
+def quoted_csv_file(tmpdir):
+    """Fixture providing a CSV file with quoted newlines and quotes."""
+    filepath = os.path.join(tmpdir, "quoted.csv")
+    texts = ["plain", "multi\nline", 'say "hi"\nagain', "a,b"]
+    with open(filepath, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "text", "price"])
+        for i in range(2000):
+            writer.writerow([i, texts[i % len(texts)], i * 0.5])
+    return filepath
+
+
+class TestFindRowBoundaries:
+    """Tests for the find_row_boundaries function."""
+
+    def test_boundaries_are_row_starts(self, quoted_csv_file):
+        """Test that every range starts on a row, not inside a quoted field."""
+        time.sleep(0.2)
+
+        boundaries = find_row_boundaries(quoted_csv_file, 9)
+
+        assert boundaries[0] == 0
+        assert boundaries[-1] == os.path.getsize(quoted_csv_file)
+        with open(quoted_csv_file, 'rb') as f:
+            data = f.read()
+        for boundary in boundaries[1:-1]:
+            assert data[boundary - 1:boundary] == b"\n"
+            assert data[:boundary].count(b'"') % 2 == 0
+
+
+class TestReadCsvParallel:
+    """Tests for the parallel CSV readers."""
+
+    def test_rows_match_read_csv_file(self, quoted_csv_file):
+        """Test that rows come back complete and in order."""
+        time.sleep(0.2)
+
+        rows = read_csv_parallel(quoted_csv_file, workers=2, chunk_bytes=4096)
+
+        assert rows == read_csv_file(quoted_csv_file)
+
+    def test_batches_in_order(self, quoted_csv_file):
+        """Test streaming row batches."""
+        time.sleep(0.2)
+
+        batches = list(iter_csv_parallel_batches(quoted_csv_file, workers=1, chunk_bytes=4096))
+
+        assert len(batches) > 1
+        assert batches[0][0] == ["id", "text", "price"]
+        assert [row for batch in batches for row in batch] == read_csv_file(quoted_csv_file)
+
+    def test_columnar(self, quoted_csv_file):
+        """Test columnar output."""
+        time.sleep(0.2)
+
+        columns = read_csv_parallel(quoted_csv_file, workers=2, columnar=True,
+                                    categorical=True, chunk_bytes=4096)
+
+        assert np.array_equal(columns['id'], np.arange(2000))
+        assert columns['price'][3] == 1.5
+        assert columns['text'][1] == "multi\nline"
+        assert len(columns['text'].categories) == 4
+
+    def test_column_widened_in_one_range(self, tmpdir):
+        """Test that typed ranges keep their text when another range widens a column to text."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "widen.csv")
+        flags = ["yes", "no"] * 500 + ["maybe"]
+        amounts = ["1.50", "2"] * 500 + ["n/a"]
+        with open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "flag", "amount"])
+            for i, (flag, amount) in enumerate(zip(flags, amounts)):
+                writer.writerow([i, flag, amount])
+
+        for categorical in (False, True):
+            columns = read_csv_parallel(filepath, workers=2, columnar=True,
+                                        categorical=categorical, chunk_bytes=2048)
+
+            assert list(columns['flag']) == flags
+            assert list(columns['amount']) == amounts
+            assert np.array_equal(columns['id'], np.arange(len(flags)))
+
+    def test_types_inferred_from_prefix(self, quoted_csv_file, monkeypatch):
+        """Test that inferring types from a short prefix cut on a row boundary is enough."""
+        time.sleep(0.2)
+
+        monkeypatch.setattr(parallel_csv, "SAMPLE_BYTES", 40)
+
+        columns = read_csv_parallel(quoted_csv_file, workers=1, columnar=True)
+
+        assert np.array_equal(columns['id'], np.arange(2000))
+        assert columns['price'].dtype == np.float64
+        assert list(columns['text'][:4]) == ["plain", "multi\nline", 'say "hi"\nagain', "a,b"]
+
+    def test_empty_file(self, tmpdir):
+        """Test reading an empty file."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "empty.csv")
+        open(filepath, 'w').close()
+
+        assert read_csv_parallel(filepath) == []
+        assert read_csv_parallel(filepath, columnar=True) == {}
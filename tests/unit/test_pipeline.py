@@ -0,0 +1,104 @@
+"""Tests for chunk-streaming pipelines."""
+import os
+import time
+import json
+import pytest
+import pandas as pd
+
+from slow_tests_demo.utils.pipeline import run_pipeline, iter_dataframe_chunks
+
+
+def _write_csv(path, rows):
+    pd.DataFrame({'A': range(rows), 'B': [i * 10 for i in range(rows)]}).to_csv(path, index=False)
+
+
+class TestIterDataframeChunks:
+    """Tests for the iter_dataframe_chunks function."""
+
+    def test_csv_chunks(self, tmpdir):
+        """Test reading a CSV file in chunks."""
+        time.sleep(0.2)
+
+        path = os.path.join(tmpdir, "source.csv")
+        _write_csv(path, 25)
+
+        chunks = list(iter_dataframe_chunks(path, chunksize=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert list(chunks[2]['A']) == [20, 21, 22, 23, 24]
+
+    def test_json_chunks(self, temp_json_file):
+        """Test reading a JSON array in chunks."""
+        time.sleep(0.2)
+
+        chunks = list(iter_dataframe_chunks(temp_json_file, chunksize=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert chunks[1]['name'].iloc[0] == "Item 3"
+
+
+class TestRunPipeline:
+    """Tests for the run_pipeline function."""
+
+    def test_csv_to_csv(self, tmpdir):
+        """Test applying transformations chunk by chunk."""
+        time.sleep(0.2)
+
+        source = os.path.join(tmpdir, "source.csv")
+        target = os.path.join(tmpdir, "target.csv")
+        _write_csv(source, 95)
+
+        def double_a(df):
+            df['A'] = df['A'] * 2
+            return df
+
+        def drop_odd_b(df):
+            return df[df['B'] % 20 == 0]
+
+        stats = run_pipeline(source, target, [double_a, drop_odd_b], chunksize=10, max_in_flight=2)
+        result = pd.read_csv(target)
+
+        assert list(result['A']) == [i * 2 for i in range(0, 95, 2)]
+        assert stats.read.rows == 95
+        assert stats.read.chunks == 10
+        assert stats.write.rows == len(result)
+        assert set(stats.to_dict()) == {'read', 'transform', 'write', 'total_seconds'}
+
+    def test_csv_to_json(self, tmpdir):
+        """Test writing chunks incrementally to a JSON array."""
+        time.sleep(0.2)
+
+        source = os.path.join(tmpdir, "source.csv")
+        target = os.path.join(tmpdir, "target.json")
+        _write_csv(source, 7)
+
+        run_pipeline(source, target, chunksize=3)
+
+        with open(target) as f:
+            data = json.load(f)
+
+        assert len(data) == 7
+        assert data[6] == {'A': 6, 'B': 60}
+
+    def test_transformation_error(self, tmpdir):
+        """Test that errors in a transformation propagate."""
+        time.sleep(0.2)
+
+        source = os.path.join(tmpdir, "source.csv")
+        target = os.path.join(tmpdir, "target.csv")
+        _write_csv(source, 30)
+
+        def fail(df):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            run_pipeline(source, target, [fail], chunksize=5, max_in_flight=1)
+
+        assert not os.path.exists(target)
+
+    def test_invalid_max_in_flight(self, temp_csv_file, tmpdir):
+        """Test that max_in_flight must be positive."""
+        time.sleep(0.2)
+
+        with pytest.raises(ValueError):
+            run_pipeline(temp_csv_file, os.path.join(tmpdir, "out.csv"), max_in_flight=0)
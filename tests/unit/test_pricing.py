@@ -0,0 +1,83 @@
+"""Tests for the pricing rule engine."""
+import time
+import numpy as np
+import pandas as pd
+import pytest
+
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.tables import ProductTable
+from slow_tests_demo.models.pricing import PricingRule, PricingEngine
+
+
+def _engine():
+    return PricingEngine([
+        PricingRule("clearance", "cap", 5.0, categories=["Clearance"]),
+        {"name": "premium", "kind": "percentage", "amount": 10, "min_price": 100},
+        PricingRule("tools", "fixed", 3.0, categories=["Tools", "Hardware"], max_price=100),
+        PricingRule("flash", "percentage", 50, starts_at=1000, ends_at=2000)
+    ])
+
+
+class TestPricingEngine:
+    """Tests for PricingEngine."""
+
+    def test_first_matching_rule_wins(self):
+        """Test prices and fired rules across categories, bands and windows."""
+        time.sleep(0.2)
+
+        table = ProductTable(
+            names=["a", "b", "c", "d", "e", "f"],
+            prices=[20.0, 200.0, 10.0, 2.0, 50.0, np.nan],
+            categories=["Clearance", "Clearance", "Tools", "Hardware", "Toys", "Tools"]
+        )
+
+        result = _engine().price(table, now=500)
+
+        np.testing.assert_allclose(result.prices, [5.0, 5.0, 7.0, 0.0, 50.0, np.nan])
+        assert list(result.fired()) == ["clearance", "clearance", "tools", "tools", None, None]
+        assert result.fired_rule(4) is None
+        assert result.counts() == {"clearance": 2, "premium": 0, "tools": 2, "flash": 0, None: 2}
+
+    def test_time_window(self):
+        """Test that windowed rules only fire while active."""
+        time.sleep(0.2)
+
+        engine = _engine()
+        products = [Product("Toy", 50.0, category="Toys"), Product("Gem", 150.0)]
+
+        active = engine.price(products, now=1500)
+        expired = engine.price(products, now=2000)
+
+        assert list(active.prices) == [25.0, 135.0]
+        assert list(active.fired()) == ["flash", "premium"]
+        assert list(expired.prices) == [50.0, 135.0]
+
+    def test_matches_apply_discount(self, sample_product):
+        """Test that percentage rules agree with Product.apply_discount."""
+        time.sleep(0.2)
+
+        engine = PricingEngine([PricingRule("sale", "percentage", 20)])
+
+        result = engine.price_arrays([sample_product.price])
+
+        assert result.prices[0] == sample_product.apply_discount(20)
+
+    def test_inputs_and_validation(self):
+        """Test DataFrame and dict input and invalid rules."""
+        time.sleep(0.2)
+
+        engine = _engine()
+        df = pd.DataFrame({"price": [20.0, 8.0], "category": ["Clearance", None]})
+
+        assert list(engine.price(df, now=0).prices) == [5.0, 8.0]
+        assert list(engine.price({"price": [150.0]}, now=0).fired()) == ["premium"]
+        rule = PricingRule("sale", "percentage", 20, categories=["Tools"])
+        assert PricingRule.from_dict(rule.to_dict()).to_dict() == rule.to_dict()
+        with pytest.raises(ValueError):
+            PricingRule("bad", "percentage", 120)
+        with pytest.raises(ValueError):
+            PricingRule("bad", "bogo", 1)
+        with pytest.raises(ValueError):
+            PricingEngine([rule, rule])
+        with pytest.raises(ValueError):
+            engine.price_arrays([1.0, 2.0], ["Tools"])
@@ -2,6 +2,8 @@
 import time
 import random
 import pytest
+import numpy as np
+import pandas as pd
 
 from slow_tests_demo.models.product import Product
 
@@ -170,3 +172,63 @@ class TestProductModel:
         
         assert discounted_price == 79.992  # 99.99 * 0.8
         assert end_time - start_time >= 0.1  # Should have at least the minimum delay
+    
+    def test_slotted_layout(self, sample_product):
+        """Test that instances have no per-instance __dict__."""
+        time.sleep(0.2)
+        
+        assert not hasattr(sample_product, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_product.nickname = "unknown"
+    
+    def test_from_dicts(self):
+        """Test bulk construction keeps stored ids and fills in missing ones."""
+        time.sleep(0.2)
+        
+        records = [
+            {"name": "Stored", "price": 1.5, "id": "id-1", "created_at": 10.0},
+            {"name": "Fresh", "price": 2, "category": "Tools"}
+        ]
+        
+        products = Product.from_dicts(records)
+        
+        assert [product.price for product in products] == [1.5, 2]
+        assert products[0].id == "id-1"
+        assert products[0].created_at == 10.0
+        assert products[1].id is not None
+        assert products[1].category == "Tools"
+        assert products[1].description is None
+    
+    def test_single_and_bulk_loaders_agree(self):
+        """Test that None ids and timestamps are filled in by every loader."""
+        time.sleep(0.2)
+        
+        records = [{"name": "Kept", "price": 1.0, "id": "id-1", "created_at": 10.0},
+                   {"name": "Filled", "price": 2.0, "id": None, "created_at": None},
+                   {"name": "Missing", "price": 3.0}]
+        
+        single = [Product.from_dict(record) for record in records]
+        bulk = Product.from_dicts(records)
+        
+        for products in (single, bulk):
+            assert (products[0].id, products[0].created_at) == ("id-1", 10.0)
+            assert all(product.id is not None for product in products)
+            assert all(product.created_at is not None for product in products)
+    
+    def test_from_dataframe(self):
+        """Test bulk construction from a DataFrame with numpy dtypes and missing values."""
+        time.sleep(0.2)
+        
+        df = pd.DataFrame({
+            "name": ["Widget", "Gadget"],
+            "price": np.array([9.5, np.nan]),
+            "category": pd.Categorical(["Tools", None])
+        })
+        
+        products = Product.from_dataframe(df)
+        
+        assert products[0].price == 9.5
+        assert type(products[0].price) is float
+        assert products[1].price is None
+        assert [product.category for product in products] == ["Tools", None]
+        assert products[0].id != products[1].id
@@ -0,0 +1,111 @@
+"""Tests for row-offset indexes."""
+import os
+import time
+import json
+import pytest
+
+from slow_tests_demo.utils.row_index import (
+    build_row_index, get_row_index, read_rows, take_rows, index_path, RowIndex
+)
+from slow_tests_demo.utils.file_operations import read_csv_file, write_csv_file
+
+
+@pytest.fixture
+def large_csv_file(tmpdir):
+    """Create a CSV file with a quoted multi-line value every tenth row."""
+    filepath = os.path.join(tmpdir, "large.csv")
+    rows = [["id", "note"]]
+    rows.extend([str(i), f"line one\nline {i}" if i % 10 == 0 else f"note {i}"] for i in range(250))
+    write_csv_file(rows, filepath)
+    return filepath
+
+
+class TestRowIndex:
+    """Tests for building and using row indexes."""
+
+    def test_build_and_save(self, large_csv_file):
+        """Test that quoted newlines do not split rows."""
+        time.sleep(0.2)
+
+        index = build_row_index(large_csv_file, every=16)
+
+        assert index.rows == 251
+        assert len(index.offsets) == 16
+        saved = RowIndex.load(index_path(large_csv_file))
+        assert saved.offsets.tolist() == index.offsets.tolist()
+
+    def test_read_rows_matches_full_read(self, large_csv_file):
+        """Test reading a range agrees with parsing the whole file."""
+        time.sleep(0.2)
+
+        expected = read_csv_file(large_csv_file)[1:]
+
+        assert read_rows(large_csv_file, 95, 123, every=16) == expected[95:123]
+        assert read_rows(large_csv_file, 0, every=16) == expected[:1]
+        assert read_rows(large_csv_file, 240, 400, every=16) == expected[240:]
+
+    def test_take_rows(self, large_csv_file):
+        """Test fetching scattered rows by position."""
+        time.sleep(0.2)
+
+        expected = read_csv_file(large_csv_file)[1:]
+        positions = [200, 3, 17, 18, 3, 999]
+
+        assert take_rows(large_csv_file, positions, every=16) == [expected[p] for p in positions[:5]]
+
+    def test_append_extends_index(self, large_csv_file):
+        """Test that appended rows are indexed incrementally."""
+        time.sleep(0.2)
+
+        build_row_index(large_csv_file, every=16)
+        with open(large_csv_file, 'a', newline='') as f:
+            f.write("250,appended\r\n251,partial")
+
+        assert get_row_index(large_csv_file, every=16).rows == 252
+        assert read_rows(large_csv_file, 250, 252, every=16) == [["250", "appended"], ["251", "partial"]]
+
+        with open(large_csv_file, 'a', newline='') as f:
+            f.write(" row\r\n")
+        assert get_row_index(large_csv_file, every=16).rows == 253
+
+    def test_rewrite_rebuilds_index(self, large_csv_file):
+        """Test that a rewritten file invalidates its index."""
+        time.sleep(0.2)
+
+        build_row_index(large_csv_file, every=16)
+        write_csv_file([["id"], ["a"], ["b"]], large_csv_file)
+
+        assert get_row_index(large_csv_file, every=16).rows == 3
+        assert read_rows(large_csv_file, 1) == [["b"]]
+
+    def test_ndjson_skips_blank_lines(self, tmpdir):
+        """Test NDJSON positions count records, not blank lines."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "records.ndjson")
+        with open(filepath, 'w') as f:
+            for i in range(30):
+                f.write(json.dumps({"id": i, "text": 'say "hi"'}) + ("\n\n" if i % 4 == 0 else "\n"))
+
+        assert get_row_index(filepath, every=8).rows == 30
+        assert [r["id"] for r in read_rows(filepath, 7, 10, every=8)] == [7, 8, 9]
+
+    def test_ndjson_skips_whitespace_only_lines(self, tmpdir):
+        """Test that whitespace-only NDJSON lines are blank, as for the reader."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "records.ndjson")
+        with open(filepath, 'w') as f:
+            f.write('{"id": 0}\n  \n{"id": 1}\n\t\r\n{"id": 2}\n')
+
+        assert get_row_index(filepath, every=1).rows == 3
+        assert [r["id"] for r in take_rows(filepath, [1, 2], every=1)] == [1, 2]
+
+    def test_unsupported_files(self, temp_json_file):
+        """Test that JSON arrays and compressed files are rejected."""
+        time.sleep(0.2)
+
+        with pytest.raises(ValueError):
+            build_row_index(temp_json_file)
+        with pytest.raises(ValueError):
+            read_rows(temp_json_file + ".gz", 0)
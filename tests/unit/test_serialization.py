@@ -0,0 +1,173 @@
+"""Tests for JSON serialization backends."""
+import os
+import sys
+import json
+import math
+import time
+import uuid
+import pytest
+import datetime
+import decimal
+import subprocess
+import numpy as np
+
+from slow_tests_demo.utils import serialization
+from slow_tests_demo.utils.file_operations import (
+    write_json_file, read_json_file, write_json_array, iter_json_array, write_ndjson_file,
+    read_ndjson_file
+)
+from slow_tests_demo.api.app import app
+
+
+@pytest.fixture(params=serialization.available_backends())
+def backend(request):
+    """Fixture providing each installed backend name."""
+    return request.param
+
+
+class TestSerialization:
+    """Tests for the serialization module."""
+
+    def test_compact_and_indented(self, backend):
+        """Test both layouts match the standard library."""
+        time.sleep(0.2)
+
+        data = [{"id": 1, "tags": ["a", "b"], "nested": {"x": None}}, {"id": 2, "tags": []}]
+
+        assert serialization.dumps(data, backend=backend) == json.dumps(data, separators=(',', ':'))
+        assert serialization.dumps(data, indent=2, backend=backend) == json.dumps(data, indent=2)
+        assert serialization.loads(serialization.dumps(data, backend=backend), backend=backend) == data
+
+    def test_numpy_values(self, backend):
+        """Test numpy scalars and arrays are encoded."""
+        time.sleep(0.2)
+
+        data = {"count": np.int64(3), "mean": np.float64(1.5), "flag": np.bool_(True),
+                "values": np.arange(3)}
+
+        assert json.loads(serialization.dumps(data, backend=backend)) == {
+            "count": 3, "mean": 1.5, "flag": True, "values": [0, 1, 2]
+        }
+
+    def test_sort_keys_and_large_ints(self, backend):
+        """Test sorted keys and integers wider than 64 bits."""
+        time.sleep(0.2)
+
+        assert serialization.dumps({"b": 1, "a": 2}, sort_keys=True, backend=backend) == '{"a":2,"b":1}'
+        assert serialization.loads(serialization.dumps([2 ** 70], backend=backend)) == [2 ** 70]
+
+    def test_non_finite_floats(self, backend):
+        """Test NaN and infinity are written as the standard library writes them."""
+        time.sleep(0.2)
+
+        data = [{"price": float("nan")}, {"price": None, "limits": [1.5, float("inf")]},
+                {"values": np.array([1.0, -np.inf])}]
+
+        assert serialization.dumps(data, backend=backend) == json.dumps(
+            [data[0], data[1], {"values": [1.0, float("-inf")]}], separators=(',', ':'))
+        assert serialization.dumps([None, 1.5], backend=backend) == '[null,1.5]'
+
+    def test_default_hook(self, backend):
+        """Test objects no backend encodes are passed to the default hook."""
+        time.sleep(0.2)
+
+        data = {"amount": decimal.Decimal("1.10"), "count": np.int64(2)}
+
+        assert json.loads(serialization.dumps(data, backend=backend, default=str)) == {
+            "amount": "1.10", "count": 2
+        }
+        with pytest.raises(TypeError):
+            serialization.dumps(data, backend=backend)
+
+    def test_flask_provider_default(self, backend):
+        """Test the Flask provider keeps Flask's encoding of dates, decimals and UUIDs."""
+        time.sleep(0.2)
+
+        data = {"day": datetime.date(2024, 1, 2), "amount": decimal.Decimal("1.10"),
+                "id": uuid.UUID(int=1)}
+
+        try:
+            serialization.set_default_backend(backend)
+            with app.app_context():
+                assert json.loads(app.json.dumps(data)) == {
+                    "day": "Tue, 02 Jan 2024 00:00:00 GMT", "amount": "1.10",
+                    "id": "00000000-0000-0000-0000-000000000001"
+                }
+        finally:
+            serialization.set_default_backend(None)
+
+    def test_backends_agree(self, backend):
+        """Test non-ASCII text, NaN and large floats decode the same from every backend."""
+        time.sleep(0.2)
+
+        data = [{"name": "café ☕", "price": float("nan"), "big": 1e16, "tiny": 1e-300,
+                 "limit": float("-inf")}]
+        reference = serialization.dumps(data, backend='json')
+
+        encoded = serialization.dumps(data, backend=backend)
+
+        assert "café ☕" in encoded
+        assert "NaN" in encoded and "-Infinity" in encoded
+        assert repr(json.loads(encoded)) == repr(json.loads(reference))
+
+    def test_files_are_utf8(self, backend, tmpdir):
+        """Test every JSON writer stores UTF-8 text that reads back unchanged."""
+        time.sleep(0.2)
+
+        data = [{"name": "café ☕", "price": float("nan"), "big": 1e16}]
+        try:
+            serialization.set_default_backend(backend)
+            for name, write, read in (
+                ("data.json", write_json_file, read_json_file),
+                ("array.json", write_json_array, lambda path: list(iter_json_array(path))),
+                ("data.ndjson", write_ndjson_file, read_ndjson_file)
+            ):
+                filepath = os.path.join(tmpdir, name)
+                write(data, filepath)
+                with open(filepath, 'rb') as f:
+                    assert "café ☕".encode('utf-8') in f.read()
+                loaded = read(filepath)
+                assert loaded[0]["name"] == "café ☕" and loaded[0]["big"] == 1e16
+                assert math.isnan(loaded[0]["price"])
+        finally:
+            serialization.set_default_backend(None)
+
+    def test_files_under_ascii_locale(self, tmpdir):
+        """Test writing non-ASCII JSON when the locale encoding is ASCII."""
+        time.sleep(0.2)
+
+        filepath = os.path.join(tmpdir, "data.json")
+        script = (
+            "from slow_tests_demo.utils.file_operations import write_json_file, read_json_file\n"
+            f"write_json_file([{{'name': 'caf\\u00e9'}}], {filepath!r})\n"
+            f"assert read_json_file({filepath!r}) == [{{'name': 'caf\\u00e9'}}]\n"
+        )
+        env = dict(os.environ, LC_ALL="C", PYTHONUTF8="0", PYTHONCOERCECLOCALE="0")
+        subprocess.run([sys.executable, "-c", script], check=True, env=env)
+
+        with open(filepath, encoding='utf-8') as f:
+            assert json.load(f) == [{"name": "café"}]
+
+    def test_backend_is_abstract(self):
+        """Test a backend must implement dumps and loads."""
+        time.sleep(0.2)
+
+        class Incomplete(serialization.JsonBackend):
+            def loads(self, text):
+                return None
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_default_backend(self):
+        """Test selecting and resetting the default backend."""
+        time.sleep(0.2)
+
+        try:
+            serialization.set_default_backend('json')
+            assert serialization.get_backend().name == 'json'
+        finally:
+            serialization.set_default_backend(None)
+        assert serialization.get_backend().name == serialization.available_backends()[0]
+        with pytest.raises(ValueError):
+            serialization.set_default_backend('yaml')
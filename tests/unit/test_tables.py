@@ -0,0 +1,131 @@
+"""Tests for column-oriented model tables."""
+import time
+import pytest
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.models.tables import ProductTable, UserTable
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.user import User
+
+
+@pytest.fixture
+def product_table():
+    """Fixture providing a small product table."""
+    return ProductTable(
+        names=["Book", "Game", "Lamp", "Pen"],
+        prices=[10.0, 60.0, 25.0, 2.5],
+        categories=["books", "games", None, "books"]
+    )
+
+
+class TestProductTable:
+    """Tests for ProductTable."""
+
+    def test_columns(self, product_table):
+        """Test column storage types."""
+        time.sleep(0.2)
+
+        assert len(product_table) == 4
+        assert product_table["price"].dtype == np.float64
+        assert isinstance(product_table["category"], pd.Categorical)
+        assert len(set(product_table["id"])) == 4
+
+    def test_apply_discount(self, product_table):
+        """Test vectorized discounts match the model."""
+        time.sleep(0.2)
+
+        discounted = product_table.apply_discount(20)
+        expected = [product.apply_discount(20) for product in product_table.to_objects()]
+
+        assert discounted.tolist() == pytest.approx(expected)
+        assert product_table.apply_discount([0, 50, 100, 10]).tolist() == [10.0, 30.0, 0.0, 2.25]
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            product_table.apply_discount(120)
+
+    def test_validate(self, product_table):
+        """Test vectorized validation."""
+        time.sleep(0.2)
+
+        assert product_table.validate() is True
+        invalid = ProductTable(names=["Ok", "X"], prices=[1.0, 2.0])
+        with pytest.raises(ValueError, match="at least 2 characters"):
+            invalid.validate()
+        with pytest.raises(ValueError, match="non-negative"):
+            ProductTable(names=["Ok", "Fine"], prices=[1.0, -2.0]).validate()
+
+    def test_filter_and_aggregate(self, product_table):
+        """Test filtering rows and aggregating prices by category."""
+        time.sleep(0.2)
+
+        cheap = product_table[product_table["price"] < 20]
+
+        assert cheap["name"].tolist() == ["Book", "Pen"]
+        assert product_table.aggregate_prices() == {"books": 12.5, "games": 60.0, None: 25.0}
+        assert product_table.aggregate_prices("count")["books"] == 2
+
+    def test_round_trips(self, product_table):
+        """Test conversion to and from objects, dicts and DataFrames."""
+        time.sleep(0.2)
+
+        products = product_table.to_objects()
+        assert isinstance(products[0], Product)
+        assert products[2].category is None
+        assert ProductTable.from_objects(products).to_dicts() == product_table.to_dicts()
+
+        df = product_table.to_dataframe()
+        assert ProductTable.from_dataframe(df).to_dicts() == product_table.to_dicts()
+
+        records = [product.to_dict() for product in products]
+        assert ProductTable.from_dicts(records).to_dicts() == records
+        assert product_table[1].to_dict() == records[1]
+
+    def test_from_dataframe_missing_values(self):
+        """Test that missing strings become None, as with Product.from_dataframe."""
+        time.sleep(0.2)
+
+        df = pd.DataFrame({"id": ["a", "b"], "name": ["Book", None], "price": [1.0, 2.0],
+                           "description": [np.nan, "Thick"], "category": ["books", None],
+                           "created_at": [1.0, 2.0]})
+
+        dicts = ProductTable.from_dataframe(df).to_dicts()
+
+        assert dicts == [product.to_dict() for product in Product.from_dataframe(df)]
+        assert dicts[1]["name"] is None and dicts[0]["description"] is None
+        assert df["name"].isna().tolist() == [False, True]
+
+    def test_filter_does_not_intern_again(self, product_table, monkeypatch):
+        """Test that selecting rows reuses the interned values without a new pass."""
+        time.sleep(0.2)
+
+        calls = []
+        monkeypatch.setattr("slow_tests_demo.models.interning.StringInterner.intern_many",
+                            lambda interner, values: calls.append(values) or list(values))
+
+        product_table.filter(product_table["price"] < 20)
+        product_table[:2]
+        assert calls == []
+
+        ProductTable.from_dicts(product_table.to_dicts())
+        assert calls
+
+
+class TestUserTable:
+    """Tests for UserTable."""
+
+    def test_validate_and_convert(self):
+        """Test validation and conversion of users."""
+        time.sleep(0.2)
+
+        table = UserTable.from_dicts([
+            {"username": "alice", "email": "alice@example.com"},
+            {"username": "bob", "email": "bob@example.com", "first_name": "Bob"}
+        ])
+
+        assert table.validate() is True
+        users = table.to_objects()
+        assert isinstance(users[1], User)
+        assert users[1].first_name == "Bob"
+        assert users[0].id != users[1].id
+        with pytest.raises(ValueError, match="Invalid email"):
+            UserTable(usernames=["carol"], emails=[None]).validate()
@@ -2,6 +2,7 @@
 import time
 import random
 import pytest
+import pandas as pd
 
 from slow_tests_demo.models.user import User
 
@@ -142,3 +143,64 @@ class TestUserModel:
         
         assert result is True
         assert end_time - start_time >= 0.2  # Should have at least the minimum delay
+    
+    def test_slotted_layout(self, sample_user):
+        """Test that instances have no per-instance __dict__."""
+        time.sleep(0.2)
+        
+        assert not hasattr(sample_user, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_user.nickname = "unknown"
+    
+    def test_from_dicts(self):
+        """Test bulk construction keeps stored ids and fills in missing ones."""
+        time.sleep(0.2)
+        
+        records = [
+            {"username": "stored", "email": "s@example.com", "id": "id-1", "created_at": 10.0},
+            {"username": "fresh", "email": "f@example.com", "first_name": "Fresh"}
+        ]
+        
+        users = User.from_dicts(records)
+        
+        assert [user.username for user in users] == ["stored", "fresh"]
+        assert users[0].id == "id-1"
+        assert users[0].created_at == 10.0
+        assert users[1].id is not None
+        assert users[1].created_at > 10.0
+        assert users[1].first_name == "Fresh"
+        assert users[1].last_name is None
+        with pytest.raises(KeyError):
+            User.from_dicts([{"username": "nomail"}])
+    
+    def test_single_and_bulk_loaders_agree(self):
+        """Test that None ids and timestamps are filled in by every loader."""
+        time.sleep(0.2)
+        
+        records = [{"username": "kept", "email": "k@example.com", "id": "id-1", "created_at": 10.0},
+                   {"username": "filled", "email": "f@example.com", "id": None, "created_at": None}]
+        
+        for users in ([User.from_dict(record) for record in records], User.from_dicts(records)):
+            assert (users[0].id, users[0].created_at) == ("id-1", 10.0)
+            assert users[1].id is not None and users[1].created_at is not None
+    
+    def test_from_columns_and_dataframe(self):
+        """Test bulk construction from columns and from a DataFrame."""
+        time.sleep(0.2)
+        
+        columns = {
+            "username": ["alice", "bob"],
+            "email": ["a@example.com", "b@example.com"],
+            "last_name": ["Smith", None],
+            "id": ["id-a", "id-b"]
+        }
+        
+        from_columns = User.from_columns(columns)
+        from_frame = User.from_dataframe(pd.DataFrame(columns))
+        
+        for users in (from_columns, from_frame):
+            assert [user.id for user in users] == ["id-a", "id-b"]
+            assert [user.last_name for user in users] == ["Smith", None]
+            assert users[0].first_name is None
+        with pytest.raises(ValueError):
+            User.from_columns({"username": ["alice"], "email": []})
@@ -0,0 +1,82 @@
+"""Tests for batch model validation."""
+import time
+import numpy as np
+import pandas as pd
+
+from slow_tests_demo.models.user import User
+from slow_tests_demo.models.product import Product
+from slow_tests_demo.models.tables import ProductTable
+from slow_tests_demo.models.validation import (
+    validate_users, validate_products, USERNAME_MESSAGE, EMAIL_MESSAGE, PRODUCT_PRICE_MESSAGE
+)
+
+
+class TestBatchValidation:
+    """Tests for validate_users and validate_products."""
+
+    def test_users_from_objects_and_dicts(self):
+        """Test that objects and dicts give the same per-record errors."""
+        time.sleep(0.2)
+
+        users = [User("alice", "alice@example.com"), User("bo", "bo@example.com"),
+                 User("carol", "carol.example.com"), User("", None)]
+        result = validate_users(users)
+
+        assert result.invalid.tolist() == [False, True, True, True]
+        assert result.reasons(1) == [USERNAME_MESSAGE]
+        assert result.reasons(3) == [USERNAME_MESSAGE, EMAIL_MESSAGE]
+        assert list(result.iter_errors())[0] == (1, [USERNAME_MESSAGE])
+        assert result.summary() == {USERNAME_MESSAGE: 2, EMAIL_MESSAGE: 2}
+        dict_result = validate_users([user.to_dict() for user in users])
+        assert dict_result.invalid.tolist() == result.invalid.tolist()
+
+    def test_products_match_per_object_validate(self):
+        """Test agreement with Product.validate on mixed input."""
+        time.sleep(0.2)
+
+        products = [Product("Book", 10.0), Product("X", 5.0), Product("Lamp", -1.0),
+                    Product("Pen", None), Product("Cup", 0)]
+        result = validate_products(products)
+
+        for product, invalid in zip(products, result.invalid):
+            try:
+                product.validate()
+                assert not invalid
+            except ValueError:
+                assert invalid
+
+    def test_columns_frames_and_tables(self):
+        """Test columns, DataFrames and tables as input."""
+        time.sleep(0.2)
+
+        columns = {"name": ["Book", "Game"], "price": np.array([1.0, -3.0])}
+        expected = [False, True]
+
+        assert validate_products(columns).invalid.tolist() == expected
+        assert validate_products(pd.DataFrame(columns)).invalid.tolist() == expected
+        assert validate_products(ProductTable(columns["name"], columns["price"])).reasons(1) == [
+            PRODUCT_PRICE_MESSAGE
+        ]
+        assert validate_products({"name": ["Book"], "price": ["free"]}).invalid.tolist() == [True]
+
+    def test_numeric_strings_are_invalid_prices(self):
+        """Test that only numbers are accepted as prices, not strings or booleans."""
+        time.sleep(0.2)
+
+        records = [{"name": "Book", "price": "5"}, {"name": "Game", "price": 5},
+                   {"name": "Lamp", "price": True}, {"name": "Pen", "price": np.float32(2.5)},
+                   {"name": "Cup", "price": None}]
+
+        assert validate_products(records).invalid.tolist() == [True, False, True, False, True]
+        assert validate_products(pd.DataFrame(records)).invalid.tolist() == [
+            True, False, True, False, True
+        ]
+
+    def test_all_valid(self):
+        """Test the empty and all-valid cases."""
+        time.sleep(0.2)
+
+        assert validate_users([]).all_valid
+        result = validate_products([{"name": "Book", "price": 1}])
+        assert result.all_valid
+        assert result.valid.tolist() == [True]